@@ -0,0 +1,47 @@
+import sys
+sys.path.append('../../')
+from genopt.environment import Environment #pip install genopt
+from genopt.parameters import Parameters
+
+#defining a 4 variable search space of float values from -100.0 to 100.0
+params = {
+    'x': Parameters.suggest_float(-100, 100),
+    'y': Parameters.suggest_float(-100, 100),
+    'z': Parameters.suggest_float(-100, 100),
+    'k': Parameters.suggest_float(-100, 100)
+}
+
+#defining a batch objective function. individuals contains one numpy array per
+#param with the values of the whole generation, so the equation is solved in one pass
+def objective(individuals):
+    x = individuals['x']
+    y = individuals['y']
+    z = individuals['z']
+    k = individuals['k']
+
+    return (x**2 - 4*y**3 / z**4) * k**3
+
+if __name__ == '__main__':
+    #defining our Environment instance with a population of 1000 individuals
+    #stored as numpy arrays, one-point crossover and a single gene mutation
+    #with a 25% probability of mutation
+    environment = Environment(
+        params=params,
+        num_population=1000,
+        crossover_type='one-point',
+        mutation_type='single-gene',
+        prob_mutation=0.25,
+        engine='vectorized',
+        verbose=1
+    )
+    #minimizing the objective function evaluating each generation in a single call
+    results = environment.optimize(objective=objective, direction='minimize', timeout=20, batch=True)
+
+    print()
+    print(f'EXECUTION TIME={results.execution_time}')
+    print(f'BEST SCORE={results.best_score}')
+    print(f'BEST INDIVIDUAL={results.best_individual}')
+    print('BEST INDIVIDUALS PER GENERATION:')
+    print(results.best_per_generation_dataframe)
+    print('LAST GENERATION INDIVIDUALS:')
+    print(results.last_generation_individuals_dataframe)
@@ -3,6 +3,7 @@ from sklearn.metrics import accuracy_score
 from sklearn.tree import DecisionTreeClassifier
 
 from genopt.environment import Environment #pip install genopt
+from genopt.parameters import Parameters
 
 (X_train, y_train), (X_test, y_test) = mnist.load_data()
 
@@ -12,7 +13,7 @@ num_columns = X_train.shape[1]
 
 params = dict()
 for i in range(num_columns):
-    params[i] = [0, 1]
+    params[i] = Parameters.suggest_binary()
 
 def objective(individual):
     (X_train, y_train), (X_test, y_test) = mnist.load_data()
@@ -33,6 +34,7 @@ if __name__ == '__main__':
     environment = Environment(
         params=params,
         num_population=100,
+        engine='vectorized',
         generations=25,
         crossover_type='three-point',
         mutation_type='single-gene',
@@ -27,14 +27,20 @@ params = {
     'objective': Parameters.suggest_categorical(['regression', 'regression_l1'])
 }
 
-#defining an objective function
-def objective(individual):
+#loading the dataset once per worker instead of once per evaluation
+def worker_setup():
     df = pd.read_csv('../datasets/california_housing.csv')
     df = pd.get_dummies(df, drop_first=True, dummy_na=True)
     df.dropna(how='any', axis=0, inplace=True)
     
     X = df.drop('median_house_value', axis=1)
     y = df['median_house_value']
+
+    return X, y
+
+#defining an objective function that receives the dataset loaded by worker_setup as context
+def objective(individual, context):
+    X, y = context
     
     num_leaves = individual['num_leaves']
     max_depth = individual['max_depth']
@@ -80,7 +86,7 @@ if __name__ == '__main__':
     )
 
     #minimizing the objective function using all the available cores
-    results = environment.optimize(objective=objective, direction='minimize', n_jobs=-1)
+    results = environment.optimize(objective=objective, direction='minimize', n_jobs=-1, worker_setup=worker_setup)
 
     print()
     print(f'EXECUTION TIME={results.execution_time}')
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from typing import Hashable, Tuple, Union
+
+class FitnessCache:
+    def __init__(self, max_size: Union[int, None] = 10000):
+        if max_size != None and max_size < 0:
+            raise Exception(f'Cache max_size must be None or a non negative integer.')
+        self.max_size = max_size
+        self._fitnesses = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fitnesses)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._fitnesses
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.max_size != 0
+
+    def get(self, key: Hashable) -> Union[int, float, Tuple[Union[int, float]], None]:
+        if key in self._fitnesses:
+            self._fitnesses.move_to_end(key)
+            self._hits += 1
+            return self._fitnesses[key]
+        else:
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, fitness: Union[int, float, Tuple[Union[int, float]]]) -> None:
+        if self.is_enabled:
+            self._fitnesses[key] = fitness
+            self._fitnesses.move_to_end(key)
+            if self.max_size != None:
+                while len(self._fitnesses) > self.max_size:
+                    self._fitnesses.popitem(last=False)
+
+    def clear(self) -> None:
+        self._fitnesses.clear()
+        self._hits = 0
+        self._misses = 0
@@ -0,0 +1,31 @@
+import os
+import zlib
+import pickle
+
+CHECKPOINT_HEADER = b'GENOPT'
+CHECKPOINT_FORMAT_VERSION = 1
+
+class Checkpoint:
+
+    @staticmethod
+    def save(path: str, state: dict) -> None:
+        data = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        temporary_path = f'{path}.tmp'
+        with open(temporary_path, 'wb') as f:
+            f.write(CHECKPOINT_HEADER)
+            f.write(CHECKPOINT_FORMAT_VERSION.to_bytes(2, 'little'))
+            f.write(data)
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def load(path: str) -> dict:
+        with open(path, 'rb') as f:
+            header = f.read(len(CHECKPOINT_HEADER))
+            version = int.from_bytes(f.read(2), 'little')
+            data = f.read()
+        if header != CHECKPOINT_HEADER:
+            raise Exception(f'File {path} is not a genopt checkpoint.')
+        elif version != CHECKPOINT_FORMAT_VERSION:
+            raise Exception(f'Checkpoint format version {version} not supported.')
+
+        return pickle.loads(zlib.decompress(data))
@@ -1,15 +1,15 @@
 import numpy as np
 
-from copy import copy
 from typing import Tuple
 from genopt.individual import Individual
+from genopt.population import Population
 
 class Crossover:
     __instance = None
 
     @staticmethod
     def getInstance(crossover_type: str):
-        if Crossover.__instance == None:
+        if Crossover.__instance == None or Crossover.__instance.crossover_type != crossover_type:
             Crossover(crossover_type)
         return Crossover.__instance 
 
@@ -23,10 +23,8 @@ class Crossover:
         child_1_genome = parent_1.genome[:point] + parent_2.genome[point:]
         child_2_genome = parent_2.genome[:point] + parent_1.genome[point:]
         
-        child_1 = copy(parent_1)
-        child_2 = copy(parent_2)
-        child_1.genome = child_1_genome
-        child_2.genome = child_2_genome
+        child_1 = Individual(child_1_genome)
+        child_2 = Individual(child_2_genome)
         
         return child_1, child_2
         
@@ -42,10 +40,8 @@ class Crossover:
             child_1_genome = parent_1.genome[:point_1] + parent_2.genome[point_1:point_2] + parent_1.genome[point_2:]
             child_2_genome = parent_2.genome[:point_1] + parent_1.genome[point_1:point_2] + parent_2.genome[point_2:]
 
-            child_1 = copy(parent_1)
-            child_2 = copy(parent_2)
-            child_1.genome = child_1_genome
-            child_2.genome = child_2_genome
+            child_1 = Individual(child_1_genome)
+            child_2 = Individual(child_2_genome)
         
         return child_1, child_2
     
@@ -62,10 +58,8 @@ class Crossover:
             child_1_genome = parent_1.genome[:point_1] + parent_2.genome[point_1:point_2] + parent_1.genome[point_2:point_3] +  parent_2.genome[point_3:]
             child_2_genome = parent_2.genome[:point_1] + parent_1.genome[point_1:point_2] + parent_2.genome[point_2:point_3] +  parent_1.genome[point_3:]
 
-            child_1 = copy(parent_1)
-            child_2 = copy(parent_2)
-            child_1.genome = child_1_genome
-            child_2.genome = child_2_genome
+            child_1 = Individual(child_1_genome)
+            child_2 = Individual(child_2_genome)
         
         return child_1, child_2
     
@@ -74,13 +68,58 @@ class Crossover:
         child_1_genome = list([np.random.choice(genome) for genome in parents_genome])
         child_2_genome = list([np.random.choice(genome) for genome in parents_genome])
 
-        child_1 = copy(parent_1)
-        child_2 = copy(parent_2)
-        child_1.genome = child_1_genome
-        child_2.genome = child_2_genome
+        child_1 = Individual(child_1_genome)
+        child_2 = Individual(child_2_genome)
 
         return child_1, child_2
         
+    def _get_points_crossover_mask(self, number_of_pairs: int, number_of_genes: int, number_of_points: int) -> np.ndarray:
+        if number_of_genes - 2 < number_of_points:
+            raise Exception(f'Too much points tried. Try less points for the crossover.')
+        points = np.sort(np.random.randint(1, number_of_genes - 1, size=(number_of_pairs, number_of_points)), axis=1)
+        crossed_points = np.arange(number_of_genes)[None, :, None] >= points[:, None, :]
+
+        return crossed_points.sum(axis=2) % 2 == 1
+
+    def _get_crossover_masks(self, number_of_pairs: int, number_of_genes: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self.crossover_type == 'one-point':
+            mask = np.arange(number_of_genes)[None, :] >= np.random.randint(1, number_of_genes - 1, size=(number_of_pairs, 1))
+            return mask, mask
+        elif self.crossover_type == 'two-point':
+            mask = self._get_points_crossover_mask(number_of_pairs, number_of_genes, 2)
+            return mask, mask
+        elif self.crossover_type == 'three-point':
+            mask = self._get_points_crossover_mask(number_of_pairs, number_of_genes, 3)
+            return mask, mask
+        elif self.crossover_type == 'uniform':
+            mask_1 = np.random.rand(number_of_pairs, number_of_genes) < 0.5
+            mask_2 = np.random.rand(number_of_pairs, number_of_genes) < 0.5
+            return mask_1, mask_2
+        else:
+            raise Exception(f'Crossover {self.crossover_type} not supported.')
+
+    def crossover_population(self, parents_1: Population, parents_2: Population) -> Population:
+        search_space = parents_1.search_space
+        mask_1, mask_2 = self._get_crossover_masks(len(parents_1), len(search_space))
+        int_indexes, float_indexes = search_space.int_indexes, search_space.float_indexes
+
+        childs_int_genes = np.stack([
+            np.where(mask_1[:, int_indexes], parents_2.int_genes, parents_1.int_genes),
+            np.where(mask_2[:, int_indexes], parents_1.int_genes, parents_2.int_genes)
+        ], axis=1).reshape(2 * len(parents_1), len(int_indexes))
+        childs_float_genes = np.stack([
+            np.where(mask_1[:, float_indexes], parents_2.float_genes, parents_1.float_genes),
+            np.where(mask_2[:, float_indexes], parents_1.float_genes, parents_2.float_genes)
+        ], axis=1).reshape(2 * len(parents_1), len(float_indexes))
+        bit_mask_1 = search_space.pack_bits(mask_1[:, search_space.bit_indexes])
+        bit_mask_2 = search_space.pack_bits(mask_2[:, search_space.bit_indexes])
+        childs_bit_genes = np.stack([
+            (parents_1.bit_genes & ~bit_mask_1) | (parents_2.bit_genes & bit_mask_1),
+            (parents_2.bit_genes & ~bit_mask_2) | (parents_1.bit_genes & bit_mask_2)
+        ], axis=1).reshape(2 * len(parents_1), search_space.number_of_bit_bytes)
+
+        return Population(search_space, childs_int_genes, childs_float_genes, bit_genes=childs_bit_genes)
+
     def crossover(self, parent_1: Individual, parent_2: Individual) -> Tuple[Individual, Individual]:
         if self.crossover_type == 'one-point':
             return self._one_point_crossover(parent_1, parent_2)
@@ -1,28 +1,50 @@
 import numpy as np
 import pandas as pd
+import queue
 import random
 import time
 import math
 import logging
 
-from typing import Callable, List, Tuple, Union
-from multiprocessing import Pool, cpu_count
+from typing import Any, Callable, Hashable, List, Tuple, Union
 from genopt.selection import Selection
 from genopt.crossover import Crossover
 from genopt.mutation import Mutation
 from genopt.individual import Individual
-from genopt.datatype_inference import DataTypeInference
 from genopt.results import Results
-from genopt.utils import define_weights_by_default_if_not_defined, normalize_best_score_by_index, calculate_weighted_sum_score_by_index
+from genopt.executor import Executor, ContextObjective, EvaluationError, get_worker_id
+from genopt.cache import FitnessCache
+from genopt.history import GenomeHistory
+from genopt.search_space import SearchSpace, CATEGORICAL_GENE
+from genopt.population import Population
+from genopt.checkpoint import Checkpoint
+from genopt.shared_data import SharedData
+from genopt.evaluation_log import EvaluationLog
+from genopt.pareto import get_pareto_order, get_pareto_front_indexes
+from genopt.utils import define_weights_by_default_if_not_defined, calculate_weighted_sum_scores
 
 
 MAX_GENERATIONS = 999999999999999
 MAX_ATTEMPS_PER_INDIVIDUAL = 5
+SUPPORTED_ENGINES = ['individual', 'vectorized']
+SUPPORTED_BATCH_FORMATS = ['dict', 'dataframe']
+SUPPORTED_MODES = ['generational', 'steady-state']
+SUPPORTED_MULTI_OBJECTIVE_TYPES = ['weighted-sum', 'pareto']
+SUPPORTED_ORDERING_TYPES = ['full', 'partial']
+SUPPORTED_ERROR_POLICIES = ['raise', 'penalize', 'retry']
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('ENVIRONMENT')
 
 class Environment:
-    def __init__(self, params: dict, num_population: int = 100, selection_rate: float = 0.5, selection_type: str = 'roulette', tournament_size: int = 5, crossover_type: str = 'one-point', mutation_type: str = 'single-gene', prob_mutation: float = 0.1, elite_rate: float = 0.1, verbose: int = 1, random_state: int = None):
+    def __init__(self, params: dict, num_population: int = 100, selection_rate: float = 0.5, selection_type: str = 'roulette', tournament_size: int = 5, crossover_type: str = 'one-point', mutation_type: str = 'single-gene', prob_mutation: float = 0.1, elite_rate: float = 0.1, cache_size: Union[int, None] = 10000, history_size: Union[int, None] = None, history_type: str = 'digest', history_false_positive_rate: float = 0.001, engine: str = 'individual', multi_objective_type: str = 'weighted-sum', ordering_type: str = 'full', verbose: int = 1, random_state: int = None):
+        if engine not in SUPPORTED_ENGINES:
+            raise Exception(f'Engine {engine} not supported. Must be one of {SUPPORTED_ENGINES}.')
+        if multi_objective_type not in SUPPORTED_MULTI_OBJECTIVE_TYPES:
+            raise Exception(f'Multi objective type {multi_objective_type} not supported. Must be one of {SUPPORTED_MULTI_OBJECTIVE_TYPES}.')
+        if ordering_type not in SUPPORTED_ORDERING_TYPES:
+            raise Exception(f'Ordering type {ordering_type} not supported. Must be one of {SUPPORTED_ORDERING_TYPES}.')
+        elif ordering_type == 'partial' and selection_type != 'ranking':
+            raise Exception(f'Partial ordering only supports ranking selection.')
         self.params = params
         self.num_population = num_population
         self.selection_rate = selection_rate
@@ -32,114 +54,435 @@ class Environment:
         self.mutation_type = mutation_type
         self.prob_mutation = prob_mutation
         self.elite_rate = elite_rate
+        self.engine = engine
+        self.multi_objective_type = multi_objective_type
+        self.ordering_type = ordering_type
         self.verbose = verbose
         self.results = Results()
-        self.history_genomes = set()
-        self.search_space_type = DataTypeInference.infer_search_space_type(params)
+        self.history_genomes = GenomeHistory(history_size, history_type, history_false_positive_rate)
+        self._fitness_cache = FitnessCache(cache_size)
+        self._executor = Executor('serial')
+        self._objective = None
+        self._batch = False
+        self._batch_format = 'dict'
+        self._population = None
+        self._number_of_told_individuals = 0
+        self._checkpoint_path = None
+        self._checkpoint_every = None
+        self._checkpoint_interval = None
+        self._last_checkpoint_time = None
+        self._last_checkpoint_generation = 0
+        self._checkpoint_state = None
+        self._shared_data = SharedData()
+        self._evaluation_log = None
+        self._timeout = None
+        self._stop_score = None
+        self._max_evaluations = None
+        self._number_of_evaluations = 0
+        self._eval_timeout = None
+        self._error_policy = 'raise'
+        self._penalty_fitness = None
+        self._direction = None
+        self._default_weights = None
+        self._start_time = None
+        self._is_evaluation_stopped = False
+        self._penalized_genomes = set()
+        self.search_space = SearchSpace(params)
+        self.search_space_type = self.search_space.search_space_type
         random.seed(random_state)
         np.random.seed(random_state)
 
+    def share_data(self, name: str, data: Union[np.ndarray, pd.DataFrame], storage: str = 'shared_memory') -> None:
+        if self.verbose > 1: logger.info(f'Sharing data {name} with the workers...')
+        self._shared_data.add(name, data, storage)
+
+    def release_data(self) -> None:
+        self._shared_data.close()
+
     def _is_in_history(self, individual: Individual) -> bool:
-        if tuple(individual.genome) in self.history_genomes:
-            return False
-        else:
-            return True
+        return tuple(individual.genome) in self.history_genomes
     
     def _add_individual_in_history(self, individual: Individual) -> None:
         self.history_genomes.add(tuple(individual.genome))
     
-    def _create_individual_checking_duplicates(self, objective):
+    def _create_individual_checking_duplicates(self) -> Individual:
         attemps = 0
         keep = True
         while keep:
             attemps += 1
-            individual = Individual(self.params, self.search_space_type, objective)
-            individual.initialize_genome()
+            individual = Individual()
+            individual.initialize_genome(self.search_space)
             if self._is_in_history(individual) == False or attemps == MAX_ATTEMPS_PER_INDIVIDUAL:
                 self._add_individual_in_history(individual)
                 keep = False
 
         return individual
+
+    def _get_duplicated_indexes(self, population: Population) -> List[int]:
+        duplicated_indexes = list()
+        genomes = set()
+        for i in range(len(population)):
+            genome = population.get_genome_key(i)
+            if genome in self.history_genomes or genome in genomes:
+                duplicated_indexes.append(i)
+            genomes.add(genome)
+
+        return duplicated_indexes
+
+    def _replace_duplicates_with_samples(self, population: Population) -> Population:
+        for _ in range(1, MAX_ATTEMPS_PER_INDIVIDUAL):
+            duplicated_indexes = self._get_duplicated_indexes(population)
+            if len(duplicated_indexes) == 0:
+                break
+            int_genes, float_genes = self.search_space.sample(len(duplicated_indexes))
+            population.int_genes[duplicated_indexes] = int_genes
+            population.float_genes[duplicated_indexes] = float_genes
+            population.bit_genes[duplicated_indexes] = self.search_space.sample_bits(len(duplicated_indexes))
+        for i in range(len(population)):
+            self.history_genomes.add(population.get_genome_key(i))
+
+        return population
+
+    def _create_population_checking_duplicates(self, number_of_individuals: int) -> Population:
+        return self._replace_duplicates_with_samples(Population.initialize(self.search_space, number_of_individuals))
+
+    def _deduplicate_individual_childs(self, childs: List[Individual], mutation: Mutation) -> List[Individual]:
+        for i in range(len(childs)):
+            attemps = 1
+            while self._is_in_history(childs[i]) and attemps < MAX_ATTEMPS_PER_INDIVIDUAL:
+                attemps += 1
+                childs[i] = mutation.force_mutate(childs[i])
+            if self._is_in_history(childs[i]):
+                childs[i] = self._create_individual_checking_duplicates()
+            else:
+                self._add_individual_in_history(childs[i])
+
+        return childs
+
+    def _deduplicate_population_childs(self, childs: Population, mutation: Mutation) -> Population:
+        for _ in range(1, MAX_ATTEMPS_PER_INDIVIDUAL):
+            duplicated_indexes = self._get_duplicated_indexes(childs)
+            if len(duplicated_indexes) == 0:
+                break
+            childs = mutation.force_mutate_population(childs, duplicated_indexes)
+
+        return self._replace_duplicates_with_samples(childs)
             
-    def _initialize_population(self, objective: Callable[[dict], Union[int,float]]) -> List[Individual]:
+    def _initialize_population(self) -> Union[List[Individual], Population]:
         if self.verbose > 1: logger.info(f'Initializing population...')
+        if self.engine == 'vectorized':
+            return self._create_population_checking_duplicates(self.num_population)
         population = list()
         for _ in range(self.num_population):
-            individual = self._create_individual_checking_duplicates(objective)
+            individual = self._create_individual_checking_duplicates()
             population.append(individual)
 
         return population
     
-    def _calculate_fitness_process(self, individual: Individual) -> Individual:
-        individual.calculate_fitness()
-        return individual
+    @staticmethod
+    def _calculate_objective_process(task: Tuple[Callable[[dict], Union[int, float]], dict]) -> Union[int, float]:
+        objective, genome_gene_names = task
+        return objective(genome_gene_names)
 
-    def _calculate_population_fitness(self, individuals: List[Individual], n_jobs: int = 1) -> List[Individual]:
-        if self.verbose > 1: logger.info(f'Calculating population fitness...')
-        if n_jobs == -1: n_jobs = cpu_count()
-        if n_jobs != 1:
-            pool = Pool(n_jobs)
-            new_individuals = pool.map(self._calculate_fitness_process, individuals)
+    @staticmethod
+    def _calculate_logged_objective_process(task: Tuple[Callable[[dict], Union[int, float]], dict]) -> Tuple[Union[int, float], float, str]:
+        objective, genome_gene_names = task
+        evaluation_start_time = time.perf_counter()
+        fitness = objective(genome_gene_names)
+
+        return fitness, time.perf_counter() - evaluation_start_time, get_worker_id()
+
+    def _get_objective_process(self) -> Callable[[Tuple[Callable[[dict], Union[int, float]], dict]], Any]:
+        if self._evaluation_log != None:
+            return Environment._calculate_logged_objective_process
         else:
-            new_individuals = list()
-            for individual in individuals:
-                new_individuals.append(self._calculate_fitness_process(individual))
+            return Environment._calculate_objective_process
 
-        return new_individuals
-    
-    def _order_population_by_multiple_fitness(self, individuals: List[Individual], direction: List[str], weights: List[Union[int, float]]) -> List[Individual]:
-        if len(direction) == len(weights):
-            number_of_fitnesses = len(individuals[0].fitness)
-            if number_of_fitnesses != len(direction):
-                raise Exception(f'Direction and weights do not match number of fitness values.')
-            weights = define_weights_by_default_if_not_defined(weights, direction)
-            df_ranks = pd.DataFrame({'idx_individual': range(len(individuals))})
-            for i in range(number_of_fitnesses):
-                best_scores = [individual.fitness[i] for individual in individuals]
-                df_ranks[f'best_score_{i}'] = best_scores
-                df_ranks = normalize_best_score_by_index(df_ranks, direction, i)
-                df_ranks = calculate_weighted_sum_score_by_index(df_ranks, weights, i)
-            df_ranks_sorted = df_ranks.sort_values(['overall_best_score'], ascending=False)
-            idx_individuals = df_ranks_sorted['idx_individual'].values
-            individuals = [individuals[i] for i in idx_individuals]
+    def _get_individual_genome_gene_names(self, individuals: Union[List[Individual], Population], index: int) -> dict:
+        if self.engine == 'vectorized':
+            return individuals.get_name_genome_genes(index)
+        else:
+            return individuals[index].get_name_genome_genes(self.search_space)
 
-        return individuals
+    def _log_evaluations(self, generation: int, genomes_gene_names: List[dict], results: List[Tuple[Union[int, float], float, str]]) -> list:
+        fitnesses = list()
+        for genome_gene_names, (fitness, wall_time, worker_id) in zip(genomes_gene_names, results):
+            self._evaluation_log.add(generation, genome_gene_names, fitness, wall_time, worker_id)
+            fitnesses.append(fitness)
 
-    def _order_population_by_single_fitness(self, individuals: List[Individual], direction: str):
+        return fitnesses
+
+    def _get_max_retries(self, error_policy: str) -> int:
+        error_policy_type, _, max_retries = error_policy.partition(':')
+        if error_policy_type not in SUPPORTED_ERROR_POLICIES:
+            raise Exception(f'Error policy {error_policy} not supported. Must be one of {SUPPORTED_ERROR_POLICIES}, with retry written as retry:N.')
+        if error_policy_type != 'retry':
+            return 0
+        if max_retries.isdigit() == False or int(max_retries) < 1:
+            raise Exception(f'Error policy {error_policy} not supported. Retry policy must be written as retry:N with N a positive integer.')
+
+        return int(max_retries)
+
+    def _get_penalty_fitness(self, direction: Union[str, List[str]], penalty_fitness: Union[int, float, Tuple[Union[int, float]]]) -> Union[int, float, Tuple[Union[int, float]]]:
+        if penalty_fitness != None:
+            return penalty_fitness
+        elif isinstance(direction, list):
+            raise Exception(f'penalty_fitness must be defined for multi-objective optimizations with eval_timeout or a non raise error_policy.')
+        elif direction == 'minimize':
+            return math.inf
+        else:
+            return -math.inf
+
+    def _get_penalized_results(self, results: list, genomes_gene_names: List[dict], genomes: list, generation: int) -> list:
+        penalized_results = list()
+        for result, genome_gene_names, genome in zip(results, genomes_gene_names, genomes):
+            if isinstance(result, EvaluationError):
+                if self.verbose >= 1: logger.warning(f'Evaluation in {result.worker_id} failed with {result.error} after {result.attempts} attempts. Individual was penalized with fitness {self._penalty_fitness}.')
+                self.results.add_evaluation_error(generation, genome_gene_names, result.worker_id, result.error, result.traceback, result.attempts)
+                # the penalty is not a real score, so the genome is evaluated again if it is generated later
+                self._penalized_genomes.add(genome)
+                if self._evaluation_log != None:
+                    result = (self._penalty_fitness, result.wall_time, result.worker_id)
+                else:
+                    result = self._penalty_fitness
+            penalized_results.append(result)
+
+        return penalized_results
+
+    def _put_fitness_in_cache(self, genome: Hashable, fitness: Union[int, float, Tuple[Union[int, float]]]) -> None:
+        if genome in self._penalized_genomes:
+            self._penalized_genomes.discard(genome)
+        else:
+            self._fitness_cache.put(genome, fitness)
+
+    def _get_population_genomes(self, individuals: Union[List[Individual], Population]) -> list:
+        if self.engine == 'vectorized':
+            return [individuals.get_genome_key(i) for i in range(len(individuals))]
+        else:
+            return [tuple(individual.genome) for individual in individuals]
+
+    def _get_population_fitness(self, individuals: Union[List[Individual], Population]) -> list:
+        if self.engine == 'vectorized':
+            return individuals.fitness
+        else:
+            return [individual.fitness for individual in individuals]
+
+    def _set_individual_fitness(self, individuals: Union[List[Individual], Population], index: int, fitness: Union[int, float, Tuple[Union[int, float]]]) -> None:
+        if self.engine == 'vectorized':
+            individuals.fitness[index] = fitness
+        else:
+            individuals[index].fitness = fitness
+
+    def _get_population_columns(self, individuals: Union[List[Individual], Population], indexes: List[int]) -> Union[dict, pd.DataFrame]:
+        if self.engine == 'vectorized':
+            columns = self.search_space.decode_columns(individuals.int_genes[indexes], individuals.float_genes[indexes], individuals.bit_genes[indexes])
+        else:
+            columns = dict()
+            for j, name in enumerate(self.search_space.names):
+                columns[name] = np.asarray([individuals[i].genome[j] for i in indexes])
+                if self.search_space.types[j] == CATEGORICAL_GENE:
+                    columns[name] = np.asarray(self.search_space.choices[j])[columns[name]]
+
+        if self._batch_format == 'dataframe':
+            return pd.DataFrame(columns)
+        else:
+            return columns
+
+    def _calculate_batch_fitness(self, individuals: Union[List[Individual], Population], indexes: List[int], generation: int) -> list:
+        evaluation_start_time = time.perf_counter()
+        fitnesses = self._objective(self._get_population_columns(individuals, indexes))
+        wall_time = (time.perf_counter() - evaluation_start_time) / len(indexes)
+        if isinstance(fitnesses, tuple):
+            fitnesses = np.column_stack(fitnesses)
+        else:
+            fitnesses = np.asarray(fitnesses)
+        if len(fitnesses) != len(indexes):
+            raise Exception(f'Batch objective returned {len(fitnesses)} fitness values for {len(indexes)} individuals.')
+
+        if fitnesses.ndim == 1:
+            fitnesses = list(fitnesses)
+        else:
+            fitnesses = [tuple(fitness) for fitness in fitnesses]
+        if self._evaluation_log != None:
+            genomes_gene_names = [self._get_individual_genome_gene_names(individuals, i) for i in indexes]
+            self._log_evaluations(generation, genomes_gene_names, [(fitness, wall_time, get_worker_id()) for fitness in fitnesses])
+
+        return fitnesses
+
+    def _get_remaining_time(self, timeout: Union[float, int], start_time: float) -> Union[float, None]:
+        if timeout != None:
+            return max(timeout - (time.time() - start_time), 0)
+        else:
+            return None
+
+    def _evaluate_individuals_until_stop(self, genomes_gene_names: List[dict], genomes: list, tasks: list, generation: int) -> list:
+        fitnesses = [None] * len(tasks)
+        number_of_evaluations = 0
+        for i, result in self._executor.imap_unordered(self._get_objective_process(), tasks, self._get_remaining_time(self._timeout, self._start_time)):
+            result = self._get_penalized_results([result], [genomes_gene_names[i]], [genomes[i]], generation)[0]
+            if self._evaluation_log != None:
+                result = self._log_evaluations(generation, [genomes_gene_names[i]], [result])[0]
+            fitnesses[i] = result
+            number_of_evaluations += 1
+            if self._check_stop_timeout(self._timeout, self._start_time) or self._check_stop_score(self._stop_score, result, self._direction):
+                break
+
+        if number_of_evaluations < len(tasks):
+            if self.verbose > 1: logger.info(f'Cancelling {len(tasks) - number_of_evaluations} pending evaluations...')
+            self._executor.shutdown(wait=False)
+            self._is_evaluation_stopped = True
+
+        return fitnesses
+
+    def _get_evaluated_individuals(self, individuals: Union[List[Individual], Population]) -> Union[List[Individual], Population]:
+        evaluated_indexes = [i for i, fitness in enumerate(self._get_population_fitness(individuals)) if fitness != None]
+        if len(evaluated_indexes) == 0:
+            raise Exception(f'Optimization stopped before any individual was evaluated.')
+        if self.engine == 'vectorized':
+            return individuals[np.asarray(evaluated_indexes, dtype=np.int64)]
+        else:
+            return [individuals[i] for i in evaluated_indexes]
+
+    def _evaluate_individuals(self, individuals: Union[List[Individual], Population], indexes: List[int], generation: int) -> list:
+        if len(indexes) == 0:
+            return list()
+        elif self._batch:
+            return self._calculate_batch_fitness(individuals, indexes, generation)
+        genomes_gene_names = [self._get_individual_genome_gene_names(individuals, i) for i in indexes]
+        population_genomes = self._get_population_genomes(individuals)
+        genomes = [population_genomes[i] for i in indexes]
+        tasks = [(self._objective, genome_gene_names) for genome_gene_names in genomes_gene_names]
+        if self._timeout != None or self._stop_score != None:
+            return self._evaluate_individuals_until_stop(genomes_gene_names, genomes, tasks, generation)
+        results = self._executor.map(self._get_objective_process(), tasks)
+        if self._eval_timeout != None or self._error_policy != 'raise':
+            results = self._get_penalized_results(results, genomes_gene_names, genomes, generation)
+        if self._evaluation_log != None:
+            return self._log_evaluations(generation, genomes_gene_names, results)
+        else:
+            return results
+
+    def _calculate_population_fitness(self, individuals: Union[List[Individual], Population], generation: int = 0) -> Union[List[Individual], Population]:
+        if self.verbose > 1: logger.info(f'Calculating population fitness...')
+        genomes = self._get_population_genomes(individuals)
+        pending_indexes = dict()
+        for i, fitness in enumerate(self._get_population_fitness(individuals)):
+            if fitness == None:
+                pending_indexes.setdefault(genomes[i], list()).append(i)
+
+        indexes_to_evaluate = list()
+        for genome, same_genome_indexes in pending_indexes.items():
+            fitness = self._fitness_cache.get(genome)
+            if fitness != None:
+                for i in same_genome_indexes:
+                    self._set_individual_fitness(individuals, i, fitness)
+            else:
+                indexes_to_evaluate.append(same_genome_indexes[0])
+
+        remaining_evaluations = self._get_remaining_evaluations()
+        if remaining_evaluations != None and len(indexes_to_evaluate) > remaining_evaluations:
+            if self.verbose > 1: logger.info(f'Evaluating only {remaining_evaluations} of {len(indexes_to_evaluate)} individuals to respect max_evaluations...')
+            indexes_to_evaluate = indexes_to_evaluate[:remaining_evaluations]
+            self._is_evaluation_stopped = True
+        self._executor.retry_budget = self._get_retry_budget(len(indexes_to_evaluate))
+        number_of_retries = self._executor.number_of_retries
+        fitnesses = self._evaluate_individuals(individuals, indexes_to_evaluate, generation)
+        self._number_of_evaluations += self._executor.number_of_retries - number_of_retries
+        for index, fitness in zip(indexes_to_evaluate, fitnesses):
+            if fitness == None:
+                continue
+            self._number_of_evaluations += 1
+            self._put_fitness_in_cache(genomes[index], fitness)
+            for i in pending_indexes[genomes[index]]:
+                self._set_individual_fitness(individuals, i, fitness)
+
+        if self._is_evaluation_stopped:
+            return self._get_evaluated_individuals(individuals)
+        else:
+            return individuals
+    
+    def _get_single_fitness_keys(self, fitnesses: list, direction: str) -> np.ndarray:
         if direction == 'maximize':
-            individuals = sorted(individuals, key=lambda individual: individual.fitness, reverse=True)
+            return -np.asarray(fitnesses, dtype=np.float64)
         elif direction == 'minimize':
-            individuals = sorted(individuals, key=lambda individual: individual.fitness)
+            return np.asarray(fitnesses, dtype=np.float64)
         else:
             raise Exception(f'Direction {direction} not supported.')
-            
-        return individuals
 
-    def _order_population_by_fitness(self, individuals: List[Individual], direction: Union[str, List[str]], weights: List[Union[int, float]]) -> List[Individual]:
-        if self.verbose > 1: logger.info(f'Ordering population by fitness...')
+    def _get_weights(self, direction: Union[str, List[str]], weights: List[Union[int, float]]) -> List[Union[int, float]]:
+        if isinstance(direction, list) == False:
+            return weights
+        elif weights != None:
+            return define_weights_by_default_if_not_defined(weights, direction)
+        if self._default_weights == None or len(self._default_weights) != len(direction):
+            self._default_weights = define_weights_by_default_if_not_defined(weights, direction)
+
+        return self._default_weights
+
+    def _get_multiple_fitness_keys(self, fitnesses: list, direction: List[str], weights: List[Union[int, float]]) -> np.ndarray:
+        if len(direction) != len(weights):
+            raise Exception(f'Direction length does not match weights length.')
+
+        return -calculate_weighted_sum_scores(fitnesses, direction, weights)
+
+    def _get_order_by_keys(self, keys: np.ndarray, number_of_top_individuals: int = None) -> np.ndarray:
+        if self.ordering_type == 'full' or number_of_top_individuals == None or number_of_top_individuals >= len(keys):
+            return np.argsort(keys, kind='stable')
+        number_of_top_individuals = max(number_of_top_individuals, 1)
+        partition = np.argpartition(keys, number_of_top_individuals - 1)
+        top_indexes = partition[:number_of_top_individuals]
+        top_indexes = top_indexes[np.argsort(keys[top_indexes], kind='stable')]
+
+        return np.concatenate((top_indexes, partition[number_of_top_individuals:]))
+
+    def _get_fitness_order(self, fitnesses: list, direction: Union[str, List[str]], weights: List[Union[int, float]], number_of_top_individuals: int = None) -> np.ndarray:
         if isinstance(direction, str):
-            individuals = self._order_population_by_single_fitness(individuals, direction)
-        elif isinstance(direction, list):
-            individuals = self._order_population_by_multiple_fitness(individuals, direction, weights)
+            keys = self._get_single_fitness_keys(fitnesses, direction)
+        elif self.multi_objective_type == 'pareto':
+            return get_pareto_order(fitnesses, direction)
         else:
-            raise Exception(f'Direction {direction} not supported. Must be of type str or List[str]')
+            keys = self._get_multiple_fitness_keys(fitnesses, direction, weights)
 
-        return individuals
+        return self._get_order_by_keys(keys, number_of_top_individuals)
+
+    def _get_number_of_top_individuals(self, number_of_individuals: int) -> int:
+        number_of_elite_individuals = math.ceil(number_of_individuals * self.elite_rate)
+        number_of_parents = int((number_of_individuals * (1 - self.elite_rate) * self.selection_rate) // 2)
+
+        return max(number_of_elite_individuals, number_of_parents, 1)
+
+    def _order_population_by_fitness(self, individuals: Union[List[Individual], Population], direction: Union[str, List[str]], weights: List[Union[int, float]], number_of_top_individuals: int = None) -> Union[List[Individual], Population]:
+        if self.verbose > 1: logger.info(f'Ordering population by fitness...')
+        if isinstance(direction, str) == False and isinstance(direction, list) == False:
+            raise Exception(f'Direction {direction} not supported. Must be of type str or List[str]')
+        order = self._get_fitness_order(self._get_population_fitness(individuals), direction, weights, number_of_top_individuals)
+        if self.engine == 'vectorized':
+            return individuals[order]
+        else:
+            return [individuals[i] for i in order]
 
-    def _run_selection(self, individuals: List[Individual]) -> List[Tuple[Individual, Individual]]:
+    def _run_selection(self, individuals: Union[List[Individual], Population], number_of_parents: int = None) -> Union[List[Tuple[Individual, Individual]], Tuple[Population, Population]]:
         if self.verbose > 1: logger.info(f'Selecting parents...')
         parents = list()
         selection = Selection.getInstance(self.selection_type, self.tournament_size)
         
-        number_of_parents = int((len(individuals) * (1 - self.elite_rate) * self.selection_rate) // 2)
-        parents = selection.selection(individuals, number_of_parents)
+        if number_of_parents == None:
+            number_of_parents = int((len(individuals) * (1 - self.elite_rate) * self.selection_rate) // 2)
+        if self.engine == 'vectorized':
+            parent_indexes = selection.get_parent_indexes(len(individuals), number_of_parents)
+            parents = (individuals[parent_indexes[:, 0]], individuals[parent_indexes[:, 1]])
+        else:
+            parents = selection.selection(individuals, number_of_parents)
        
         return parents
 
-    def _run_crossover_with_mutation(self, best_parents: List[Tuple[Individual, Individual]]) -> List[Individual]:
+    def _run_crossover_with_mutation(self, best_parents: Union[List[Tuple[Individual, Individual]], Tuple[Population, Population]]) -> Union[List[Individual], Population]:
         crossover =  Crossover.getInstance(self.crossover_type)
-        mutation = Mutation.getInstance(self.mutation_type, self.prob_mutation, self.search_space_type, self.params)
+        mutation = Mutation.getInstance(self.mutation_type, self.prob_mutation, self.search_space)
         if self.verbose > 1: logger.info(f'Running crossover with mutation...')
+        if self.engine == 'vectorized':
+            childs = crossover.crossover_population(best_parents[0], best_parents[1])
+            return mutation.mutate_population(childs)
         childs = list()
         for parents in best_parents:
             child_1, child_2 = crossover.crossover(parents[0], parents[1])
@@ -150,19 +493,48 @@ class Environment:
 
         return childs
 
-    def _get_elite(self, individuals: List[Individual]) -> List[Individual]:
+    def _deduplicate_childs(self, childs: Union[List[Individual], Population]) -> Union[List[Individual], Population]:
+        if self.verbose > 1: logger.info(f'Replacing duplicated childs...')
+        mutation = Mutation.getInstance(self.mutation_type, self.prob_mutation, self.search_space)
+        if self.engine == 'vectorized':
+            return self._deduplicate_population_childs(childs, mutation)
+        else:
+            return self._deduplicate_individual_childs(childs, mutation)
+
+    def _get_elite(self, individuals: Union[List[Individual], Population]) -> Union[List[Individual], Population]:
         if self.verbose > 1: logger.info(f'Getting elite individuals...')
         elite = individuals[:math.ceil(len(individuals) * self.elite_rate)]
 
         return elite
     
-    def _check_stop_criterias(self, num_generations, timeout, stop_score):
-        if num_generations == None and (timeout != None or stop_score != None):
+    def _check_stop_criterias(self, num_generations, timeout, stop_score, max_evaluations=None):
+        if max_evaluations != None and max_evaluations < 1:
+            raise Exception(f'max_evaluations must be a positive integer.')
+        if num_generations == None and (timeout != None or stop_score != None or max_evaluations != None):
             num_generations = MAX_GENERATIONS
-        elif num_generations == None and timeout == None and stop_score == None:
-            raise Exception('Stop criteria does not exist. Define num_generations, timeout, stop_score or all of them.')
+        elif num_generations == None and timeout == None and stop_score == None and max_evaluations == None:
+            raise Exception('Stop criteria does not exist. Define num_generations, timeout, stop_score, max_evaluations or all of them.')
         return num_generations, timeout, stop_score
     
+    def _get_remaining_evaluations(self) -> Union[int, None]:
+        if self._max_evaluations != None:
+            return max(self._max_evaluations - self._number_of_evaluations, 0)
+        else:
+            return None
+
+    def _get_retry_budget(self, number_of_pending_evaluations: int) -> Union[int, None]:
+        remaining_evaluations = self._get_remaining_evaluations()
+        if remaining_evaluations != None:
+            return max(remaining_evaluations - number_of_pending_evaluations, 0)
+        else:
+            return None
+
+    def _check_stop_max_evaluations(self, max_evaluations: int) -> bool:
+        if max_evaluations != None:
+            return self._number_of_evaluations >= max_evaluations
+        else:
+            return False
+    
     def _check_stop_timeout(self, timeout: Union[float, int], start_time: float) -> bool:
         if timeout != None:
             elapsed_time = time.time() - start_time
@@ -193,38 +565,301 @@ class Environment:
         else:
             return False
     
-    def _create_new_individuals(self, individuals, objective):
+    def _create_new_individuals(self, individuals: Union[List[Individual], Population]) -> Union[List[Individual], Population]:
         num_individuals_to_create = self.num_population - len(individuals)
+        if self.engine == 'vectorized':
+            if num_individuals_to_create > 0:
+                individuals.extend(self._create_population_checking_duplicates(num_individuals_to_create))
+            return individuals
         for _ in range(num_individuals_to_create):
-            individual = self._create_individual_checking_duplicates(objective)
+            individual = self._create_individual_checking_duplicates()
             individuals.append(individual)
 
         return individuals
 
+    def _get_best_individual(self, individuals: Union[List[Individual], Population]) -> Tuple[dict, Union[int, float, Tuple[Union[int, float]]]]:
+        if self.engine == 'vectorized':
+            return individuals.get_name_genome_genes(0), individuals.fitness[0]
+        else:
+            return individuals[0].get_name_genome_genes(self.search_space), individuals[0].fitness
 
-    def optimize(self, objective: Callable[[dict], Union[int,float, Tuple[Union[int, float]]]], direction: Union[str, List[str]], weights: List[Union[int, float]] = None, score_names: Union[str, List[str]] = None, num_generations: int = None, timeout: int = None, stop_score: Union[float, int] = None, n_jobs: int = 1) -> Results:
-        start_time = time.time()
-        
-        individuals = self._initialize_population(objective)
-        individuals = self._calculate_population_fitness(individuals, n_jobs)
-        individuals = self._order_population_by_fitness(individuals, direction, weights)
+    def _create_random_individuals(self, number_of_individuals: int) -> Union[List[Individual], Population]:
+        if self.engine == 'vectorized':
+            return self._create_population_checking_duplicates(number_of_individuals)
+        else:
+            return [self._create_individual_checking_duplicates() for _ in range(number_of_individuals)]
+
+    def _create_childs(self, individuals: Union[List[Individual], Population], number_of_childs: int) -> Union[List[Individual], Population]:
+        number_of_parents = min(max(math.ceil(number_of_childs / 2), 2), len(individuals))
+        childs = self._run_crossover_with_mutation(self._run_selection(individuals, number_of_parents))
+        while len(childs) < number_of_childs:
+            childs.extend(self._run_crossover_with_mutation(self._run_selection(individuals, number_of_parents)))
+
+        return self._deduplicate_childs(childs[:number_of_childs])
+
+    def _create_individuals_from_candidates(self, candidates: List[dict], scores: list) -> Union[List[Individual], Population]:
+        if self.engine == 'vectorized':
+            int_genes, float_genes = self.search_space.encode(candidates)
+            return Population(self.search_space, int_genes, float_genes, list(scores), self.search_space.encode_bits(candidates))
+        individuals = list()
+        for candidate, score in zip(candidates, scores):
+            individuals.append(Individual(self.search_space.encode_genome(candidate), score))
+
+        return individuals
+
+    def _get_population_genome_gene_names(self, individuals: Union[List[Individual], Population]) -> List[dict]:
+        if self.engine == 'vectorized':
+            return [individuals.get_name_genome_genes(i) for i in range(len(individuals))]
+        else:
+            return [individual.get_name_genome_genes(self.search_space) for individual in individuals]
+
+    def _get_decoded_individuals(self, individuals: Union[List[Individual], Population]) -> List[Individual]:
+        if self.engine == 'vectorized':
+            return individuals.to_individuals()
+        else:
+            return [Individual(list(individual.get_name_genome_genes(self.search_space).values()), individual.fitness) for individual in individuals]
+
+    def _ask_individuals(self, number_of_individuals: int) -> Union[List[Individual], Population]:
+        if self._population == None or len(self._population) < 2:
+            return self._create_random_individuals(number_of_individuals)
+        else:
+            return self._create_childs(self._population, number_of_individuals)
+
+    def _tell_individuals(self, individuals: Union[List[Individual], Population], direction: Union[str, List[str]], weights: List[Union[int, float]] = None) -> None:
+        for genome, fitness in zip(self._get_population_genomes(individuals), self._get_population_fitness(individuals)):
+            self._put_fitness_in_cache(genome, fitness)
+            self.history_genomes.add(genome)
+
+        if self._population == None:
+            self._population = individuals
+        else:
+            self._population.extend(individuals)
+        self._population = self._order_population_by_fitness(self._population, direction, weights)[:self.num_population]
 
-        num_generations, timeout, stop_score = self._check_stop_criterias(num_generations, timeout, stop_score)
-        for generation in range(1, num_generations):
+        best_individual, best_score = self._get_best_individual(self._population)
+        self.results.best_score = best_score
+        self.results.best_individual = best_individual
+        generation = self._number_of_told_individuals // self.num_population
+        self._number_of_told_individuals += len(individuals)
+        while generation < self._number_of_told_individuals // self.num_population:
+            generation += 1
+            self.results.add_generation_results(generation, best_score, best_individual)
+            if self.verbose >= 1: logger.info(f'THE BEST SOLUTION IN GENERATION {generation} IS {best_individual} WITH A SCORE OF {best_score}')
+
+    def ask(self, number_of_candidates: int = 1) -> List[dict]:
+        if self.verbose > 1: logger.info(f'Asking for {number_of_candidates} candidates...')
+        individuals = self._ask_individuals(number_of_candidates)
+
+        return self._get_population_genome_gene_names(individuals)
+
+    def tell(self, candidates: List[dict], scores: List[Union[int, float, Tuple[Union[int, float]]]], direction: Union[str, List[str]], weights: List[Union[int, float]] = None) -> None:
+        if len(candidates) != len(scores):
+            raise Exception(f'Number of candidates and scores does not match.')
+        if self.verbose > 1: logger.info(f'Telling {len(candidates)} evaluated candidates...')
+        individuals = self._create_individuals_from_candidates(candidates, scores)
+        self._tell_individuals(individuals, direction, self._get_weights(direction, weights))
+
+    def _submit_individual(self, individual: Union[List[Individual], Population], task_id: int) -> None:
+        genome_gene_names = self._get_individual_genome_gene_names(individual, 0)
+        self._executor.submit(self._get_objective_process(), (self._objective, genome_gene_names), task_id)
+
+    def _get_completed_individual(self, individuals_in_progress: dict, timeout: float = None) -> Union[List[Individual], Population]:
+        self._executor.retry_budget = self._get_retry_budget(len(individuals_in_progress))
+        number_of_retries = self._executor.number_of_retries
+        try:
+            task_id, result = self._executor.get_completed(timeout)
+        finally:
+            self._number_of_evaluations += self._executor.number_of_retries - number_of_retries
+        individual = individuals_in_progress.pop(task_id)
+        self._number_of_evaluations += 1
+        generation = self._number_of_told_individuals // self.num_population
+        genome_gene_names = self._get_individual_genome_gene_names(individual, 0)
+        result = self._get_penalized_results([result], [genome_gene_names], self._get_population_genomes(individual), generation)[0]
+        if self._evaluation_log != None:
+            result = self._log_evaluations(generation, [genome_gene_names], [result])[0]
+        self._set_individual_fitness(individual, 0, result)
+
+        return individual
+
+    def _check_steady_state_stop_criterias(self, num_generations: int, timeout: Union[float, int], stop_score: Union[float, int], direction: Union[str, List[str]], start_time: float) -> bool:
+        stop_timeout_criteria = self._check_stop_timeout(timeout, start_time)
+        stop_score_criteria = self._check_stop_score(stop_score, self.results.best_score, direction)
+        stop_num_generations_criteria = self._number_of_told_individuals >= num_generations * self.num_population
+        stop_max_evaluations_criteria = self._check_stop_max_evaluations(self._max_evaluations)
+        if self.verbose >= 1:
+            if stop_timeout_criteria:
+                logger.info('TIMEOUT STOP CRITERIA SATISFIED.')
+            if stop_score_criteria:
+                logger.info('SCORE STOP CRITERIA SATISFIED.')
+            if stop_num_generations_criteria:
+                logger.info('NUM GENERATIONS CRITERIA SATISFIED.')
+            if stop_max_evaluations_criteria:
+                logger.info('MAX EVALUATIONS CRITERIA SATISFIED.')
+
+        return stop_timeout_criteria or stop_score_criteria or stop_num_generations_criteria or stop_max_evaluations_criteria
+
+    def _run_steady_state_optimization(self, direction: Union[str, List[str]], weights: List[Union[int, float]], num_generations: int, timeout: Union[float, int], stop_score: Union[float, int], start_time: float) -> int:
+        individuals_in_progress = dict()
+        task_id = 0
+        number_of_individuals = self.num_population
+        if self._checkpoint_state != None:
+            self._population = self._restore_checkpoint_population(self._checkpoint_state['population'])
+            number_of_individuals = self._executor.n_jobs
+        if self._max_evaluations != None:
+            number_of_individuals = min(number_of_individuals, self._get_remaining_evaluations())
+        individuals = self._ask_individuals(number_of_individuals)
+        for i in range(len(individuals)):
+            individuals_in_progress[task_id] = individuals[i:i + 1]
+            self._submit_individual(individuals_in_progress[task_id], task_id)
+            task_id += 1
+
+        stop = False
+        number_of_cache_hits = 0
+        while stop == False:
+            remaining_evaluations = self._get_remaining_evaluations()
+            # a whole generation of asked individuals was already evaluated, so the search space cannot provide new ones
+            is_search_space_exhausted = number_of_cache_hits >= self.num_population
+            if is_search_space_exhausted and len(individuals_in_progress) == 0:
+                if self.verbose >= 1: logger.info('SEARCH SPACE EXHAUSTED, NO NEW INDIVIDUALS LEFT TO EVALUATE.')
+                break
+            if is_search_space_exhausted == False and len(individuals_in_progress) < self._executor.n_jobs and (remaining_evaluations == None or len(individuals_in_progress) < remaining_evaluations):
+                individual = self._ask_individuals(1)
+                fitness = self._fitness_cache.get(self._get_population_genomes(individual)[0])
+                if fitness == None:
+                    number_of_cache_hits = 0
+                    individuals_in_progress[task_id] = individual
+                    self._submit_individual(individual, task_id)
+                    task_id += 1
+                    continue
+                number_of_cache_hits += 1
+                self._set_individual_fitness(individual, 0, fitness)
+            else:
+                try:
+                    individual = self._get_completed_individual(individuals_in_progress, self._get_remaining_time(timeout, start_time))
+                except queue.Empty:
+                    if self.verbose >= 1: logger.info('TIMEOUT STOP CRITERIA SATISFIED.')
+                    break
+            self._tell_individuals(individual, direction, weights)
+            stop = self._check_steady_state_stop_criterias(num_generations, timeout, stop_score, direction, start_time)
+            if stop == False:
+                self._check_checkpoint(self._number_of_told_individuals // self.num_population, self._population, start_time)
+
+        if len(individuals_in_progress) > 0:
+            if self.verbose > 1: logger.info(f'Cancelling {len(individuals_in_progress)} pending evaluations...')
+            self._executor.shutdown(wait=False)
+        if self._population == None:
+            raise Exception(f'Optimization stopped before any individual was evaluated.')
+        if self.verbose >= 1: logger.info('STOPPING OPTIMIZATION...')
+
+        return self._number_of_told_individuals // self.num_population
+
+    def _get_checkpoint_population(self, individuals: Union[List[Individual], Population]) -> dict:
+        if self.engine == 'vectorized':
+            return {'int_genes': individuals.int_genes, 'float_genes': individuals.float_genes, 'bit_genes': individuals.bit_genes, 'fitness': individuals.fitness}
+        else:
+            return {'genomes': [individual.genome for individual in individuals], 'fitness': [individual.fitness for individual in individuals]}
+
+    def _restore_checkpoint_population(self, population: dict) -> Union[List[Individual], Population]:
+        if self.engine == 'vectorized':
+            return Population(self.search_space, population['int_genes'], population['float_genes'], population['fitness'], population.get('bit_genes'))
+        individuals = list()
+        for genome, fitness in zip(population['genomes'], population['fitness']):
+            individuals.append(Individual(genome, fitness))
+
+        return individuals
+
+    def save_checkpoint(self, path: str, generation: int, individuals: Union[List[Individual], Population], elapsed_time: float) -> None:
+        if self.verbose > 1: logger.info(f'Saving checkpoint of generation {generation} in {path}...')
+        state = {
+            'environment': {
+                'params': self.params,
+                'num_population': self.num_population,
+                'selection_rate': self.selection_rate,
+                'selection_type': self.selection_type,
+                'tournament_size': self.tournament_size,
+                'crossover_type': self.crossover_type,
+                'mutation_type': self.mutation_type,
+                'prob_mutation': self.prob_mutation,
+                'elite_rate': self.elite_rate,
+                'cache_size': self._fitness_cache.max_size,
+                'history_size': self.history_genomes.max_size,
+                'history_type': self.history_genomes.history_type,
+                'history_false_positive_rate': self.history_genomes.false_positive_rate,
+                'engine': self.engine,
+                'multi_objective_type': self.multi_objective_type,
+                'ordering_type': self.ordering_type,
+                'verbose': self.verbose
+            },
+            'generation': generation,
+            'population': self._get_checkpoint_population(individuals),
+            'number_of_told_individuals': self._number_of_told_individuals,
+            'number_of_evaluations': self._number_of_evaluations,
+            'history_genomes': self.history_genomes,
+            'fitness_cache': self._fitness_cache,
+            'results': self.results,
+            'elapsed_time': elapsed_time,
+            'random_state': random.getstate(),
+            'numpy_random_state': np.random.get_state()
+        }
+        Checkpoint.save(path, state)
+
+    @staticmethod
+    def resume(path: str) -> 'Environment':
+        state = Checkpoint.load(path)
+        environment = Environment(**state['environment'])
+        environment.history_genomes = state['history_genomes']
+        environment._fitness_cache = state['fitness_cache']
+        environment.results = state['results']
+        environment._number_of_told_individuals = state['number_of_told_individuals']
+        environment._last_checkpoint_generation = state['generation']
+        environment._checkpoint_state = state
+        random.setstate(state['random_state'])
+        np.random.set_state(state['numpy_random_state'])
+
+        return environment
+
+    def _check_checkpoint(self, generation: int, individuals: Union[List[Individual], Population], start_time: float) -> None:
+        if self._checkpoint_path != None:
+            checkpoint_generation_criteria = self._checkpoint_every != None and generation >= self._last_checkpoint_generation + self._checkpoint_every
+            checkpoint_interval_criteria = self._checkpoint_interval != None and time.time() - self._last_checkpoint_time >= self._checkpoint_interval
+            if checkpoint_generation_criteria or checkpoint_interval_criteria:
+                self.save_checkpoint(self._checkpoint_path, generation, individuals, time.time() - start_time)
+                self._last_checkpoint_generation = generation
+                self._last_checkpoint_time = time.time()
+
+    def _run_generational_optimization(self, direction: Union[str, List[str]], weights: List[Union[int, float]], num_generations: int, timeout: Union[float, int], stop_score: Union[float, int], start_time: float) -> Tuple[int, Union[List[Individual], Population]]:
+        if self._checkpoint_state != None:
+            generation = self._checkpoint_state['generation']
+            individuals = self._restore_checkpoint_population(self._checkpoint_state['population'])
+        else:
+            generation = 0
+            individuals = self._initialize_population()
+            individuals = self._calculate_population_fitness(individuals)
+            individuals = self._order_population_by_fitness(individuals, direction, weights, self._get_number_of_top_individuals(len(individuals)))
+            if self._is_evaluation_stopped or self._check_stop_max_evaluations(self._max_evaluations):
+                best_individual, best_score = self._get_best_individual(individuals)
+                self.results.add_generation_results(generation, best_score, best_individual)
+                if self.verbose >= 1: logger.info('STOPPING OPTIMIZATION...')
+                return generation, individuals
+
+        for generation in range(generation + 1, num_generations):
             elite_individuals = self._get_elite(individuals)
             parents = self._run_selection(individuals)
-            individuals = self._run_crossover_with_mutation(parents)
+            individuals = self._deduplicate_childs(self._run_crossover_with_mutation(parents))
             individuals.extend(elite_individuals)
-            individuals = self._create_new_individuals(individuals, objective)
-            individuals = self._calculate_population_fitness(individuals, n_jobs)
-            individuals = self._order_population_by_fitness(individuals, direction, weights)
-            best_individual = individuals[0].get_name_genome_genes()
-            best_score = individuals[0].fitness
+            individuals = self._create_new_individuals(individuals)
+            number_of_evaluations = self._number_of_evaluations
+            individuals = self._calculate_population_fitness(individuals, generation)
+            individuals = self._order_population_by_fitness(individuals, direction, weights, self._get_number_of_top_individuals(len(individuals)))
+            best_individual, best_score = self._get_best_individual(individuals)
             self.results.add_generation_results(generation, best_score, best_individual)
             
             stop_timeout_criteria = self._check_stop_timeout(timeout, start_time)
             stop_score_criteria = self._check_stop_score(stop_score, best_score, direction)
             stop_num_generations_criteria = self._check_num_generations_criteria(num_generations, generation)
+            stop_max_evaluations_criteria = self._check_stop_max_evaluations(self._max_evaluations)
+            # every genome of the generation was already evaluated, so the search space cannot provide new ones
+            stop_search_space_exhausted_criteria = self._number_of_evaluations == number_of_evaluations
             if self.verbose >= 1:
                 logger.info(f'THE BEST SOLUTION IN GENERATION {generation} IS {best_individual} WITH A SCORE OF {best_score}')
                 if stop_timeout_criteria:
@@ -233,16 +868,94 @@ class Environment:
                     logger.info('SCORE STOP CRITERIA SATISFIED.')
                 if stop_num_generations_criteria:
                     logger.info('NUM GENERATIONS CRITERIA SATISFIED.')
-            if stop_timeout_criteria or stop_score_criteria or stop_num_generations_criteria:
+                if stop_max_evaluations_criteria:
+                    logger.info('MAX EVALUATIONS CRITERIA SATISFIED.')
+                if stop_search_space_exhausted_criteria:
+                    logger.info('SEARCH SPACE EXHAUSTED, NO NEW INDIVIDUALS LEFT TO EVALUATE.')
+            if stop_timeout_criteria or stop_score_criteria or stop_num_generations_criteria or stop_max_evaluations_criteria or stop_search_space_exhausted_criteria or self._is_evaluation_stopped:
                 if self.verbose >= 1: logger.info('STOPPING OPTIMIZATION...')
                 break
+            self._check_checkpoint(generation, individuals, start_time)
+
+        return generation, individuals
+
+    def optimize(self, objective: Callable[[dict], Union[int,float, Tuple[Union[int, float]]]], direction: Union[str, List[str]], weights: List[Union[int, float]] = None, score_names: Union[str, List[str]] = None, num_generations: int = None, timeout: int = None, stop_score: Union[float, int] = None, n_jobs: int = 1, backend: str = 'process', batch: bool = False, batch_format: str = 'dict', mode: str = 'generational', checkpoint_path: str = None, checkpoint_every: int = None, checkpoint_interval: float = None, worker_setup: Callable[[], Any] = None, evaluation_log_path: str = None, eval_timeout: float = None, error_policy: str = 'raise', penalty_fitness: Union[int, float, Tuple[Union[int, float]]] = None, max_evaluations: int = None) -> Results:
+        start_time = time.time()
+        self._number_of_evaluations = 0
+        if self._checkpoint_state != None:
+            start_time -= self._checkpoint_state['elapsed_time']
+            self._number_of_evaluations = self._checkpoint_state['number_of_evaluations']
+        if checkpoint_path != None and checkpoint_every == None and checkpoint_interval == None:
+            checkpoint_every = 1
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_every = checkpoint_every
+        self._checkpoint_interval = checkpoint_interval
+        self._last_checkpoint_time = time.time()
+        num_generations, timeout, stop_score = self._check_stop_criterias(num_generations, timeout, stop_score, max_evaluations)
+        weights = self._get_weights(direction, weights)
+        if batch_format not in SUPPORTED_BATCH_FORMATS:
+            raise Exception(f'Batch format {batch_format} not supported. Must be one of {SUPPORTED_BATCH_FORMATS}.')
+        if mode not in SUPPORTED_MODES:
+            raise Exception(f'Mode {mode} not supported. Must be one of {SUPPORTED_MODES}.')
+        elif mode == 'steady-state' and batch:
+            raise Exception(f'Batch objectives are not supported in steady-state mode.')
+        if eval_timeout != None and batch:
+            raise Exception(f'eval_timeout is not supported with batch objectives.')
+        if error_policy != 'raise' and batch:
+            raise Exception(f'Error policy {error_policy} is not supported with batch objectives.')
+        max_retries = self._get_max_retries(error_policy)
+        self._batch = batch
+        self._batch_format = batch_format
+        self._timeout = timeout
+        self._stop_score = stop_score
+        self._max_evaluations = max_evaluations
+        self._eval_timeout = eval_timeout
+        self._error_policy = error_policy
+        self._penalty_fitness = self._get_penalty_fitness(direction, penalty_fitness) if eval_timeout != None or error_policy != 'raise' else None
+        self._direction = direction
+        self._start_time = start_time
+        self._is_evaluation_stopped = False
+        self._penalized_genomes = set()
+
+        if worker_setup != None:
+            objective = ContextObjective(objective)
+        if batch:
+            backend, n_jobs = 'serial', 1
+        self._objective = objective
+        if evaluation_log_path != None:
+            self._evaluation_log = EvaluationLog(evaluation_log_path, search_space=self.search_space, append=self._checkpoint_state != None)
+        try:
+            with Executor(backend, n_jobs, worker_setup, self._shared_data.descriptors, eval_timeout, error_policy != 'raise', max_retries) as self._executor:
+                if mode == 'steady-state':
+                    generation = self._run_steady_state_optimization(direction, weights, num_generations, timeout, stop_score, start_time)
+                    individuals = self._population
+                else:
+                    generation, individuals = self._run_generational_optimization(direction, weights, num_generations, timeout, stop_score, start_time)
+        finally:
+            if self._evaluation_log != None:
+                self._evaluation_log.close()
+                self._evaluation_log = None
+        self._checkpoint_state = None
+        if self.ordering_type == 'partial':
+            individuals = self._order_population_by_fitness(individuals, direction, weights)
+        best_individual, best_score = self._get_best_individual(individuals)
 
         end_time = time.time()
         self.results.execution_time = end_time - start_time
+        self.results.number_of_evaluations = self._number_of_evaluations
+        self.results.evaluations_per_second = self._number_of_evaluations / max(end_time - start_time, 1e-9)
         self.results.best_score = best_score
         self.results.best_individual = best_individual
-        self.results.create_last_generation_individuals_dataframe(generation, individuals, score_names)
-        self.results.sort_best_per_generation_dataframe(direction, weights, score_names)
+        self.results.cache_hits = self._fitness_cache.hits
+        self.results.cache_misses = self._fitness_cache.misses
+        self.results.cache_savings = self._fitness_cache.hits / max(self._fitness_cache.hits + self._number_of_evaluations, 1)
+        self.results.evaluation_log_path = evaluation_log_path
+        individuals = self._get_decoded_individuals(individuals)
+        self.results.create_last_generation_individuals_dataframe(generation, individuals, self.search_space.names, score_names)
+        if isinstance(direction, list):
+            pareto_front = [individuals[i] for i in get_pareto_front_indexes([individual.fitness for individual in individuals], direction)]
+            self.results.create_pareto_front_dataframe(pareto_front, self.search_space.names, score_names)
+        if len(self.results.best_per_generation_dataframe) > 0:
+            self.results.sort_best_per_generation_dataframe(direction, weights, score_names)
 
         return self.results
-
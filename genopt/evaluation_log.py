@@ -0,0 +1,153 @@
+import os
+import re
+import glob
+import pandas as pd
+
+from typing import List, Tuple, Union
+from genopt.search_space import SearchSpace, INT_GENE, FLOAT_GENE, BINARY_GENE
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+SUPPORTED_LOG_FORMATS = ['csv', 'parquet']
+
+class EvaluationLog:
+    def __init__(self, path: str, log_format: str = None, buffer_size: int = 10000, search_space: SearchSpace = None, append: bool = False):
+        if log_format == None:
+            log_format = os.path.splitext(path)[1].lstrip('.').lower()
+        if log_format not in SUPPORTED_LOG_FORMATS:
+            raise Exception(f'Evaluation log format {log_format} not supported. Must be one of {SUPPORTED_LOG_FORMATS}.')
+        if log_format == 'parquet' and pa == None:
+            raise Exception(f'Parquet evaluation logs require pyarrow. Install it with pip install pyarrow or use a csv path.')
+        if buffer_size < 1:
+            raise Exception(f'buffer_size must be a positive integer.')
+        self.path = path
+        self.log_format = log_format
+        self.buffer_size = buffer_size
+        self.search_space = search_space
+        self.append = append
+        self.number_of_evaluations = 0
+        self._columns = dict()
+        self._number_of_buffered_evaluations = 0
+        self._number_of_flushes = 0
+        self._writer = None
+
+    def __enter__(self) -> 'EvaluationLog':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.number_of_evaluations
+
+    def add(self, generation: int, genome_gene_names: dict, fitness: Union[int, float, Tuple[Union[int, float]]], wall_time: float, worker_id: str) -> None:
+        evaluation = {'generation': generation}
+        evaluation.update(genome_gene_names)
+        if isinstance(fitness, tuple):
+            for i, score in enumerate(fitness):
+                evaluation[f'score_{i}'] = score
+        else:
+            evaluation['score'] = fitness
+        evaluation['wall_time'] = wall_time
+        evaluation['worker_id'] = worker_id
+        for name, value in evaluation.items():
+            self._columns.setdefault(name, list()).append(value)
+
+        self.number_of_evaluations += 1
+        self._number_of_buffered_evaluations += 1
+        if self._number_of_buffered_evaluations >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._number_of_buffered_evaluations == 0:
+            return
+        df_evaluations = pd.DataFrame(self._columns)
+        if self.log_format == 'csv':
+            is_appending = self._number_of_flushes > 0 or (self.append and os.path.exists(self.path) and os.path.getsize(self.path) > 0)
+            df_evaluations.to_csv(self.path, mode='a' if is_appending else 'w', header=is_appending == False, index=False)
+        else:
+            df_evaluations.columns = [str(name) for name in df_evaluations.columns]
+            if self._writer == None:
+                self._writer = pq.ParquetWriter(self._get_parquet_write_path(), self._get_parquet_schema(df_evaluations))
+            for field in self._writer.schema:
+                if field.type == pa.string():
+                    df_evaluations[field.name] = df_evaluations[field.name].astype(str)
+            table = pa.Table.from_pandas(df_evaluations, schema=self._writer.schema, preserve_index=False)
+            self._writer.write_table(table)
+        self._columns = dict()
+        self._number_of_buffered_evaluations = 0
+        self._number_of_flushes += 1
+
+    def _get_gene_types(self) -> dict:
+        gene_types = dict()
+        if self.search_space == None:
+            return gene_types
+        for i, name in enumerate(self.search_space.names):
+            if self.search_space.types[i] in [INT_GENE, BINARY_GENE]:
+                gene_types[str(name)] = pa.int64()
+            elif self.search_space.types[i] == FLOAT_GENE:
+                gene_types[str(name)] = pa.float64()
+            else:
+                try:
+                    gene_types[str(name)] = pa.array(self.search_space.choices[i]).type
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    gene_types[str(name)] = pa.string()
+
+        return gene_types
+
+    def _get_parquet_schema(self, df_evaluations: pd.DataFrame) -> 'pa.Schema':
+        # scores and wall times are always float64, so a later chunk with floats or inf penalties fits the schema of the first one
+        gene_types = self._get_gene_types()
+        inferred_schema = pa.Schema.from_pandas(df_evaluations, preserve_index=False)
+        fields = list()
+        for name in df_evaluations.columns:
+            if name == 'generation':
+                fields.append(pa.field(name, pa.int64()))
+            elif name == 'worker_id':
+                fields.append(pa.field(name, pa.string()))
+            elif name in gene_types:
+                fields.append(pa.field(name, gene_types[name]))
+            elif name == 'score' or name == 'wall_time' or re.fullmatch(r'score_\d+', name):
+                fields.append(pa.field(name, pa.float64()))
+            else:
+                fields.append(inferred_schema.field(name))
+
+        return pa.schema(fields)
+
+    def _get_parquet_write_path(self) -> str:
+        part_paths = EvaluationLog._get_part_paths(self.path)
+        if self.append and os.path.exists(self.path):
+            root, extension = os.path.splitext(self.path)
+            return f'{root}.part-{len(part_paths) + 1}{extension}'
+        for part_path in part_paths:
+            os.remove(part_path)
+
+        return self.path
+
+    @staticmethod
+    def _get_part_paths(path: str) -> List[str]:
+        root, extension = os.path.splitext(path)
+        part_paths = glob.glob(f'{glob.escape(root)}.part-*{glob.escape(extension)}')
+
+        return sorted(part_paths, key=lambda part_path: int(re.search(r'\.part-(\d+)', part_path[len(root):]).group(1)))
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer != None:
+            self._writer.close()
+            self._writer = None
+
+    @staticmethod
+    def load(path: str, log_format: str = None) -> pd.DataFrame:
+        if log_format == None:
+            log_format = os.path.splitext(path)[1].lstrip('.').lower()
+        if log_format == 'csv':
+            return pd.read_csv(path, float_precision='round_trip')
+        elif log_format == 'parquet':
+            return pd.concat([pd.read_parquet(part_path) for part_path in [path] + EvaluationLog._get_part_paths(path)], ignore_index=True)
+        else:
+            raise Exception(f'Evaluation log format {log_format} not supported. Must be one of {SUPPORTED_LOG_FORMATS}.')
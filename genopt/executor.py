@@ -0,0 +1,360 @@
+import time
+import queue
+import threading
+import traceback
+import multiprocessing
+
+from collections import deque
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Tuple
+from multiprocessing import Pool, cpu_count, current_process
+from multiprocessing.connection import Connection, wait
+from multiprocessing.pool import ThreadPool
+from genopt.shared_data import attach_shared_data, detach_shared_data
+
+SUPPORTED_BACKENDS = ['process', 'thread', 'serial']
+EVAL_TIMEOUT_POLL_INTERVAL = 0.05
+_worker_state = threading.local()
+
+class EvaluationError:
+    def __init__(self, worker_id: str, wall_time: float, error: str, traceback: str):
+        self.worker_id = worker_id
+        self.wall_time = wall_time
+        self.error = error
+        self.traceback = traceback
+        self.attempts = 1
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(worker_id={self.worker_id}, wall_time={self.wall_time}, error={self.error})'
+
+class EvaluationTimeout(EvaluationError):
+    def __init__(self, worker_id: str, wall_time: float):
+        super().__init__(worker_id, wall_time, 'EvaluationTimeout', f'Evaluation was killed after {wall_time:.3f} seconds.')
+
+def _initialize_worker(worker_setup: Callable[[], Any], shared_data: dict) -> None:
+    attach_shared_data(shared_data)
+    _worker_state.context = worker_setup() if worker_setup != None else None
+
+def _run_task(function: Callable[[Any], Any], item: Any, catch_errors: bool = False) -> Any:
+    if catch_errors == False:
+        return function(item)
+    start_time = time.perf_counter()
+    try:
+        return function(item)
+    except Exception as error:
+        return EvaluationError(get_worker_id(), time.perf_counter() - start_time, repr(error), traceback.format_exc())
+
+def _run_worker(connection: Connection, worker_setup: Callable[[], Any], shared_data: dict) -> None:
+    _initialize_worker(worker_setup, shared_data)
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task == None:
+            break
+        task_number, function, item, catch_errors = task
+        connection.send(('started', task_number, time.time()))
+        try:
+            result, error = _run_task(function, item, catch_errors), None
+        except Exception as exception:
+            result, error = None, exception
+        try:
+            connection.send(('finished', task_number, result, error))
+        except Exception as exception:
+            # results or errors that cannot be pickled are reported instead of killing the worker
+            connection.send(('finished', task_number, None, Exception(f'Evaluation result could not be sent: {exception!r}')))
+    connection.close()
+
+class _Worker:
+    def __init__(self, name: str, worker_setup: Callable[[], Any], shared_data: dict):
+        # every worker owns its pipe, so killing it can never leave a lock shared with other workers held
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_run_worker, args=(worker_connection, worker_setup, shared_data), name=name, daemon=True)
+        self.process.start()
+        worker_connection.close()
+        self.task_number = None
+        self.start_time = None
+
+    @property
+    def is_idle(self) -> bool:
+        return self.task_number == None
+
+    def run(self, task_number: int, function: Callable[[Any], Any], item: Any, catch_errors: bool) -> None:
+        self.task_number = task_number
+        self.start_time = None
+        self.connection.send((task_number, function, item, catch_errors))
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join()
+        self.connection.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+def get_worker_context() -> Any:
+    return getattr(_worker_state, 'context', None)
+
+def get_worker_id() -> str:
+    if current_process().name != 'MainProcess':
+        return current_process().name
+    else:
+        return threading.current_thread().name
+
+class ContextObjective:
+    def __init__(self, objective: Callable[[dict, Any], Any]):
+        self.objective = objective
+
+    def __call__(self, individual: dict) -> Any:
+        return self.objective(individual, get_worker_context())
+
+class Executor:
+    def __init__(self, backend: str = 'process', n_jobs: int = 1, worker_setup: Callable[[], Any] = None, shared_data: dict = None, eval_timeout: float = None, catch_errors: bool = False, max_retries: int = 0):
+        if backend not in SUPPORTED_BACKENDS:
+            raise Exception(f'Backend {backend} not supported. Must be one of {SUPPORTED_BACKENDS}.')
+        if n_jobs == -1: n_jobs = cpu_count()
+        if n_jobs < 1:
+            raise Exception(f'n_jobs must be -1 or a positive integer.')
+        if eval_timeout != None and eval_timeout <= 0:
+            raise Exception(f'eval_timeout must be a positive number of seconds.')
+        if eval_timeout != None and backend != 'process':
+            raise Exception(f'eval_timeout requires the process backend, since only worker processes can be terminated.')
+        if max_retries < 0:
+            raise Exception(f'max_retries must be a non negative integer.')
+        if max_retries > 0 and catch_errors == False:
+            raise Exception(f'max_retries requires catch_errors.')
+        self.backend = backend
+        self.n_jobs = n_jobs
+        self.worker_setup = worker_setup
+        self.shared_data = shared_data if shared_data != None else dict()
+        self.eval_timeout = eval_timeout
+        self.catch_errors = catch_errors
+        self.max_retries = max_retries
+        self._pool = None
+        self._workers = list()
+        self._number_of_started_workers = 0
+        self._completed_tasks = queue.Queue()
+        self._pending_tasks = deque()
+        self._submitted_tasks = dict()
+        self._finished_task_numbers = set()
+        self._finished_task_lock = threading.Lock()
+        self._number_of_submitted_tasks = 0
+        self.number_of_killed_workers = 0
+        self.number_of_crashed_workers = 0
+        self.number_of_retries = 0
+        self.retry_budget = None
+
+    def __enter__(self) -> 'Executor':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown(wait=exc_type == None)
+
+    @property
+    def is_tracked(self) -> bool:
+        # tracked evaluations run on managed worker processes, so hanging or crashed workers can be detected and replaced.
+        # A single job only catching errors runs in process, so objectives that cannot be pickled keep working
+        return self.backend == 'process' and (self.eval_timeout != None or (self.catch_errors and self.n_jobs > 1))
+
+    @property
+    def is_parallel(self) -> bool:
+        return self.backend != 'serial' and (self.n_jobs > 1 or self.is_tracked)
+
+    @property
+    def is_running(self) -> bool:
+        return self._pool != None or len(self._workers) > 0
+
+    def _start_worker(self) -> _Worker:
+        self._number_of_started_workers += 1
+        return _Worker(f'GenoptWorker-{self._number_of_started_workers}', self.worker_setup, self.shared_data)
+
+    def start(self) -> None:
+        self._completed_tasks = queue.Queue()
+        self._pending_tasks = deque()
+        self._submitted_tasks = dict()
+        self._finished_task_numbers = set()
+        if self.is_running == False and self.is_parallel:
+            if self.backend == 'process' and self.is_tracked:
+                self._workers = [self._start_worker() for _ in range(self.n_jobs)]
+            elif self.backend == 'process':
+                self._pool = Pool(self.n_jobs, initializer=_initialize_worker, initargs=(self.worker_setup, self.shared_data))
+            elif self.backend == 'thread':
+                attach_shared_data(self.shared_data)
+                self._pool = ThreadPool(self.n_jobs, initializer=_initialize_worker, initargs=(self.worker_setup, self.shared_data))
+        elif self.is_running == False:
+            _initialize_worker(self.worker_setup, self.shared_data)
+
+    def map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        if self.is_running == False and self.catch_errors == False:
+            return [function(item) for item in items]
+        elif self._pool != None and self.eval_timeout == None and self.catch_errors == False:
+            return self._pool.map(function, items)
+        else:
+            items = list(items)
+            results = [None] * len(items)
+            for i, result in self.imap_unordered(function, items):
+                results[i] = result
+            return results
+
+    def imap_unordered(self, function: Callable[[Any], Any], items: List[Any], timeout: float = None) -> Iterator[Tuple[int, Any]]:
+        deadline = time.time() + timeout if timeout != None else None
+        for i, item in enumerate(items):
+            self.submit(function, item, i)
+        for _ in range(len(items)):
+            try:
+                yield self.get_completed(max(deadline - time.time(), 0) if deadline != None else None)
+            except queue.Empty:
+                return
+
+    def _submit_task(self, function: Callable[[Any], Any], item: Any, task_id: Hashable, attempt: int) -> None:
+        task_number = self._number_of_submitted_tasks
+        self._number_of_submitted_tasks += 1
+        self._submitted_tasks[task_number] = (function, item, task_id, attempt)
+        if self._pool == None:
+            self._pending_tasks.append(task_number)
+            self._dispatch_pending_tasks()
+        else:
+            self._pool.apply_async(
+                _run_task,
+                (function, item, self.catch_errors),
+                callback=lambda result: self._put_finished_task(task_number, result, None),
+                error_callback=lambda error: self._put_finished_task(task_number, None, error)
+            )
+
+    def submit(self, function: Callable[[Any], Any], item: Any, task_id: Hashable) -> None:
+        self._submit_task(function, item, task_id, 0)
+
+    def _run_pending_task(self) -> None:
+        task_number = self._pending_tasks.popleft()
+        function, item, _, _ = self._submitted_tasks[task_number]
+        try:
+            self._put_finished_task(task_number, _run_task(function, item, self.catch_errors), None)
+        except Exception as error:
+            self._put_finished_task(task_number, None, error)
+
+    def _put_finished_task(self, task_number: int, result: Any, error: Exception) -> None:
+        with self._finished_task_lock:
+            if task_number in self._finished_task_numbers:
+                return
+            self._finished_task_numbers.add(task_number)
+        self._completed_tasks.put((task_number, result, error))
+
+    def _dispatch_pending_tasks(self) -> None:
+        for worker in self._workers:
+            if len(self._pending_tasks) == 0:
+                break
+            if worker.is_idle:
+                task_number = self._pending_tasks.popleft()
+                function, item, _, _ = self._submitted_tasks[task_number]
+                worker.run(task_number, function, item, self.catch_errors)
+
+    def _replace_worker(self, worker: _Worker, result: EvaluationError) -> None:
+        self._put_finished_task(worker.task_number, result, None)
+        worker.kill()
+        self._workers[self._workers.index(worker)] = self._start_worker()
+
+    def _receive_worker_messages(self, worker: _Worker) -> bool:
+        try:
+            while worker.connection.poll():
+                message = worker.connection.recv()
+                if message[0] == 'started':
+                    worker.start_time = message[2]
+                else:
+                    _, task_number, result, error = message
+                    worker.task_number = None
+                    worker.start_time = None
+                    self._put_finished_task(task_number, result, error)
+        except (EOFError, OSError):
+            return False
+
+        return True
+
+    def _check_workers(self, timeout: float) -> None:
+        now = time.time()
+        if self.eval_timeout != None:
+            for worker in self._workers:
+                if worker.start_time != None:
+                    timeout = min(timeout, max(worker.start_time + self.eval_timeout - now, 0))
+        wait([worker.connection for worker in self._workers] + [worker.process.sentinel for worker in self._workers], timeout)
+        for worker in list(self._workers):
+            is_connected = self._receive_worker_messages(worker)
+            if worker.is_idle and is_connected and worker.process.exitcode == None:
+                continue
+            wall_time = time.time() - worker.start_time if worker.start_time != None else 0
+            if worker.is_idle:
+                self._workers[self._workers.index(worker)] = self._start_worker()
+                worker.kill()
+            elif is_connected == False or worker.process.exitcode != None:
+                self.number_of_crashed_workers += 1
+                crash = EvaluationError(worker.process.name, wall_time, 'WorkerCrash', f'Worker process {worker.process.name} died during the evaluation.')
+                self._replace_worker(worker, crash)
+            elif self.eval_timeout != None and worker.start_time != None and wall_time >= self.eval_timeout:
+                self.number_of_killed_workers += 1
+                self._replace_worker(worker, EvaluationTimeout(worker.process.name, wall_time))
+
+    def _get_managed_finished_task(self, deadline: float = None) -> Tuple[int, Any, Exception]:
+        while True:
+            self._dispatch_pending_tasks()
+            try:
+                return self._completed_tasks.get_nowait()
+            except queue.Empty:
+                if deadline != None and time.time() >= deadline:
+                    raise
+            wait_time = EVAL_TIMEOUT_POLL_INTERVAL if deadline == None else min(EVAL_TIMEOUT_POLL_INTERVAL, max(deadline - time.time(), 0))
+            self._check_workers(wait_time)
+
+    def _get_finished_task(self, deadline: float = None) -> Tuple[int, Any, Exception]:
+        if len(self._workers) > 0:
+            return self._get_managed_finished_task(deadline)
+        if self._completed_tasks.empty() and len(self._pending_tasks) > 0 and (deadline == None or time.time() < deadline):
+            self._run_pending_task()
+        return self._completed_tasks.get(timeout=max(deadline - time.time(), 0) if deadline != None else None)
+
+    def _is_retryable(self, result: Any, attempt: int) -> bool:
+        if self.retry_budget != None and self.retry_budget <= 0:
+            return False
+        return isinstance(result, EvaluationError) and isinstance(result, EvaluationTimeout) == False and attempt < self.max_retries
+
+    def get_completed(self, timeout: float = None) -> Tuple[Hashable, Any]:
+        deadline = time.time() + timeout if timeout != None else None
+        while True:
+            task_number, result, error = self._get_finished_task(deadline)
+            function, item, task_id, attempt = self._submitted_tasks.pop(task_number)
+            if self._is_retryable(result, attempt) == False:
+                break
+            self.number_of_retries += 1
+            if self.retry_budget != None:
+                self.retry_budget -= 1
+            self._submit_task(function, item, task_id, attempt + 1)
+        if error != None:
+            raise error
+        if isinstance(result, EvaluationError):
+            result.attempts = attempt + 1
+
+        return task_id, result
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool != None:
+            if wait:
+                self._pool.close()
+            else:
+                self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        for worker in self._workers:
+            if wait and worker.is_idle:
+                worker.stop()
+            else:
+                worker.kill()
+        self._workers = list()
+        self._pending_tasks.clear()
+        self._submitted_tasks.clear()
+        self._finished_task_numbers.clear()
+        _worker_state.context = None
+        detach_shared_data()
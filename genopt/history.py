@@ -0,0 +1,139 @@
+import sys
+import math
+import array
+import hashlib
+import numpy as np
+
+from typing import Hashable, Union
+
+SUPPORTED_HISTORY_TYPES = ['digest', 'bloom']
+
+class GenomeHistory:
+    def __init__(self, max_size: Union[int, None] = None, history_type: str = 'digest', false_positive_rate: float = 0.001):
+        if history_type not in SUPPORTED_HISTORY_TYPES:
+            raise Exception(f'History type {history_type} not supported. Must be one of {SUPPORTED_HISTORY_TYPES}.')
+        if max_size != None and max_size < 1:
+            raise Exception(f'History max_size must be None or a positive integer.')
+        if history_type == 'bloom' and max_size == None:
+            raise Exception(f'Bloom history requires a max_size to size the filter.')
+        if false_positive_rate <= 0 or false_positive_rate >= 1:
+            raise Exception(f'History false_positive_rate must be between 0 and 1.')
+        self.max_size = max_size
+        self.history_type = history_type
+        self.false_positive_rate = false_positive_rate
+        self._number_of_genomes = 0
+        if history_type == 'bloom':
+            self._number_of_bits = max(math.ceil(-max_size * math.log(false_positive_rate) / math.log(2) ** 2), 8)
+            self._number_of_hashes = max(round(self._number_of_bits / max_size * math.log(2)), 1)
+            self._bits = np.zeros((self._number_of_bits + 7) // 8, dtype=np.uint8)
+        elif max_size != None:
+            # open addressing table kept at most half full, so its memory is fixed by max_size
+            self._digest_table = array.array('Q', bytes(8 << max(math.ceil(math.log2(2 * max_size)), 3)))
+            self._digest_queue = array.array('Q', bytes(8 * max_size))
+        else:
+            self._digests = set()
+
+    def __len__(self) -> int:
+        if self.history_type == 'bloom':
+            return self._number_of_genomes
+        elif self.max_size != None:
+            return min(self._number_of_genomes, self.max_size)
+        else:
+            return len(self._digests)
+
+    def __contains__(self, genome: Hashable) -> bool:
+        if self.history_type == 'bloom':
+            positions = self._get_bit_positions(genome)
+            return all(self._bits[position >> 3] & (0x80 >> (position & 7)) for position in positions)
+        elif self.max_size != None:
+            return self._find_digest_slot(self._get_table_digest(genome))[1]
+        else:
+            return self._get_digest(genome) in self._digests
+
+    @property
+    def nbytes(self) -> int:
+        if self.history_type == 'bloom':
+            return self._bits.nbytes
+        elif self.max_size != None:
+            return self._digest_table.itemsize * len(self._digest_table) + self._digest_queue.itemsize * len(self._digest_queue)
+        else:
+            return sys.getsizeof(self._digests) + sum(sys.getsizeof(digest) for digest in self._digests)
+
+    def _get_genome_bytes(self, genome: Hashable) -> bytes:
+        if isinstance(genome, bytes):
+            return genome
+        else:
+            return np.asarray(genome, dtype=np.float64).tobytes()
+
+    def _get_digest(self, genome: Hashable) -> int:
+        return int.from_bytes(hashlib.blake2b(self._get_genome_bytes(genome), digest_size=8).digest(), 'little')
+
+    def _get_table_digest(self, genome: Hashable) -> int:
+        # zero marks an empty slot of the digest table
+        return max(self._get_digest(genome), 1)
+
+    def _find_digest_slot(self, digest: int) -> tuple:
+        mask = len(self._digest_table) - 1
+        slot = digest & mask
+        while True:
+            value = self._digest_table[slot]
+            if value == 0:
+                return slot, False
+            elif value == digest:
+                return slot, True
+            slot = (slot + 1) & mask
+
+    def _remove_digest(self, digest: int) -> None:
+        slot, is_found = self._find_digest_slot(digest)
+        if is_found == False:
+            return
+        mask = len(self._digest_table) - 1
+        self._digest_table[slot] = 0
+        next_slot = (slot + 1) & mask
+        while self._digest_table[next_slot] != 0:
+            value = self._digest_table[next_slot]
+            # shift back the digests whose probe sequence crosses the emptied slot
+            if (next_slot - (value & mask)) & mask >= (next_slot - slot) & mask:
+                self._digest_table[slot] = value
+                self._digest_table[next_slot] = 0
+                slot = next_slot
+            next_slot = (next_slot + 1) & mask
+
+    def _get_bit_positions(self, genome: Hashable) -> list:
+        digest = hashlib.blake2b(self._get_genome_bytes(genome), digest_size=16).digest()
+        hash_1 = int.from_bytes(digest[:8], 'little')
+        hash_2 = int.from_bytes(digest[8:], 'little') | 1
+
+        return [(hash_1 + i * hash_2) % self._number_of_bits for i in range(self._number_of_hashes)]
+
+    def add(self, genome: Hashable) -> None:
+        if self.history_type == 'bloom':
+            if genome not in self:
+                for position in self._get_bit_positions(genome):
+                    self._bits[position >> 3] |= 0x80 >> (position & 7)
+                self._number_of_genomes += 1
+        elif self.max_size != None:
+            digest = self._get_table_digest(genome)
+            slot, is_found = self._find_digest_slot(digest)
+            if is_found == False:
+                position = self._number_of_genomes % self.max_size
+                if self._number_of_genomes >= self.max_size:
+                    self._remove_digest(self._digest_queue[position])
+                    slot, _ = self._find_digest_slot(digest)
+                self._digest_table[slot] = digest
+                self._digest_queue[position] = digest
+                self._number_of_genomes += 1
+        else:
+            digest = self._get_digest(genome)
+            if digest not in self._digests:
+                self._digests.add(digest)
+                self._number_of_genomes += 1
+
+    def clear(self) -> None:
+        self._number_of_genomes = 0
+        if self.history_type == 'bloom':
+            self._bits[:] = 0
+        elif self.max_size != None:
+            self._digest_table = array.array('Q', bytes(8 * len(self._digest_table)))
+        else:
+            self._digests.clear()
@@ -1,14 +1,14 @@
 import numpy as np
 
 from typing import Callable, Union
+from genopt.search_space import SearchSpace, FLOAT_GENE
 
 class Individual:
-    def __init__(self, params: dict, search_space_type: str, objective: Callable[[dict], Union[int,float]]):
-        self.params = params
-        self.search_space_type = search_space_type
-        self.objective = objective
-        self._genome = list()
-        self._fitness = None
+    __slots__ = ('_genome', '_fitness')
+
+    def __init__(self, genome: list = None, fitness: Union[int, float] = None):
+        self._genome = genome if genome is not None else list()
+        self._fitness = fitness
     
     def __len__(self) -> int:
         return len(self._genome)
@@ -29,30 +29,17 @@ class Individual:
     def genome(self, genome: list) -> None:
         self._genome = genome
 
-    def initialize_genome(self) -> list:
-        if self.search_space_type == 'flexible_search':
-            for _, values in self.params.items():
-                if values['type'] == 'int':
-                    self._genome.append(np.random.randint(values['low'], values['high'] + 1))
-                elif values['type'] == 'float':
-                    self._genome.append(np.random.uniform(values['low'], values['high']))
-                elif values['type'] == 'categorical':
-                    self._genome.append(np.random.choice(values['choices']))
-                else:
-                    raise ValueError(f'Type {values["type"]} not supported.')
-        else:
-            for _, values in self.params.items():
-                self._genome.append(np.random.choice(values))
+    def initialize_genome(self, search_space: SearchSpace) -> list:
+        for i in range(len(search_space)):
+            if search_space.types[i] == FLOAT_GENE:
+                self._genome.append(np.random.uniform(search_space.lows[i], search_space.highs[i]))
+            else:
+                self._genome.append(np.random.randint(int(search_space.lows[i]), int(search_space.highs[i]) + 1))
         
         return self._genome
     
-    def get_name_genome_genes(self) -> dict:
-        genome_gene_names = {}
-        names = list(self.params.keys())
-        for name, gene in zip(names, self._genome):
-            genome_gene_names[name] = gene
-        
-        return genome_gene_names
+    def get_name_genome_genes(self, search_space: SearchSpace) -> dict:
+        return search_space.decode_genome(self._genome)
     
-    def calculate_fitness(self) -> None:
-        self.fitness = self.objective(self.get_name_genome_genes())
\ No newline at end of file
+    def calculate_fitness(self, objective: Callable[[dict], Union[int,float]], search_space: SearchSpace) -> None:
+        self.fitness = objective(self.get_name_genome_genes(search_space))
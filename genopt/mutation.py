@@ -1,144 +1,107 @@
 import numpy as np
 
+from typing import Tuple
 from genopt.individual import Individual
+from genopt.population import Population
+from genopt.search_space import SearchSpace, FLOAT_GENE, BINARY_GENE
 
 class Mutation:
     __instance = None
 
     @staticmethod
-    def getInstance(mutation_type: str, prob_mutation: float, search_space_type: str, params: dict):
-        if Mutation.__instance == None:
-            Mutation(mutation_type, prob_mutation, search_space_type, params)
+    def getInstance(mutation_type: str, prob_mutation: float, search_space: SearchSpace):
+        if Mutation.__instance == None or Mutation.__instance.search_space != search_space or Mutation.__instance.mutation_type != mutation_type or Mutation.__instance.prob_mutation != prob_mutation:
+            Mutation(mutation_type, prob_mutation, search_space)
         return Mutation.__instance 
 
-    def __init__(self, mutation_type: str, prob_mutation: float, search_space_type: str, params: dict):
+    def __init__(self, mutation_type: str, prob_mutation: float, search_space: SearchSpace):
         Mutation.__instance = self
         self.mutation_type = mutation_type
         self.prob_mutation = prob_mutation
-        self.search_space_type = search_space_type
-        self.params = params
+        self.search_space = search_space
 
-    def _mutate_fixed_binary_param(self, child_genome, gene_index, param):
-        if self.params.get(param)[0] != child_genome[gene_index]:
-            child_genome[gene_index] = self.params.get(param)[0]
-        else:
-            child_genome[gene_index] = self.params.get(param)[1]
-        
-        return child_genome
-    
-    def _mutate_flexible_int_param(self, child_genome, gene_index, param):
-        if self.params[param]['low'] == 0 and self.params[param]['high'] == 1:
-            if child_genome[gene_index] == 0:
-                child_genome[gene_index] = 1
-            else:
-                child_genome[gene_index] = 0
-        else:
-            keep_mutating = True
-            while keep_mutating:
-                new_gene = np.random.randint(self.params[param]['low'], (self.params[param]['high'] + 1))
-                if new_gene != child_genome[gene_index]:
-                    keep_mutating = False
-            child_genome[gene_index] = new_gene
+    def _mutate_int_gene(self, gene: int, low: int, high: int) -> int:
+        number_of_values = high - low + 1
+        if number_of_values < 2:
+            return gene
 
-        return child_genome
-    
-    def _mutate_flexible_categorical_param(self, child_genome, gene_index, param):
-        if len(self.params.get(param).get('choices')) == 2:
-            if self.params.get(param).get('choices')[0] != child_genome[gene_index]:
-                child_genome[gene_index] = self.params.get(param).get('choices')[0]
-            else:
-                child_genome[gene_index] = self.params.get(param).get('choices')[1]
-        else:
-            keep_mutating = True
-            while keep_mutating:
-                new_gene = np.random.choice(self.params.get(param).get('choices'))
-                if new_gene != child_genome[gene_index]:
-                    keep_mutating = False
-            child_genome[gene_index] = new_gene
-        
-        return child_genome
-    
-    def _mutate_fixed_non_binary_param(self, child_genome, gene_index, param):
-        keep_mutating = True
-        while keep_mutating:
-            new_gene = np.random.choice(self.params.get(param))
-            if isinstance(new_gene, str):
-                if (new_gene == child_genome[gene_index]) == False:
-                    keep_mutating = False
-            else:
-                if new_gene != child_genome[gene_index]:
-                    keep_mutating = False
-        child_genome[gene_index] = new_gene
+        return low + (gene - low + np.random.randint(1, number_of_values)) % number_of_values
 
-        return child_genome
-    
-    def _fixed_search_mutation_process(self, child: Individual, gene_index: int, param: str) -> Individual:
-        child_genome = child.genome
-        if len(self.params.get(param)) == 2:
-            child_genome = self._mutate_fixed_binary_param(child_genome, gene_index, param)
+    def _mutate_gene(self, child_genome: list, gene_index: int) -> list:
+        gene_type = self.search_space.types[gene_index]
+        if gene_type == FLOAT_GENE:
+            child_genome[gene_index] = np.random.uniform(self.search_space.lows[gene_index], self.search_space.highs[gene_index])
+        elif gene_type == BINARY_GENE:
+            child_genome[gene_index] = 1 - child_genome[gene_index]
         else:
-            child_genome = self._mutate_fixed_non_binary_param(child_genome, gene_index, param)
-        child.genome = child_genome
-        
-        return child
+            child_genome[gene_index] = self._mutate_int_gene(child_genome[gene_index], int(self.search_space.lows[gene_index]), int(self.search_space.highs[gene_index]))
 
-    def _flexible_search_mutation_process(self, child: Individual, gene_index: int, param: str) -> Individual:
-        child_genome = child.genome
-        if self.params.get(param).get('type') == 'int':
-            child_genome = self._mutate_flexible_int_param(child_genome, gene_index, param)
-        elif self.params.get(param).get('type') == 'float':
-            child_genome[gene_index] = np.random.uniform(self.params[param]['low'], self.params[param]['high'])
-        elif self.params.get(param).get('type') == 'categorical':
-            child_genome = self._mutate_flexible_categorical_param(child_genome, gene_index, param)
-        child.genome = child_genome
-        
-        return child
-
-    def _single_mutation_in_fixed_search(self, child: Individual) -> Individual:
-        gene_index = np.random.randint(0,  len(child))
-        param = list(self.params.keys())[gene_index]
-        child = self._fixed_search_mutation_process(child, gene_index, param)
-            
-        return child
+        return child_genome
 
-    def _single_mutation_in_flexible_search(self, child: Individual) -> Individual:
+    def _single_gene_mutation(self, child: Individual) -> Individual:
         gene_index = np.random.randint(0, len(child))
-        param = list(self.params.keys())[gene_index]
-        child = self._flexible_search_mutation_process(child, gene_index, param)
-        
-        return child
+        child.genome = self._mutate_gene(child.genome, gene_index)
 
-    def _multiple_mutation_in_fixed_search(self, child: Individual) -> Individual:
-        number_of_mutations = np.random.randint(1, len(child))
-        gene_indexes = np.random.randint(0, len(child), size=number_of_mutations)
-        for gene_index in gene_indexes:
-            param = list(self.params.keys())[gene_index]
-            child = self._fixed_search_mutation_process(child, gene_index, param)
-        
         return child
-                
-    def _multiple_mutation_in_flexible_search(self, child: Individual) -> Individual:
+
+    def _multiple_genes_mutation(self, child: Individual) -> Individual:
         number_of_mutations = np.random.randint(1, len(child))
         gene_indexes = np.random.randint(0, len(child), size=number_of_mutations)
         for gene_index in gene_indexes:
-            param = list(self.params.keys())[gene_index]
-            child = self._flexible_search_mutation_process(child, gene_index, param)
-        
+            child.genome = self._mutate_gene(child.genome, gene_index)
+
         return child
 
+    def _get_population_mutation_indexes(self, child_indexes: np.ndarray, number_of_genes: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self.mutation_type == 'single-gene':
+            gene_indexes = np.random.randint(0, number_of_genes, size=len(child_indexes))
+        elif self.mutation_type == 'multiple-genes':
+            number_of_mutations = np.random.randint(1, number_of_genes, size=len(child_indexes))
+            child_indexes = np.repeat(child_indexes, number_of_mutations)
+            gene_indexes = np.random.randint(0, number_of_genes, size=len(child_indexes))
+            unique_mutations = np.unique(child_indexes * number_of_genes + gene_indexes)
+            child_indexes, gene_indexes = np.divmod(unique_mutations, number_of_genes)
+        else:
+            raise Exception(f'Mutation type {self.mutation_type} not supported.')
+
+        return child_indexes, gene_indexes
+
+    def force_mutate_population(self, childs: Population, child_indexes: np.ndarray) -> Population:
+        search_space = childs.search_space
+        child_indexes, gene_indexes = self._get_population_mutation_indexes(np.asarray(child_indexes, dtype=np.int64), len(search_space))
+        gene_types = search_space.types[gene_indexes]
+        is_float_gene = gene_types == FLOAT_GENE
+        is_bit_gene = gene_types == BINARY_GENE
+
+        float_childs, float_genes = child_indexes[is_float_gene], gene_indexes[is_float_gene]
+        childs.float_genes[float_childs, search_space.block_indexes[float_genes]] = np.random.uniform(search_space.lows[float_genes], search_space.highs[float_genes])
+
+        bit_childs, bit_columns = child_indexes[is_bit_gene], search_space.block_indexes[gene_indexes[is_bit_gene]]
+        np.bitwise_xor.at(childs.bit_genes, (bit_childs, bit_columns // 8), (0x80 >> (bit_columns % 8)).astype(np.uint8))
+
+        is_int_gene = ~(is_float_gene | is_bit_gene)
+        int_childs, int_genes = child_indexes[is_int_gene], gene_indexes[is_int_gene]
+        int_columns = search_space.block_indexes[int_genes]
+        lows = search_space.lows[int_genes].astype(np.int64)
+        number_of_values = search_space.highs[int_genes].astype(np.int64) - lows + 1
+        offsets = np.floor(np.random.rand(len(int_genes)) * (number_of_values - 1)).astype(np.int64) + 1
+        childs.int_genes[int_childs, int_columns] = lows + (childs.int_genes[int_childs, int_columns] - lows + offsets) % number_of_values
+
+        return childs
+
+    def mutate_population(self, childs: Population) -> Population:
+        return self.force_mutate_population(childs, np.flatnonzero(np.random.rand(len(childs)) < self.prob_mutation))
+
+    def force_mutate(self, child: Individual) -> Individual:
+        if self.mutation_type == 'single-gene':
+            return self._single_gene_mutation(child)
+        elif self.mutation_type == 'multiple-genes':
+            return self._multiple_genes_mutation(child)
+        else:
+            raise Exception(f'Mutation type {self.mutation_type} not supported.')
+
     def mutate(self, child: Individual) -> Individual:
         if np.random.rand() < self.prob_mutation:
-            if self.mutation_type == 'single-gene':
-                if self.search_space_type == 'fixed_search':
-                    return self._single_mutation_in_fixed_search(child)
-                else:
-                    return self._single_mutation_in_flexible_search(child)
-            elif self.mutation_type == 'multiple-genes':
-                if self.search_space_type == 'fixed_search':
-                    return self._multiple_mutation_in_fixed_search(child)
-                else:
-                    return self._multiple_mutation_in_flexible_search(child)
-            else:
-                raise Exception(f'Mutation type {self.mutation_type} not supported.')
+            return self.force_mutate(child)
         else:
-            return child
\ No newline at end of file
+            return child
@@ -25,4 +25,8 @@ class Parameters:
         elif isinstance(high, float) == False and isinstance(high, int) == False:
             raise Exception(f'High must be a number.')
         else:
-            return {'type': 'float', 'low': low, 'high': high}
\ No newline at end of file
+            return {'type': 'float', 'low': low, 'high': high}
+
+    @staticmethod
+    def suggest_binary() -> dict:
+        return {'type': 'binary'}
@@ -0,0 +1,94 @@
+import numpy as np
+
+from typing import List
+
+DOMINATION_CHUNK_SIZE = 256
+
+def get_minimization_scores(fitnesses: list, direction: List[str]) -> np.ndarray:
+    scores = np.asarray(fitnesses, dtype=np.float64).reshape(len(fitnesses), -1)
+    if scores.shape[1] != len(direction):
+        raise Exception(f'Direction does not match number of fitness values.')
+    signs = np.empty(len(direction), dtype=np.float64)
+    for i, objective_direction in enumerate(direction):
+        if objective_direction == 'minimize':
+            signs[i] = 1
+        elif objective_direction == 'maximize':
+            signs[i] = -1
+        else:
+            raise Exception(f'Direction {objective_direction} not supported.')
+
+    return scores * signs
+
+def _get_domination_chunk(scores: np.ndarray, start: int, end: int) -> np.ndarray:
+    chunk_scores = scores[start:end]
+    later_scores = scores[start:]
+    is_not_worse = np.ones((len(chunk_scores), len(later_scores)), dtype=bool)
+    is_better = np.zeros((len(chunk_scores), len(later_scores)), dtype=bool)
+    for i in range(scores.shape[1]):
+        is_not_worse &= chunk_scores[:, i, None] <= later_scores[None, :, i]
+        is_better |= chunk_scores[:, i, None] < later_scores[None, :, i]
+    dominated = np.zeros((len(chunk_scores), len(scores)), dtype=bool)
+    dominated[:, start:] = is_not_worse & is_better
+
+    return dominated
+
+def get_non_dominated_ranks(scores: np.ndarray) -> np.ndarray:
+    # a score can only be dominated by scores that precede it in lexicographic order
+    order = np.lexsort(scores.T[::-1])
+    scores = scores[order]
+    number_of_scores = len(scores)
+    domination_counts = np.zeros(number_of_scores, dtype=np.int64)
+    dominated_bits = np.empty((number_of_scores, (number_of_scores + 7) // 8), dtype=np.uint8)
+    for start in range(0, number_of_scores, DOMINATION_CHUNK_SIZE):
+        dominated = _get_domination_chunk(scores, start, start + DOMINATION_CHUNK_SIZE)
+        domination_counts += dominated.sum(axis=0)
+        dominated_bits[start:start + DOMINATION_CHUNK_SIZE] = np.packbits(dominated, axis=1)
+
+    ranks = np.full(number_of_scores, -1, dtype=np.int64)
+    front = np.flatnonzero(domination_counts == 0)
+    rank = 0
+    while len(front) > 0:
+        ranks[front] = rank
+        for start in range(0, len(front), DOMINATION_CHUNK_SIZE):
+            front_bits = dominated_bits[front[start:start + DOMINATION_CHUNK_SIZE]]
+            domination_counts -= np.unpackbits(front_bits, axis=1, count=number_of_scores).sum(axis=0, dtype=np.int64)
+        front = np.flatnonzero((domination_counts == 0) & (ranks == -1))
+        rank += 1
+    unsorted_ranks = np.empty(number_of_scores, dtype=np.int64)
+    unsorted_ranks[order] = ranks
+
+    return unsorted_ranks
+
+def get_crowding_distances(scores: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    distances = np.zeros(len(scores), dtype=np.float64)
+    if len(scores) == 0:
+        return distances
+    for i in range(scores.shape[1]):
+        order = np.lexsort((scores[:, i], ranks))
+        sorted_ranks = ranks[order]
+        sorted_scores = scores[order, i]
+        is_front_change = sorted_ranks[1:] != sorted_ranks[:-1]
+        is_first = np.concatenate(([True], is_front_change))
+        is_last = np.concatenate((is_front_change, [True]))
+        front_ids = np.cumsum(is_first) - 1
+        spans = (sorted_scores[is_last] - sorted_scores[is_first])[front_ids]
+
+        is_inner = ~(is_first | is_last) & (spans > 0)
+        inner_distances = np.zeros(len(scores), dtype=np.float64)
+        inner_distances[1:-1] = sorted_scores[2:] - sorted_scores[:-2]
+        distances[order[is_inner]] += inner_distances[is_inner] / spans[is_inner]
+        distances[order[is_first | is_last]] = np.inf
+
+    return distances
+
+def get_pareto_order(fitnesses: list, direction: List[str]) -> np.ndarray:
+    scores = get_minimization_scores(fitnesses, direction)
+    ranks = get_non_dominated_ranks(scores)
+    distances = get_crowding_distances(scores, ranks)
+
+    return np.lexsort((-distances, ranks))
+
+def get_pareto_front_indexes(fitnesses: list, direction: List[str]) -> np.ndarray:
+    ranks = get_non_dominated_ranks(get_minimization_scores(fitnesses, direction))
+
+    return np.flatnonzero(ranks == 0)
@@ -0,0 +1,46 @@
+import numpy as np
+
+from typing import List, Union
+from genopt.individual import Individual
+from genopt.search_space import SearchSpace
+
+class Population:
+    def __init__(self, search_space: SearchSpace, int_genes: np.ndarray, float_genes: np.ndarray, fitness: list = None, bit_genes: np.ndarray = None):
+        self.search_space = search_space
+        self.int_genes = int_genes
+        self.float_genes = float_genes
+        self.bit_genes = bit_genes if bit_genes is not None else np.zeros((len(int_genes), search_space.number_of_bit_bytes), dtype=np.uint8)
+        self.fitness = fitness if fitness is not None else [None] * len(int_genes)
+
+    def __len__(self) -> int:
+        return len(self.int_genes)
+
+    def __getitem__(self, indexes: Union[int, slice, np.ndarray, List[int]]) -> 'Population':
+        if isinstance(indexes, slice):
+            fitness = self.fitness[indexes]
+        else:
+            indexes = np.atleast_1d(indexes)
+            fitness = [self.fitness[i] for i in indexes]
+
+        return Population(self.search_space, self.int_genes[indexes], self.float_genes[indexes], fitness, self.bit_genes[indexes])
+
+    @staticmethod
+    def initialize(search_space: SearchSpace, number_of_genomes: int) -> 'Population':
+        int_genes, float_genes = search_space.sample(number_of_genomes)
+
+        return Population(search_space, int_genes, float_genes, bit_genes=search_space.sample_bits(number_of_genomes))
+
+    def extend(self, population: 'Population') -> None:
+        self.int_genes = np.concatenate([self.int_genes, population.int_genes])
+        self.float_genes = np.concatenate([self.float_genes, population.float_genes])
+        self.bit_genes = np.concatenate([self.bit_genes, population.bit_genes])
+        self.fitness = self.fitness + population.fitness
+
+    def get_genome_key(self, index: int) -> bytes:
+        return self.int_genes[index].tobytes() + self.float_genes[index].tobytes() + self.bit_genes[index].tobytes()
+
+    def get_name_genome_genes(self, index: int) -> dict:
+        return self.search_space.decode(self.int_genes[index], self.float_genes[index], self.bit_genes[index])
+
+    def to_individuals(self) -> List[Individual]:
+        return [Individual(list(self.get_name_genome_genes(i).values()), self.fitness[i]) for i in range(len(self))]
@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 import datetime
 
 from typing import Union, List
 from genopt.individual import Individual
-from genopt.utils import rename_best_score_name_by_index, define_weights_by_default_if_not_defined, calculate_weighted_sum_score_by_index, normalize_best_score_by_index
+from genopt.evaluation_log import EvaluationLog
+from genopt.utils import rename_best_score_name_by_index, define_weights_by_default_if_not_defined, calculate_weighted_sum_scores
 
 SCORE_COLUMN_DEFAULT_NAME = 'best_score'
 
@@ -12,8 +14,17 @@ class Results:
         self._best_score = None
         self._best_individual = None
         self._execution_time = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_savings = 0
+        self._number_of_evaluations = 0
+        self._evaluations_per_second = None
+        self._evaluation_log_path = None
         self._last_generation_individuals_dataframe = pd.DataFrame()
         self._best_per_generation_dataframe = pd.DataFrame()
+        self._best_per_generation_columns = dict()
+        self._pareto_front_dataframe = pd.DataFrame()
+        self._evaluation_errors_columns = dict()
     
     @property
     def best_score(self):
@@ -27,13 +38,57 @@ class Results:
     def best_individual(self):
         return self._best_individual
     
+    @property
+    def cache_hits(self):
+        return self._cache_hits
+    
+    @property
+    def cache_misses(self):
+        return self._cache_misses
+    
+    @property
+    def cache_savings(self):
+        return self._cache_savings
+    
+    @property
+    def number_of_evaluations(self):
+        return self._number_of_evaluations
+    
+    @property
+    def evaluations_per_second(self):
+        return self._evaluations_per_second
+    
+    @property
+    def evaluation_log_path(self):
+        return self._evaluation_log_path
+    
     @property
     def last_generation_individuals_dataframe(self):
         return self._last_generation_individuals_dataframe
     
     @property
     def best_per_generation_dataframe(self):
+        if len(self._best_per_generation_columns) > 0:
+            df_generation_results = pd.DataFrame(self._best_per_generation_columns)
+            if len(self._best_per_generation_dataframe) > 0:
+                df_generation_results = pd.concat([self._best_per_generation_dataframe, df_generation_results], axis=0, ignore_index=True)
+            self._best_per_generation_dataframe = df_generation_results
+            self._best_per_generation_columns = dict()
         return self._best_per_generation_dataframe
+
+    @property
+    def pareto_front_dataframe(self):
+        return self._pareto_front_dataframe
+
+    @property
+    def evaluation_errors_dataframe(self):
+        return pd.DataFrame(self._evaluation_errors_columns)
+
+    def load_evaluation_log(self) -> pd.DataFrame:
+        if self.evaluation_log_path == None:
+            raise Exception(f'The optimization was run without evaluation_log_path.')
+
+        return EvaluationLog.load(self.evaluation_log_path)
     
     @best_score.setter
     def best_score(self, best_score):
@@ -51,6 +106,34 @@ class Results:
     def best_individual(self, best_individual):
         self._best_individual = best_individual
     
+    @cache_hits.setter
+    def cache_hits(self, cache_hits):
+        self._cache_hits = cache_hits
+    
+    @cache_misses.setter
+    def cache_misses(self, cache_misses):
+        self._cache_misses = cache_misses
+    
+    @cache_savings.setter
+    def cache_savings(self, cache_savings):
+        self._cache_savings = cache_savings
+    
+    @number_of_evaluations.setter
+    def number_of_evaluations(self, number_of_evaluations):
+        self._number_of_evaluations = number_of_evaluations
+    
+    @evaluations_per_second.setter
+    def evaluations_per_second(self, evaluations_per_second):
+        self._evaluations_per_second = evaluations_per_second
+    
+    @pareto_front_dataframe.setter
+    def pareto_front_dataframe(self, pareto_front_dataframe):
+        self._pareto_front_dataframe = pareto_front_dataframe
+    
+    @evaluation_log_path.setter
+    def evaluation_log_path(self, evaluation_log_path):
+        self._evaluation_log_path = evaluation_log_path
+    
     @last_generation_individuals_dataframe.setter
     def last_generation_individuals_dataframe(self, last_generation_individuals_dataframe):
         self._last_generation_individuals_dataframe = last_generation_individuals_dataframe
@@ -58,34 +141,47 @@ class Results:
     @best_per_generation_dataframe.setter
     def best_per_generation_dataframe(self, best_per_generation_dataframe):
         self._best_per_generation_dataframe = best_per_generation_dataframe
+        self._best_per_generation_columns = dict()
         
     def add_generation_results(self, generation: int, best_score: Union[int, float], best_individual: dict) -> None:
         generation_results = {'generation': generation, 'best_score': best_score}
         generation_results.update(best_individual)
-        values = [list(generation_results.values())]
-        columns = list(generation_results.keys())
-        df_generation_results = pd.DataFrame(values, columns=columns)
-        self.best_per_generation_dataframe = pd.concat([self.best_per_generation_dataframe, df_generation_results], axis=0)
-    
-    def create_last_generation_individuals_dataframe(self, generation: int, last_generation_individuals: List[Individual], score_names: Union[None, str, List[str]]) -> None:
-        for individual in last_generation_individuals:
-            generation_results = {'generation': generation, 'best_score': individual.fitness}
-            generation_results.update(individual.get_name_genome_genes())
-            values = [list(generation_results.values())]
-            columns = list(generation_results.keys())
-            df_individual_result = pd.DataFrame(values, columns=columns)
-            self.last_generation_individuals_dataframe = pd.concat([self.last_generation_individuals_dataframe, df_individual_result])
+        for name, value in generation_results.items():
+            self._best_per_generation_columns.setdefault(name, list()).append(value)
+    
+    def add_evaluation_error(self, generation: int, individual: dict, worker_id: str, error: str, traceback: str, attempts: int) -> None:
+        evaluation_error = {'generation': generation}
+        evaluation_error.update(individual)
+        evaluation_error.update({'worker_id': worker_id, 'error': error, 'traceback': traceback, 'attempts': attempts})
+        for name, value in evaluation_error.items():
+            self._evaluation_errors_columns.setdefault(name, list()).append(value)
+
+    def create_last_generation_individuals_dataframe(self, generation: int, last_generation_individuals: List[Individual], param_names: List[str], score_names: Union[None, str, List[str]]) -> None:
+        fitnesses = [individual.fitness for individual in last_generation_individuals]
+        columns = {'generation': [generation] * len(last_generation_individuals), 'best_score': fitnesses}
+        for i, name in enumerate(param_names):
+            columns[name] = [individual.genome[i] for individual in last_generation_individuals]
 
         if isinstance(score_names, str):
-            self.last_generation.rename({
-                SCORE_COLUMN_DEFAULT_NAME: score_names
-            }, inplace=True)
+            columns[score_names] = columns.pop(SCORE_COLUMN_DEFAULT_NAME)
+            columns = {name: columns[name] for name in ['generation', score_names] + param_names}
         elif isinstance(score_names, list):
-            number_of_fitnesses = len(self.best_per_generation_dataframe['best_score'].iloc[0])
-            for i in  range(number_of_fitnesses):
-                self.last_generation_individuals_dataframe[f'best_score_{i}'] = self.last_generation_individuals_dataframe['best_score'].apply(lambda best_score: best_score[i])
-                self.last_generation_individuals_dataframe = rename_best_score_name_by_index(self.last_generation_individuals_dataframe, score_names, i)
-            self.last_generation_individuals_dataframe.drop('best_score', axis=1, inplace=True)
+            columns.pop(SCORE_COLUMN_DEFAULT_NAME)
+            for score_name, scores in zip(score_names, zip(*fitnesses)):
+                columns[score_name] = list(scores)
+        self.last_generation_individuals_dataframe = pd.DataFrame(columns)
+
+    def create_pareto_front_dataframe(self, pareto_front_individuals: List[Individual], param_names: List[str], score_names: Union[None, List[str]]) -> None:
+        columns = dict()
+        for i, name in enumerate(param_names):
+            columns[name] = [individual.genome[i] for individual in pareto_front_individuals]
+        fitnesses = [individual.fitness for individual in pareto_front_individuals]
+        number_of_fitnesses = len(fitnesses[0]) if len(fitnesses) > 0 else 0
+        if score_names == None:
+            score_names = [f'{SCORE_COLUMN_DEFAULT_NAME}_{i}' for i in range(number_of_fitnesses)]
+        for i, score_name in enumerate(score_names):
+            columns[score_name] = [fitness[i] for fitness in fitnesses]
+        self.pareto_front_dataframe = pd.DataFrame(columns)
 
     def _sort_best_per_generation_dataframe_by_single_objective(self, direction: str, score_names: Union[str, None]) -> None:
         if direction == 'maximize':
@@ -101,21 +197,20 @@ class Results:
             }, inplace=True)
 
     def _sort_best_per_generation_dataframe_by_multiple_objectives(self, direction: List[str], weights: Union[List[float], None], score_names: Union[List[str], None]) -> None:
+        weights = define_weights_by_default_if_not_defined(weights, direction)
         if len(direction) == len(weights):
             number_of_fitnesses = len(self.best_per_generation_dataframe['best_score'].iloc[0])
             if number_of_fitnesses != len(direction):
                 raise Exception(f'Direction and weights do not match number of fitness values.')
             if score_names != None and number_of_fitnesses != len(score_names):
                 raise Exception(f'Score_names does not match number of fitness values.')
-            weights = define_weights_by_default_if_not_defined(weights, direction)
+            best_scores = self.best_per_generation_dataframe['best_score'].tolist()
             for i in range(number_of_fitnesses):
-                self.best_per_generation_dataframe[f'best_score_{i}'] = self.best_per_generation_dataframe['best_score'].apply(lambda best_score: best_score[i])
-                self.best_per_generation_dataframe = normalize_best_score_by_index(self.best_per_generation_dataframe, direction, i)
+                self.best_per_generation_dataframe[f'best_score_{i}'] = [best_score[i] for best_score in best_scores]
                 self.best_per_generation_dataframe = rename_best_score_name_by_index(self.best_per_generation_dataframe, score_names, i)
-                self.best_per_generation_dataframe = calculate_weighted_sum_score_by_index(self.best_per_generation_dataframe, weights, i)
-                self.best_per_generation_dataframe.drop(f'normalized_best_score_{i}', axis=1, inplace=True)
-            self.best_per_generation_dataframe = self.best_per_generation_dataframe.sort_values(by='overall_best_score', ascending=False)
-            self.best_per_generation_dataframe.drop(['best_score', 'overall_best_score'], axis=1, inplace=True)
+            overall_best_scores = calculate_weighted_sum_scores(best_scores, direction, weights)
+            self.best_per_generation_dataframe = self.best_per_generation_dataframe.iloc[np.argsort(-overall_best_scores, kind='stable')]
+            self.best_per_generation_dataframe = self.best_per_generation_dataframe.drop('best_score', axis=1)
         else:
             raise Exception(f'Direction length does not match weights length.')
             
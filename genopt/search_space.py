@@ -0,0 +1,166 @@
+import numpy as np
+
+from typing import List, Tuple
+from genopt.datatype_inference import DataTypeInference
+
+INT_GENE = 0
+FLOAT_GENE = 1
+CATEGORICAL_GENE = 2
+BINARY_GENE = 3
+
+class SearchSpace:
+    def __init__(self, params: dict):
+        self.params = params
+        self.search_space_type = DataTypeInference.infer_search_space_type(params)
+        self.names = list(params.keys())
+        self.types = np.empty(len(self.names), dtype=np.int8)
+        self.lows = np.zeros(len(self.names), dtype=np.float64)
+        self.highs = np.zeros(len(self.names), dtype=np.float64)
+        self.choices = list()
+        self.choice_codes = list()
+        for i, name in enumerate(self.names):
+            if self.search_space_type == 'fixed_search':
+                self._compile_categorical_gene(i, list(params[name]))
+            elif params[name]['type'] == 'int':
+                self.types[i] = INT_GENE
+                self.lows[i] = params[name]['low']
+                self.highs[i] = params[name]['high']
+                self.choices.append(None)
+                self.choice_codes.append(None)
+            elif params[name]['type'] == 'float':
+                self.types[i] = FLOAT_GENE
+                self.lows[i] = params[name]['low']
+                self.highs[i] = params[name]['high']
+                self.choices.append(None)
+                self.choice_codes.append(None)
+            elif params[name]['type'] == 'categorical':
+                self._compile_categorical_gene(i, list(params[name]['choices']))
+            elif params[name]['type'] == 'binary':
+                self.types[i] = BINARY_GENE
+                self.lows[i] = 0
+                self.highs[i] = 1
+                self.choices.append(None)
+                self.choice_codes.append(None)
+            else:
+                raise ValueError(f'Type {params[name]["type"]} not supported.')
+
+        self.int_indexes = np.flatnonzero((self.types == INT_GENE) | (self.types == CATEGORICAL_GENE))
+        self.float_indexes = np.flatnonzero(self.types == FLOAT_GENE)
+        self.bit_indexes = np.flatnonzero(self.types == BINARY_GENE)
+        self.number_of_bit_bytes = (len(self.bit_indexes) + 7) // 8
+        self.block_indexes = np.empty(len(self.names), dtype=np.int64)
+        self.block_indexes[self.int_indexes] = np.arange(len(self.int_indexes))
+        self.block_indexes[self.float_indexes] = np.arange(len(self.float_indexes))
+        self.block_indexes[self.bit_indexes] = np.arange(len(self.bit_indexes))
+        self._int_names = [self.names[i] for i in self.int_indexes]
+        self._float_names = [self.names[i] for i in self.float_indexes]
+        self._bit_names = [self.names[i] for i in self.bit_indexes]
+        self._categorical_genes = [(i, self.names[i], self.block_indexes[i], self.choices[i]) for i in np.flatnonzero(self.types == CATEGORICAL_GENE)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _compile_categorical_gene(self, i: int, choices: list) -> None:
+        self.types[i] = CATEGORICAL_GENE
+        self.lows[i] = 0
+        self.highs[i] = len(choices) - 1
+        self.choices.append(choices)
+        self.choice_codes.append({choice: code for code, choice in enumerate(choices)})
+
+    def sample(self, number_of_genomes: int) -> Tuple[np.ndarray, np.ndarray]:
+        int_lows = self.lows[self.int_indexes].astype(np.int64)
+        int_highs = self.highs[self.int_indexes].astype(np.int64)
+        int_genes = np.random.randint(int_lows, int_highs + 1, size=(number_of_genomes, len(self.int_indexes)))
+        float_genes = np.random.uniform(self.lows[self.float_indexes], self.highs[self.float_indexes], size=(number_of_genomes, len(self.float_indexes)))
+
+        return int_genes.astype(np.int64), float_genes
+
+    def sample_bits(self, number_of_genomes: int) -> np.ndarray:
+        bit_genes = np.random.randint(0, 256, size=(number_of_genomes, self.number_of_bit_bytes), dtype=np.uint8)
+
+        return self.clear_bit_padding(bit_genes)
+
+    def clear_bit_padding(self, bit_genes: np.ndarray) -> np.ndarray:
+        number_of_padding_bits = 8 * self.number_of_bit_bytes - len(self.bit_indexes)
+        if number_of_padding_bits > 0:
+            bit_genes[:, -1] &= np.uint8((0xFF << number_of_padding_bits) & 0xFF)
+
+        return bit_genes
+
+    def unpack_bits(self, bit_genes: np.ndarray) -> np.ndarray:
+        return np.unpackbits(bit_genes, axis=-1, count=len(self.bit_indexes))
+
+    def pack_bits(self, bits: np.ndarray) -> np.ndarray:
+        return np.packbits(np.asarray(bits, dtype=bool), axis=-1)
+
+    def decode(self, int_genes: np.ndarray, float_genes: np.ndarray, bit_genes: np.ndarray = None) -> dict:
+        genome_gene_names = dict.fromkeys(self.names)
+        genome_gene_names.update(zip(self._int_names, int_genes))
+        genome_gene_names.update(zip(self._float_names, float_genes))
+        if len(self.bit_indexes) > 0:
+            genome_gene_names.update(zip(self._bit_names, self.unpack_bits(bit_genes).tolist()))
+        for _, name, block_index, choices in self._categorical_genes:
+            genome_gene_names[name] = choices[int_genes[block_index]]
+
+        return genome_gene_names
+
+    def decode_genome(self, genome: list) -> dict:
+        genome_gene_names = dict(zip(self.names, genome))
+        for i, name, _, choices in self._categorical_genes:
+            genome_gene_names[name] = choices[genome[i]]
+
+        return genome_gene_names
+
+    def encode_genome(self, genome_gene_names: dict) -> list:
+        genome = [genome_gene_names[name] for name in self.names]
+        for i, name, _, _ in self._categorical_genes:
+            if genome[i] not in self.choice_codes[i]:
+                raise Exception(f'Value {genome[i]} is not a valid choice for param {name}.')
+            genome[i] = self.choice_codes[i][genome[i]]
+
+        return genome
+
+    def decode_columns(self, int_genes: np.ndarray, float_genes: np.ndarray, bit_genes: np.ndarray = None) -> dict:
+        bits = self.unpack_bits(bit_genes).astype(np.int64) if len(self.bit_indexes) > 0 else None
+        genome_gene_columns = {}
+        for i, name in enumerate(self.names):
+            if self.types[i] == FLOAT_GENE:
+                genome_gene_columns[name] = float_genes[:, self.block_indexes[i]]
+            elif self.types[i] == BINARY_GENE:
+                genome_gene_columns[name] = bits[:, self.block_indexes[i]]
+            elif self.types[i] == INT_GENE:
+                genome_gene_columns[name] = int_genes[:, self.block_indexes[i]]
+            else:
+                genome_gene_columns[name] = np.asarray(self.choices[i])[int_genes[:, self.block_indexes[i]]]
+
+        return genome_gene_columns
+
+    def encode(self, genome_gene_names: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+        int_genes = np.empty((len(genome_gene_names), len(self.int_indexes)), dtype=np.int64)
+        float_genes = np.empty((len(genome_gene_names), len(self.float_indexes)), dtype=np.float64)
+        for i, name in enumerate(self.names):
+            if self.types[i] == BINARY_GENE:
+                continue
+            values = [genes[name] for genes in genome_gene_names]
+            if self.types[i] == FLOAT_GENE:
+                float_genes[:, self.block_indexes[i]] = values
+            elif self.types[i] == INT_GENE:
+                int_genes[:, self.block_indexes[i]] = values
+            else:
+                for j, value in enumerate(values):
+                    if value not in self.choice_codes[i]:
+                        raise Exception(f'Value {value} is not a valid choice for param {name}.')
+                    int_genes[j, self.block_indexes[i]] = self.choice_codes[i][value]
+
+        return int_genes, float_genes
+
+    def encode_bits(self, genome_gene_names: List[dict]) -> np.ndarray:
+        bits = np.empty((len(genome_gene_names), len(self.bit_indexes)), dtype=bool)
+        for j, i in enumerate(self.bit_indexes):
+            values = [genes[self.names[i]] for genes in genome_gene_names]
+            for value in values:
+                if value not in (0, 1):
+                    raise Exception(f'Value {value} is not a valid binary value for param {self.names[i]}.')
+            bits[:, j] = values
+
+        return self.pack_bits(bits)
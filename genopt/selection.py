@@ -1,4 +1,3 @@
-import random
 import numpy as np
 
 from typing import List, Tuple
@@ -9,7 +8,7 @@ class Selection:
 
     @staticmethod
     def getInstance(selection_type: str, tournament_size: int):
-        if Selection.__instance == None:
+        if Selection.__instance == None or Selection.__instance.selection_type != selection_type or Selection.__instance.tournament_size != tournament_size:
             Selection(selection_type, tournament_size)
         return Selection.__instance 
 
@@ -18,42 +17,31 @@ class Selection:
         self.selection_type = selection_type
         self.tournament_size = tournament_size
 
-    def _roulette_selection(self, individuals: List[Individual], number_of_parents: int) -> List[Tuple[Individual, Individual]]:
-        all_parents = list()
-        for _ in range(number_of_parents):
-            weights = np.arange(len(individuals), 0, step=-1)
-            parents = random.choices(
-                population=individuals,
-                weights=weights,
-                k=2
-            )
-            all_parents.append(parents)
-
-        return all_parents
-
-    def _tournament_selection(self, individuals: List[Individual], number_of_parents: int) -> List[Tuple[Individual, Individual]]:
-        all_parents = list()
-        for _ in range(number_of_parents):
-            indexes = sorted(np.random.randint(0, len(individuals) - 1, size=self.tournament_size))
-            all_parents.append([individuals[indexes[0]], individuals[indexes[1]]])
-
-        return all_parents
+    def _roulette_selection(self, number_of_individuals: int, number_of_parents: int) -> np.ndarray:
+        cumulative_weights = np.cumsum(np.arange(number_of_individuals, 0, step=-1, dtype=np.float64))
+        draws = np.random.rand(number_of_parents, 2) * cumulative_weights[-1]
+
+        return np.searchsorted(cumulative_weights, draws, side='right')
+
+    def _tournament_selection(self, number_of_individuals: int, number_of_parents: int) -> np.ndarray:
+        tournaments = np.random.randint(0, number_of_individuals - 1, size=(number_of_parents, self.tournament_size))
+
+        return np.sort(tournaments, axis=1)[:, :2]
     
-    def _ranking_selection(self, individuals: List[Individual], number_of_parents: int) -> List[Tuple[Individual, Individual]]:
-        all_parents = list()
-        parent_individual = iter(range(number_of_parents))
-        parents = zip(parent_individual, parent_individual)
-        for parent_index_1, parent_index_2 in parents:
-            all_parents.append([individuals[parent_index_1], individuals[parent_index_2]])
-        
-        return all_parents
-
-    def selection(self, individuals: List[Individual], number_of_parents: int) -> List[Individual]:
+    def _ranking_selection(self, number_of_individuals: int, number_of_parents: int) -> np.ndarray:
+        return np.arange(number_of_parents - number_of_parents % 2).reshape(-1, 2)
+
+    def get_parent_indexes(self, number_of_individuals: int, number_of_parents: int) -> np.ndarray:
         if self.selection_type == 'tournament':
-            return self._tournament_selection(individuals, number_of_parents)
+            return self._tournament_selection(number_of_individuals, number_of_parents)
         elif self.selection_type == 'roulette':
-            return self._roulette_selection(individuals, number_of_parents)
+            return self._roulette_selection(number_of_individuals, number_of_parents)
         elif self.selection_type == 'ranking':
-            return self._ranking_selection(individuals, number_of_parents)
+            return self._ranking_selection(number_of_individuals, number_of_parents)
         else:
-            raise Exception(f'Selection {self.selection_type} not supported.')
\ No newline at end of file
+            raise Exception(f'Selection {self.selection_type} not supported.')
+
+    def selection(self, individuals: List[Individual], number_of_parents: int) -> List[Tuple[Individual, Individual]]:
+        parent_indexes = self.get_parent_indexes(len(individuals), number_of_parents)
+
+        return [[individuals[parent_index_1], individuals[parent_index_2]] for parent_index_1, parent_index_2 in parent_indexes]
@@ -0,0 +1,114 @@
+import os
+import shutil
+import weakref
+import tempfile
+import numpy as np
+import pandas as pd
+
+from typing import Any, Union
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+SUPPORTED_STORAGES = ['shared_memory', 'memmap']
+_attached_data = dict()
+
+def _attach_array(descriptor: tuple) -> Any:
+    if descriptor[0] == 'shared_memory':
+        _, block_name, shape, dtype = descriptor
+        block = shared_memory.SharedMemory(name=block_name)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        array.flags.writeable = False
+        return block, array
+    else:
+        _, path = descriptor
+        return None, np.asarray(np.load(path, mmap_mode='r'))
+
+def attach_shared_data(descriptors: dict) -> None:
+    for name, descriptor in descriptors.items():
+        if name not in _attached_data:
+            if descriptor['type'] == 'ndarray':
+                block, array = _attach_array(descriptor['data'])
+                _attached_data[name] = ([block], array)
+            else:
+                blocks = list()
+                columns = dict()
+                for column, column_descriptor in descriptor['columns'].items():
+                    block, columns[column] = _attach_array(column_descriptor)
+                    blocks.append(block)
+                block, index = _attach_array(descriptor['index'])
+                blocks.append(block)
+                _attached_data[name] = (blocks, pd.DataFrame(columns, index=index, copy=False))
+
+def detach_shared_data() -> None:
+    _attached_data.clear()
+
+def get_shared_data(name: str) -> Union[np.ndarray, pd.DataFrame]:
+    if name not in _attached_data:
+        raise Exception(f'Shared data {name} does not exist. Register it with Environment.share_data before optimizing.')
+
+    return _attached_data[name][1]
+
+class SharedData:
+    def __init__(self):
+        self._blocks = list()
+        self._directories = list()
+        self._descriptors = dict()
+        self._finalizer = weakref.finalize(self, SharedData._release, self._blocks, self._directories)
+
+    def __len__(self) -> int:
+        return len(self._descriptors)
+
+    @property
+    def descriptors(self) -> dict:
+        return self._descriptors
+
+    @staticmethod
+    def _release(blocks: list, directories: list) -> None:
+        for block in blocks:
+            block.close()
+            block.unlink()
+        for directory in directories:
+            shutil.rmtree(directory, ignore_errors=True)
+        blocks.clear()
+        directories.clear()
+
+    def _share_array(self, name: str, array: np.ndarray, storage: str) -> tuple:
+        array = np.asarray(array)
+        if array.dtype.hasobject:
+            raise Exception(f'Data {name} has object dtype and can not be shared without copying. Convert it to a numeric or fixed width dtype.')
+        if storage == 'shared_memory':
+            if shared_memory == None:
+                raise Exception(f'Shared memory storage requires python 3.8 or higher. Use memmap storage instead.')
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            shared_array = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            shared_array[...] = array
+            self._blocks.append(block)
+            return ('shared_memory', block.name, array.shape, array.dtype.str)
+        else:
+            if len(self._directories) == 0:
+                self._directories.append(tempfile.mkdtemp(prefix='genopt_'))
+            path = os.path.join(self._directories[0], f'{len(os.listdir(self._directories[0]))}.npy')
+            np.save(path, array)
+            return ('memmap', path)
+
+    def add(self, name: str, data: Union[np.ndarray, pd.DataFrame], storage: str = 'shared_memory') -> None:
+        if storage not in SUPPORTED_STORAGES:
+            raise Exception(f'Storage {storage} not supported. Must be one of {SUPPORTED_STORAGES}.')
+        if name in self._descriptors:
+            raise Exception(f'Shared data {name} already exists.')
+        if isinstance(data, pd.DataFrame):
+            self._descriptors[name] = {
+                'type': 'dataframe',
+                'columns': {column: self._share_array(f'{name}.{column}', data[column].to_numpy(), storage) for column in data.columns},
+                'index': self._share_array(f'{name}.index', data.index.to_numpy(), storage)
+            }
+        else:
+            self._descriptors[name] = {'type': 'ndarray', 'data': self._share_array(name, data, storage)}
+
+    def close(self) -> None:
+        detach_shared_data()
+        self._descriptors.clear()
+        # releasing directly keeps the finalizer armed for the data shared after closing
+        SharedData._release(self._blocks, self._directories)
@@ -40,4 +40,27 @@ def define_weights_by_default_if_not_defined(weights: Union[List[float], None],
     elif np.sum(weights) != 1:
         raise Exception(f'Weights must sum up to 1.')
     
-    return weights
\ No newline at end of file
+    return weights
+
+def calculate_weighted_sum_scores(scores: np.ndarray, direction: List[str], weights: List[float]) -> np.ndarray:
+    scores = np.asarray(scores, dtype=np.float64).reshape(len(scores), -1)
+    if scores.shape[1] != len(direction):
+        raise Exception(f'Direction and weights do not match number of fitness values.')
+    if len(scores) == 0:
+        return np.zeros(0, dtype=np.float64)
+    min_scores = scores.min(axis=0)
+    max_scores = scores.max(axis=0)
+    spans = max_scores - min_scores
+    normalized_scores = np.zeros(scores.shape, dtype=np.float64)
+    is_degenerate = spans == 0
+    for i, objective_direction in enumerate(direction):
+        if objective_direction == 'maximize':
+            normalized_scores[:, i] = scores[:, i] - min_scores[i]
+        elif objective_direction == 'minimize':
+            normalized_scores[:, i] = max_scores[i] - scores[:, i]
+        else:
+            raise Exception(f'Direction {direction} is not supported.')
+    normalized_scores[:, ~is_degenerate] /= spans[~is_degenerate]
+    normalized_scores[:, is_degenerate] = 0
+
+    return normalized_scores @ np.asarray(weights, dtype=np.float64)
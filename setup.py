@@ -9,6 +9,10 @@ INSTALL_REQUIRES = [
     'pandas==1.3.4',
 ]
 
+EXTRAS_REQUIRE = {
+    'parquet': ['pyarrow'],
+}
+
 VERSION = '0.9.14'
 
 if __name__ == '__main__':
@@ -25,5 +29,6 @@ if __name__ == '__main__':
         packages=['genopt'],
         include_package_data=True,
         install_requires=INSTALL_REQUIRES,
+        extras_require=EXTRAS_REQUIRE,
         python_requires='>=3.6'
     )
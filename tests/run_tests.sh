@@ -3,4 +3,16 @@ pytest -v test_datatype_inference.py
 pytest -v test_mutation.py
 pytest -v test_crossover.py
 pytest -v test_results.py
-pytest -v test_individual.py
\ No newline at end of file
+pytest -v test_individual.py
+pytest -v test_executor.py
+pytest -v test_cache.py
+pytest -v test_search_space.py
+pytest -v test_population.py
+pytest -v test_environment.py
+pytest -v test_checkpoint.py
+pytest -v test_shared_data.py
+pytest -v test_evaluation_log.py
+pytest -v test_pareto.py
+pytest -v test_utils.py
+pytest -v test_selection.py
+pytest -v test_history.py
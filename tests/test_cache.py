@@ -0,0 +1,67 @@
+import unittest
+
+from genopt.cache import FitnessCache
+
+class TestFitnessCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = FitnessCache(max_size=2)
+
+    def test_negative_max_size_fails(self):
+        with self.assertRaises(Exception):
+            FitnessCache(max_size=-1)
+
+    def test_get_missing_genome_returns_none(self):
+        self.assertEqual(self.cache.get((1, 2)), None)
+
+    def test_get_cached_genome(self):
+        self.cache.put((1, 2), 10)
+
+        self.assertEqual(self.cache.get((1, 2)), 10)
+
+    def test_hits_and_misses_are_counted(self):
+        self.cache.put((1, 2), 10)
+
+        self.cache.get((1, 2))
+        self.cache.get((1, 2))
+        self.cache.get((3, 4))
+
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_least_recently_used_genome_is_evicted(self):
+        self.cache.put((1, 2), 10)
+        self.cache.put((3, 4), 20)
+        self.cache.get((1, 2))
+        self.cache.put((5, 6), 30)
+
+        self.assertTrue((1, 2) in self.cache)
+        self.assertFalse((3, 4) in self.cache)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_zero_max_size_disables_cache(self):
+        cache = FitnessCache(max_size=0)
+
+        cache.put((1, 2), 10)
+
+        self.assertFalse(cache.is_enabled)
+        self.assertEqual(len(cache), 0)
+
+    def test_none_max_size_is_unbounded(self):
+        cache = FitnessCache(max_size=None)
+
+        for i in range(100):
+            cache.put((i,), i)
+
+        self.assertEqual(len(cache), 100)
+
+    def test_clear(self):
+        self.cache.put((1, 2), 10)
+        self.cache.get((1, 2))
+
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.hits, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from genopt.checkpoint import Checkpoint
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'run.ckpt')
+        self.state = {
+            'generation': 3,
+            'population': {'int_genes': np.arange(6).reshape(3, 2), 'fitness': [1.0, 2.0, 3.0]},
+            'history_genomes': {(1, 2), (3, 4)}
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        Checkpoint.save(self.path, self.state)
+        state = Checkpoint.load(self.path)
+
+        self.assertEqual(state['generation'], 3)
+        self.assertTrue(np.array_equal(state['population']['int_genes'], self.state['population']['int_genes']))
+        self.assertEqual(state['history_genomes'], self.state['history_genomes'])
+
+    def test_save_does_not_leave_temporary_files(self):
+        Checkpoint.save(self.path, self.state)
+
+        self.assertEqual(os.listdir(self.directory.name), ['run.ckpt'])
+
+    def test_load_non_checkpoint_file_fails(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a checkpoint')
+
+        with self.assertRaises(Exception):
+            Checkpoint.load(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
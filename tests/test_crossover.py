@@ -1,7 +1,10 @@
 import unittest
+import numpy as np
 from unittest.mock import Mock, MagicMock
 
 from genetist.crossover import Crossover
+from genetist.population import Population
+from genetist.search_space import SearchSpace
 
 class TestCrossover(unittest.TestCase):
     def setUp(self):
@@ -23,6 +26,19 @@ class TestCrossover(unittest.TestCase):
         self.mock_individual_1_short_genome.genome = MagicMock(return_value=[1])
         self.mock_individual_2_short_genome.genome = MagicMock(return_value=[7])
 
+        self.search_space = SearchSpace({
+            'a': {'type': 'int', 'low': 0, 'high': 10},
+            'b': {'type': 'float', 'low': 0, 'high': 10},
+            'c': {'type': 'int', 'low': 0, 'high': 10},
+            'd': {'type': 'float', 'low': 0, 'high': 10},
+            'e': {'type': 'int', 'low': 0, 'high': 10}
+        })
+        self.parents_1 = Population(self.search_space, np.zeros((50, 3), dtype=np.int64), np.zeros((50, 2)))
+        self.parents_2 = Population(self.search_space, np.ones((50, 3), dtype=np.int64), np.ones((50, 2)))
+        self.binary_search_space = SearchSpace({i: {'type': 'binary'} for i in range(20)})
+        self.binary_parents_1 = Population(self.binary_search_space, np.empty((50, 0), dtype=np.int64), np.empty((50, 0)), bit_genes=np.zeros((50, 3), dtype=np.uint8))
+        self.binary_parents_2 = Population(self.binary_search_space, np.empty((50, 0), dtype=np.int64), np.empty((50, 0)), bit_genes=self.binary_search_space.clear_bit_padding(np.full((50, 3), 0xFF, dtype=np.uint8)))
+
     def test_one_point_crossover(self):
         child_1, child_2 = self.one_point_crossover._one_point_crossover(self.mock_individual_1, self.mock_individual_2)
         self.assertTrue(isinstance(child_1.genome.return_value, list))
@@ -46,6 +62,57 @@ class TestCrossover(unittest.TestCase):
          with self.assertRaises(Exception):
             self.one_point_crossover._one_point_crossover(self.mock_individual_1_short_genome, self.mock_individual_2_short_genome)
 
+    def test_crossover_population_returns_two_childs_per_pair(self):
+        for crossover_type in ['one-point', 'two-point', 'three-point', 'uniform']:
+            childs = Crossover(crossover_type).crossover_population(self.parents_1, self.parents_2)
+
+            self.assertEqual(len(childs), 100)
+            self.assertEqual(childs.int_genes.shape, (100, 3))
+            self.assertEqual(childs.float_genes.shape, (100, 2))
+
+    def test_one_point_crossover_population_childs_are_complementary(self):
+        childs = Crossover('one-point').crossover_population(self.parents_1, self.parents_2)
+
+        self.assertTrue(np.all(childs.int_genes[0::2] + childs.int_genes[1::2] == 1))
+        self.assertTrue(np.all(childs.float_genes[0::2] + childs.float_genes[1::2] == 1))
+
+    def test_one_point_crossover_population_keeps_first_gene_and_crosses_last_gene(self):
+        childs = Crossover('one-point').crossover_population(self.parents_1, self.parents_2)
+
+        self.assertTrue(np.all(childs.int_genes[0::2, 0] == 0))
+        self.assertTrue(np.all(childs.int_genes[0::2, 2] == 1))
+
+    def test_two_point_crossover_population_keeps_first_and_last_genes(self):
+        childs = Crossover('two-point').crossover_population(self.parents_1, self.parents_2)
+
+        self.assertTrue(np.all(childs.int_genes[0::2, 0] == 0))
+        self.assertTrue(np.all(childs.int_genes[0::2, 2] == 0))
+
+    def test_three_point_crossover_population_fails_for_short_genomes(self):
+        search_space = SearchSpace({'a': [0, 1], 'b': [0, 1], 'c': [0, 1], 'd': [0, 1]})
+        parents = Population(search_space, np.zeros((2, 4), dtype=np.int64), np.zeros((2, 0)))
+
+        with self.assertRaises(Exception):
+            Crossover('three-point').crossover_population(parents, parents)
+
+    def test_crossover_population_fails_for_unknown_crossover_type(self):
+        with self.assertRaises(Exception):
+            self.not_supported_crossover.crossover_population(self.parents_1, self.parents_2)
+
     def test_crossover_fails_for_unknown_mutation_type(self):
         with self.assertRaises(Exception):
              self.not_supported_crossover.crossover(self.mock_individual_1, self.mock_individual_2)
+
+    def test_crossover_population_of_binary_genes_childs_are_complementary(self):
+        for crossover_type in ['one-point', 'two-point', 'three-point']:
+            childs = Crossover(crossover_type).crossover_population(self.binary_parents_1, self.binary_parents_2)
+            bits = self.binary_search_space.unpack_bits(childs.bit_genes)
+
+            self.assertEqual(childs.bit_genes.shape, (100, 3))
+            self.assertTrue(np.all(bits[0::2] + bits[1::2] == 1))
+            self.assertTrue(np.all(bits[0::2, 0] == 0))
+
+    def test_crossover_population_of_binary_genes_keeps_padding_bits_clear(self):
+        childs = Crossover('uniform').crossover_population(self.binary_parents_1, self.binary_parents_2)
+
+        self.assertTrue(np.all(childs.bit_genes[:, -1] & 0x0F == 0))
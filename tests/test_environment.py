@@ -0,0 +1,500 @@
+import os
+import time
+import tempfile
+import unittest
+import unittest.mock
+import numpy as np
+
+from genopt.environment import Environment
+from genopt.selection import Selection
+from genopt.parameters import Parameters
+from genopt.shared_data import get_shared_data
+
+def objective(individual):
+    return individual['x'] ** 2 + individual['y'] ** 2
+
+def interrupted_objective(individual):
+    interrupted_objective.calls += 1
+    if interrupted_objective.calls > 60:
+        raise KeyboardInterrupt()
+    return objective(individual)
+
+def multiple_objective(individual):
+    return individual['x'] ** 2, individual['y']
+
+def constant_multiple_objective(individual):
+    return individual['x'] ** 2, 1
+
+def batch_objective(individuals):
+    return individuals['x'] ** 2 + individuals['y'] ** 2
+
+def batch_multiple_objective(individuals):
+    return individuals['x'] ** 2, individuals['y'] ** 2
+
+def slow_objective(individual):
+    time.sleep(0.05)
+    return objective(individual)
+
+def hanging_objective(individual):
+    if individual['y'] > 5:
+        time.sleep(60)
+    return objective(individual)
+
+def failing_objective(individual):
+    if individual['y'] > 5:
+        raise ValueError('y is too large')
+    return objective(individual)
+
+def counted_objective(individual):
+    counted_objective.calls += 1
+    return objective(individual)
+
+def counted_failing_objective(individual):
+    counted_failing_objective.calls += 1
+    return failing_objective(individual)
+
+def small_objective(individual):
+    return individual['a'] + individual['b'] + individual['c']
+
+def transient_failing_objective(individual):
+    genome = tuple(individual.values())
+    if genome not in transient_failing_objective.failed_genomes:
+        transient_failing_objective.failed_genomes.add(genome)
+        raise ValueError('first evaluation of the genome')
+    return small_objective(individual)
+
+def binary_objective(individual):
+    return sum(individual[i] for i in range(100)) + individual['x']
+
+def shared_data_objective(individual):
+    return float(get_shared_data('offsets')[0]) + objective(individual)
+
+class TestEnvironment(unittest.TestCase):
+    def setUp(self):
+        self.params = {
+            'x': Parameters.suggest_float(-10, 10),
+            'y': Parameters.suggest_int(-10, 10),
+            'z': Parameters.suggest_categorical(['a', 'b'])
+        }
+
+    def test_unknown_engine_fails(self):
+        with self.assertRaises(Exception):
+            Environment(self.params, engine='unknown')
+
+    def test_optimize_without_stop_criteria_fails(self):
+        environment = Environment(self.params, verbose=0)
+
+        with self.assertRaises(Exception):
+            environment.optimize(objective, 'minimize')
+
+    def test_optimize_with_vectorized_engine(self):
+        environment = Environment(self.params, num_population=20, engine='vectorized', verbose=0, random_state=42)
+
+        results = environment.optimize(objective, 'minimize', num_generations=5)
+
+        self.assertEqual(results.best_score, objective(results.best_individual))
+
+    def test_optimize_with_binary_genes(self):
+        params = {i: Parameters.suggest_binary() for i in range(100)}
+        params['x'] = Parameters.suggest_float(0, 1)
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(params, num_population=20, engine=engine, crossover_type='two-point', verbose=0, random_state=42)
+
+            results = environment.optimize(binary_objective, 'maximize', num_generations=5)
+
+            self.assertEqual(results.best_score, binary_objective(results.best_individual))
+            self.assertTrue(set(results.best_individual[i] for i in range(100)) <= {0, 1})
+
+    def test_optimize_with_bounded_history(self):
+        for engine in ['individual', 'vectorized']:
+            for history_type in ['digest', 'bloom']:
+                environment = Environment(self.params, num_population=20, history_size=50, history_type=history_type, engine=engine, verbose=0, random_state=42)
+
+                results = environment.optimize(objective, 'minimize', num_generations=5)
+
+                self.assertEqual(results.best_score, objective(results.best_individual))
+                self.assertTrue(len(environment.history_genomes) <= 50 or history_type == 'bloom')
+
+    def test_unknown_history_type_fails(self):
+        with self.assertRaises(Exception):
+            Environment(self.params, history_type='unknown')
+
+    def test_duplicated_childs_are_replaced(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=10, prob_mutation=0.0, engine=engine, verbose=0, random_state=42)
+            individuals = environment._initialize_population()
+            same_parents = individuals[np.array([0, 0])] if engine == 'vectorized' else [individuals[0], individuals[0]]
+
+            childs = environment._create_childs(same_parents, 10)
+            genomes = environment._get_population_genomes(childs)
+
+            self.assertEqual(len(set(genomes)), 10)
+            self.assertFalse(environment._get_population_genomes(same_parents)[0] in genomes)
+            self.assertTrue(all(genome in environment.history_genomes for genome in genomes))
+
+    def test_optimize_evaluates_only_new_genomes(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+
+            results = environment.optimize(objective, 'minimize', num_generations=10)
+
+            self.assertEqual(results.cache_hits, 0)
+
+    def test_timeout_stops_in_the_middle_of_a_generation(self):
+        for backend, n_jobs in [('serial', 1), ('thread', 2)]:
+            for mode in ['generational', 'steady-state']:
+                environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+
+                results = environment.optimize(slow_objective, 'minimize', timeout=0.3, n_jobs=n_jobs, backend=backend, mode=mode)
+
+                self.assertTrue(0 < results.number_of_evaluations < 20)
+                self.assertTrue(0 < len(results.last_generation_individuals_dataframe) < 20)
+                self.assertEqual(results.best_score, objective(results.best_individual))
+
+    def test_stop_score_stops_in_the_middle_of_a_generation(self):
+        counted_objective.calls = 0
+        environment = Environment(self.params, num_population=50, verbose=0, random_state=42)
+
+        results = environment.optimize(counted_objective, 'minimize', num_generations=10, stop_score=50)
+
+        self.assertTrue(results.best_score <= 50)
+        self.assertTrue(counted_objective.calls < 50)
+
+    def test_eval_timeout_penalizes_hanging_evaluations(self):
+        for mode in ['generational', 'steady-state']:
+            environment = Environment(self.params, num_population=10, verbose=0, random_state=42)
+            start_time = time.time()
+
+            results = environment.optimize(hanging_objective, 'minimize', num_generations=3, n_jobs=2, mode=mode, eval_timeout=0.2, penalty_fitness=1000)
+
+            self.assertTrue(time.time() - start_time < 30)
+            self.assertTrue(results.best_individual['y'] <= 5)
+            self.assertEqual(results.best_score, objective(results.best_individual))
+            scores = results.last_generation_individuals_dataframe['best_score']
+            self.assertTrue(all((score == 1000) or (score <= 200) for score in scores))
+
+    def test_eval_timeout_requires_penalty_for_multiple_objectives(self):
+        environment = Environment(self.params, num_population=10, verbose=0, random_state=42)
+
+        with self.assertRaises(Exception):
+            environment.optimize(multiple_objective, ['minimize', 'maximize'], num_generations=3, eval_timeout=0.2)
+
+    def test_raise_error_policy_propagates_errors(self):
+        environment = Environment(self.params, num_population=10, verbose=0, random_state=42)
+
+        with self.assertRaises(ValueError):
+            environment.optimize(failing_objective, 'minimize', num_generations=3)
+
+    def test_unknown_error_policy_fails(self):
+        environment = Environment(self.params, num_population=10, verbose=0, random_state=42)
+
+        for error_policy in ['ignore', 'retry', 'retry:0', 'retry:a']:
+            with self.assertRaises(Exception):
+                environment.optimize(objective, 'minimize', num_generations=3, error_policy=error_policy)
+
+    def test_penalize_error_policy_accepts_lambda_objective(self):
+        environment = Environment(self.params, num_population=10, verbose=0, random_state=42)
+
+        results = environment.optimize(lambda individual: failing_objective(individual), 'minimize', num_generations=3, error_policy='penalize')
+
+        self.assertTrue(results.best_individual['y'] <= 5)
+        self.assertTrue(len(results.evaluation_errors_dataframe) > 0)
+
+    def test_penalized_genomes_are_not_cached(self):
+        params = {'a': [0, 1], 'b': [0, 1], 'c': [0, 1]}
+        for engine in ['individual', 'vectorized']:
+            for mode in ['generational', 'steady-state']:
+                transient_failing_objective.failed_genomes = set()
+                environment = Environment(params, num_population=6, history_size=2, engine=engine, verbose=0, random_state=42)
+
+                results = environment.optimize(transient_failing_objective, 'minimize', num_generations=20, backend='serial', mode=mode, error_policy='penalize')
+
+                self.assertTrue(results.number_of_evaluations > len(results.evaluation_errors_dataframe))
+                self.assertEqual(results.best_score, 0)
+
+    def test_penalize_error_policy_records_failed_evaluations(self):
+        for engine in ['individual', 'vectorized']:
+            for mode in ['generational', 'steady-state']:
+                environment = Environment(self.params, num_population=10, engine=engine, verbose=0, random_state=42)
+
+                results = environment.optimize(failing_objective, 'minimize', num_generations=3, backend='serial', mode=mode, error_policy='retry:2')
+
+                self.assertTrue(results.best_individual['y'] <= 5)
+                errors = results.evaluation_errors_dataframe
+                self.assertTrue(len(errors) > 0)
+                self.assertTrue(all(errors['y'] > 5))
+                self.assertTrue(all(errors['attempts'] == 3))
+                self.assertTrue(all('y is too large' in traceback for traceback in errors['traceback']))
+
+    def test_max_evaluations_stops_at_the_budget(self):
+        for engine in ['individual', 'vectorized']:
+            for mode in ['generational', 'steady-state']:
+                for max_evaluations in [7, 53]:
+                    counted_objective.calls = 0
+                    environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+
+                    results = environment.optimize(counted_objective, 'minimize', max_evaluations=max_evaluations, n_jobs=3, backend='thread', mode=mode)
+
+                    self.assertEqual(counted_objective.calls, max_evaluations)
+                    self.assertEqual(results.number_of_evaluations, max_evaluations)
+                    self.assertTrue(results.evaluations_per_second > 0)
+
+    def test_max_evaluations_counts_retries(self):
+        for engine in ['individual', 'vectorized']:
+            for mode in ['generational', 'steady-state']:
+                for backend in ['serial', 'thread']:
+                    counted_failing_objective.calls = 0
+                    environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+
+                    results = environment.optimize(counted_failing_objective, 'minimize', max_evaluations=30, n_jobs=3, backend=backend, mode=mode, error_policy='retry:3')
+
+                    self.assertEqual(counted_failing_objective.calls, 30)
+                    self.assertEqual(results.number_of_evaluations, 30)
+                    self.assertTrue(len(results.evaluation_errors_dataframe) > 0)
+
+    def test_invalid_max_evaluations_fails(self):
+        environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+
+        with self.assertRaises(Exception):
+            environment.optimize(objective, 'minimize', max_evaluations=0)
+
+    def test_cache_savings_counts_cache_hits(self):
+        params = {'a': [0, 1], 'b': [0, 1], 'c': [0, 1]}
+        for mode in ['generational', 'steady-state']:
+            environment = Environment(params, num_population=6, history_size=2, verbose=0, random_state=42)
+
+            results = environment.optimize(small_objective, 'minimize', num_generations=5, backend='serial', mode=mode)
+
+            self.assertTrue(results.cache_hits > 0)
+            self.assertEqual(results.cache_savings, results.cache_hits / (results.cache_hits + results.number_of_evaluations))
+
+    def test_exhausted_search_space_stops_the_optimization(self):
+        params = {'a': [0, 1], 'b': [0, 1], 'c': [0, 1]}
+        for engine in ['individual', 'vectorized']:
+            for mode in ['generational', 'steady-state']:
+                environment = Environment(params, num_population=6, engine=engine, verbose=1, random_state=42)
+
+                with self.assertLogs('ENVIRONMENT', level='INFO') as logs:
+                    results = environment.optimize(small_objective, 'minimize', max_evaluations=20, backend='serial', mode=mode)
+
+                self.assertEqual(results.number_of_evaluations, 8)
+                self.assertEqual(results.best_score, 0)
+                self.assertTrue(any('SEARCH SPACE EXHAUSTED' in log for log in logs.output))
+
+    def test_batch_optimize_matches_best_individual(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+
+            results = environment.optimize(batch_objective, 'minimize', num_generations=5, batch=True)
+
+            self.assertAlmostEqual(results.best_score, objective(results.best_individual))
+
+    def test_batch_optimize_with_dataframe_format(self):
+        environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+
+        results = environment.optimize(batch_objective, 'minimize', num_generations=5, batch=True, batch_format='dataframe')
+
+        self.assertAlmostEqual(results.best_score, objective(results.best_individual))
+
+    def test_batch_optimize_with_multiple_objectives(self):
+        environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+
+        results = environment.optimize(batch_multiple_objective, ['minimize', 'minimize'], weights=[0.5, 0.5], num_generations=5, batch=True)
+
+        self.assertEqual(len(results.best_score), 2)
+
+    def test_batch_optimize_with_wrong_number_of_fitness_values_fails(self):
+        environment = Environment(self.params, num_population=20, verbose=0)
+
+        with self.assertRaises(Exception):
+            environment.optimize(lambda individuals: np.zeros(3), 'minimize', num_generations=5, batch=True)
+
+    def test_unknown_batch_format_fails(self):
+        environment = Environment(self.params, verbose=0)
+
+        with self.assertRaises(Exception):
+            environment.optimize(batch_objective, 'minimize', num_generations=5, batch=True, batch_format='unknown')
+
+    def test_steady_state_optimize(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+
+            results = environment.optimize(objective, 'minimize', num_generations=5, mode='steady-state', n_jobs=2, backend='thread')
+
+            self.assertEqual(results.best_score, objective(results.best_individual))
+            self.assertEqual(len(results.best_per_generation_dataframe), 5)
+            self.assertEqual(len(results.last_generation_individuals_dataframe), 20)
+
+    def test_steady_state_optimize_with_batch_fails(self):
+        environment = Environment(self.params, verbose=0)
+
+        with self.assertRaises(Exception):
+            environment.optimize(batch_objective, 'minimize', num_generations=5, mode='steady-state', batch=True)
+
+    def test_resume_continues_from_checkpoint(self):
+        for engine in ['individual', 'vectorized']:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'run.ckpt')
+                environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+                results = environment.optimize(objective, 'minimize', num_generations=8)
+                environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+                interrupted_objective.calls = 0
+                with self.assertRaises(KeyboardInterrupt):
+                    environment.optimize(interrupted_objective, 'minimize', num_generations=8, checkpoint_path=path)
+
+                environment = Environment.resume(path)
+                resumed_results = environment.optimize(objective, 'minimize', num_generations=8)
+
+                self.assertEqual(resumed_results.best_score, results.best_score)
+                self.assertTrue(resumed_results.best_per_generation_dataframe.equals(results.best_per_generation_dataframe))
+
+    def test_resume_appends_to_evaluation_log(self):
+        for log_name in ['evaluations.csv', 'evaluations.parquet']:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'run.ckpt')
+                evaluation_log_path = os.path.join(directory, log_name)
+                environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+                interrupted_objective.calls = 0
+                with self.assertRaises(KeyboardInterrupt):
+                    environment.optimize(interrupted_objective, 'minimize', num_generations=8, checkpoint_path=path, evaluation_log_path=evaluation_log_path)
+
+                environment = Environment.resume(path)
+                results = environment.optimize(objective, 'minimize', num_generations=8, evaluation_log_path=evaluation_log_path)
+                df_evaluations = results.load_evaluation_log()
+
+                self.assertEqual(df_evaluations['generation'].min(), 0)
+                self.assertTrue(len(df_evaluations) >= results.number_of_evaluations)
+
+    def test_ask_returns_candidates(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, verbose=0)
+
+            candidates = environment.ask(5)
+
+            self.assertEqual(len(candidates), 5)
+            self.assertEqual(list(candidates[0].keys()), ['x', 'y', 'z'])
+
+    def test_tell_updates_best_individual(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, verbose=0)
+            candidates = environment.ask(10)
+            scores = [objective(candidate) for candidate in candidates]
+
+            environment.tell(candidates, scores, 'minimize')
+
+            self.assertEqual(environment.results.best_score, min(scores))
+            self.assertEqual(environment.results.best_individual, candidates[int(np.argmin(scores))])
+
+    def test_ask_after_tell_creates_childs(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, verbose=0)
+            for _ in range(10):
+                candidates = environment.ask(4)
+                environment.tell(candidates, [objective(candidate) for candidate in candidates], 'minimize')
+
+            self.assertEqual(len(environment.ask(3)), 3)
+            self.assertEqual(len(environment.results.best_per_generation_dataframe), 2)
+
+    def test_tell_with_different_number_of_scores_fails(self):
+        environment = Environment(self.params, verbose=0)
+        candidates = environment.ask(2)
+
+        with self.assertRaises(Exception):
+            environment.tell(candidates, [1], 'minimize')
+
+    def test_tell_with_unknown_categorical_value_fails(self):
+        environment = Environment(self.params, engine='vectorized', verbose=0)
+
+        with self.assertRaises(Exception):
+            environment.tell([{'x': 1.0, 'y': 2, 'z': 'c'}], [1], 'minimize')
+
+    def test_optimize_with_shared_data(self):
+        environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+        environment.share_data('offsets', np.array([100.0]))
+
+        results = environment.optimize(shared_data_objective, 'minimize', num_generations=3, n_jobs=2)
+        environment.release_data()
+
+        self.assertEqual(results.best_score, objective(results.best_individual) + 100.0)
+
+
+    def test_optimize_with_evaluation_log(self):
+        with tempfile.TemporaryDirectory() as directory:
+            environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+
+            results = environment.optimize(objective, 'minimize', num_generations=5, evaluation_log_path=os.path.join(directory, 'evaluations.csv'))
+            df_evaluations = results.load_evaluation_log()
+
+            self.assertEqual(len(df_evaluations), results.cache_misses)
+            self.assertEqual(df_evaluations['score'].min(), results.best_score)
+
+
+    def test_unknown_multi_objective_type_fails(self):
+        with self.assertRaises(Exception):
+            Environment(self.params, multi_objective_type='unknown')
+
+    def test_pareto_optimize_returns_non_dominated_front(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, multi_objective_type='pareto', verbose=0, random_state=42)
+
+            results = environment.optimize(multiple_objective, ['minimize', 'maximize'], score_names=['x2', 'y'], num_generations=5)
+            pareto_front = results.pareto_front_dataframe[['x2', 'y']].values
+
+            self.assertTrue(len(pareto_front) > 0)
+            for scores in pareto_front:
+                self.assertFalse(np.any((pareto_front[:, 0] <= scores[0]) & (pareto_front[:, 1] >= scores[1]) & np.any(pareto_front != scores, axis=1)))
+
+
+    def test_weighted_sum_optimize_with_constant_objective(self):
+        for engine in ['individual', 'vectorized']:
+            environment = Environment(self.params, num_population=20, engine=engine, verbose=0, random_state=42)
+
+            results = environment.optimize(constant_multiple_objective, ['minimize', 'maximize'], num_generations=5)
+
+            self.assertEqual(results.best_score, constant_multiple_objective(results.best_individual))
+            self.assertEqual(results.best_score[0], min(score for score, _ in results.last_generation_individuals_dataframe['best_score']))
+
+
+    def test_default_weights_warning_is_logged_once(self):
+        environment = Environment(self.params, num_population=20, verbose=0, random_state=42)
+
+        with self.assertLogs('RESULTS', level='WARNING') as logs:
+            environment.optimize(multiple_objective, ['minimize', 'maximize'], num_generations=10)
+
+        self.assertEqual(len([log for log in logs.output if 'Weights value is None' in log]), 1)
+
+    def test_partial_ordering_without_ranking_selection_fails(self):
+        with self.assertRaises(Exception):
+            Environment(self.params, selection_type='roulette', ordering_type='partial')
+
+    def test_partial_ordering_sorts_only_top_individuals(self):
+        environment = Environment(self.params, selection_type='ranking', ordering_type='partial', verbose=0)
+        keys = np.random.RandomState(42).permutation(100).astype(np.float64)
+
+        order = environment._get_order_by_keys(keys, 10)
+
+        np.testing.assert_array_equal(keys[order[:10]], np.arange(10))
+        self.assertEqual(set(keys[order[10:]]), set(range(10, 100)))
+
+    def test_selection_follows_environment_selection_type(self):
+        Environment(self.params, num_population=20, selection_type='roulette', verbose=0, random_state=42).optimize(objective, 'minimize', num_generations=2)
+        environment = Environment(self.params, num_population=20, selection_type='ranking', ordering_type='partial', verbose=0, random_state=42)
+
+        with unittest.mock.patch.object(Selection, '_ranking_selection', autospec=True, side_effect=Selection._ranking_selection) as ranking_selection:
+            environment.optimize(objective, 'minimize', num_generations=2)
+
+        self.assertTrue(ranking_selection.called)
+
+    def test_partial_ordering_matches_full_ordering(self):
+        for engine in ['individual', 'vectorized']:
+            best_scores = list()
+            for ordering_type in ['full', 'partial']:
+                environment = Environment(self.params, num_population=50, selection_type='ranking', ordering_type=ordering_type, engine=engine, verbose=0, random_state=42)
+                results = environment.optimize(objective, 'minimize', num_generations=5)
+                best_scores.append(results.best_score)
+
+            self.assertEqual(best_scores[0], best_scores[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
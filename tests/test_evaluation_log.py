@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+import math
+
+from genopt.evaluation_log import EvaluationLog
+from genopt.parameters import Parameters
+from genopt.search_space import SearchSpace
+
+class TestEvaluationLog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.directory.name, 'evaluations.csv')
+        self.parquet_path = os.path.join(self.directory.name, 'evaluations.parquet')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_unknown_format_fails(self):
+        with self.assertRaises(Exception):
+            EvaluationLog(os.path.join(self.directory.name, 'evaluations.txt'))
+
+    def test_invalid_buffer_size_fails(self):
+        with self.assertRaises(Exception):
+            EvaluationLog(self.csv_path, buffer_size=0)
+
+    def test_evaluations_are_flushed_in_chunks(self):
+        evaluation_log = EvaluationLog(self.csv_path, buffer_size=10)
+        for i in range(25):
+            evaluation_log.add(i // 10, {'x': i, 'y': 'a'}, i * 2, 0.1, 'MainThread')
+
+        self.assertEqual(len(EvaluationLog.load(self.csv_path)), 20)
+        evaluation_log.close()
+        self.assertEqual(len(EvaluationLog.load(self.csv_path)), 25)
+        self.assertEqual(len(evaluation_log), 25)
+
+    def test_load_csv_evaluation_log(self):
+        with EvaluationLog(self.csv_path) as evaluation_log:
+            evaluation_log.add(1, {'x': 1, 'y': 'a'}, 10, 0.5, 'ForkPoolWorker-1')
+
+        df_evaluations = EvaluationLog.load(self.csv_path)
+
+        self.assertEqual(list(df_evaluations.columns), ['generation', 'x', 'y', 'score', 'wall_time', 'worker_id'])
+        self.assertEqual(df_evaluations['worker_id'].iloc[0], 'ForkPoolWorker-1')
+
+    def test_multiple_objective_scores_are_split(self):
+        with EvaluationLog(self.csv_path) as evaluation_log:
+            evaluation_log.add(1, {'x': 1}, (10, 20), 0.5, 'MainThread')
+
+        df_evaluations = EvaluationLog.load(self.csv_path)
+
+        self.assertEqual(list(df_evaluations[['score_0', 'score_1']].iloc[0]), [10, 20])
+
+    def test_load_parquet_evaluation_log(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+
+        with EvaluationLog(self.parquet_path, buffer_size=2) as evaluation_log:
+            for i in range(5):
+                evaluation_log.add(0, {'x': float(i), 'y': 'a'}, i, 0.1, 'MainThread')
+
+        df_evaluations = EvaluationLog.load(self.parquet_path)
+
+        self.assertEqual(list(df_evaluations['score']), [0, 1, 2, 3, 4])
+
+    def test_parquet_scores_are_float_after_int_first_chunk(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        search_space = SearchSpace({'x': Parameters.suggest_int(0, 10), 'y': Parameters.suggest_categorical(['a', 'b'])})
+
+        with EvaluationLog(self.parquet_path, buffer_size=2, search_space=search_space) as evaluation_log:
+            evaluation_log.add(0, {'x': 1, 'y': 'a'}, 1, 0, 'MainThread')
+            evaluation_log.add(0, {'x': 2, 'y': 'b'}, 2, 0, 'MainThread')
+            evaluation_log.add(1, {'x': 3, 'y': 'a'}, 2.5, 0.1, 'MainThread')
+            evaluation_log.add(1, {'x': 4, 'y': 'b'}, math.inf, 0.1, 'MainThread')
+
+        df_evaluations = EvaluationLog.load(self.parquet_path)
+
+        self.assertEqual(list(df_evaluations['score']), [1, 2, 2.5, math.inf])
+        self.assertEqual(str(df_evaluations['x'].dtype), 'int64')
+        self.assertEqual(list(df_evaluations['y']), ['a', 'b', 'a', 'b'])
+
+    def test_append_keeps_previous_csv_evaluations(self):
+        with EvaluationLog(self.csv_path) as evaluation_log:
+            evaluation_log.add(0, {'x': 1}, 1, 0.1, 'MainThread')
+        with EvaluationLog(self.csv_path, append=True) as evaluation_log:
+            evaluation_log.add(1, {'x': 2}, 2, 0.1, 'MainThread')
+
+        df_evaluations = EvaluationLog.load(self.csv_path)
+
+        self.assertEqual(list(df_evaluations['x']), [1, 2])
+
+    def test_append_keeps_previous_parquet_evaluations(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+
+        for i in range(3):
+            with EvaluationLog(self.parquet_path, append=i > 0) as evaluation_log:
+                evaluation_log.add(i, {'x': i}, i, 0.1, 'MainThread')
+
+        self.assertEqual(list(EvaluationLog.load(self.parquet_path)['x']), [0, 1, 2])
+
+        with EvaluationLog(self.parquet_path) as evaluation_log:
+            evaluation_log.add(0, {'x': 5}, 5, 0.1, 'MainThread')
+
+        self.assertEqual(list(EvaluationLog.load(self.parquet_path)['x']), [5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,249 @@
+import os
+import time
+import unittest
+
+from genopt.executor import Executor, ContextObjective, EvaluationError, EvaluationTimeout, get_worker_context
+
+def square(x):
+    return x ** 2
+
+def slow_square(x):
+    time.sleep(0.1)
+    return x ** 2
+
+def hanging_square(x):
+    if x == 3:
+        time.sleep(60)
+    return x ** 2
+
+def hanging_odd_square(x):
+    if x % 2 == 1:
+        time.sleep(60)
+    return x ** 2
+
+def failing_square(x):
+    if x == 3:
+        raise ValueError('three')
+    return x ** 2
+
+def crashing_square(x):
+    if x == 3:
+        os._exit(1)
+    return x ** 2
+
+def flaky_square(x):
+    flaky_square.calls += 1
+    if flaky_square.calls == 1:
+        raise ValueError('first call')
+    return x ** 2
+
+def worker_setup():
+    return {'pid': os.getpid(), 'offset': 10}
+
+def get_context_pid(x):
+    return get_worker_context()['pid']
+
+def objective_with_context(individual, context):
+    return individual['x'] + context['offset']
+
+class TestExecutor(unittest.TestCase):
+    def setUp(self):
+        self.items = [1, 2, 3, 4, 5]
+        self.result_items = [1, 4, 9, 16, 25]
+
+    def test_unknown_backend_fails(self):
+        with self.assertRaises(Exception):
+            Executor('unknown', 2)
+
+    def test_invalid_n_jobs_fails(self):
+        with self.assertRaises(Exception):
+            Executor('process', 0)
+
+    def test_single_job_is_not_parallel(self):
+        executor = Executor('process', 1)
+
+        executor.start()
+
+        self.assertFalse(executor.is_running)
+
+    def test_serial_map(self):
+        with Executor('serial', 4) as executor:
+            self.assertEqual(executor.map(square, self.items), self.result_items)
+
+    def test_thread_map(self):
+        with Executor('thread', 2) as executor:
+            self.assertEqual(executor.map(square, self.items), self.result_items)
+
+    def test_process_map(self):
+        with Executor('process', 2) as executor:
+            self.assertEqual(executor.map(square, self.items), self.result_items)
+
+    def test_submit_and_get_completed(self):
+        for backend in ['serial', 'thread', 'process']:
+            with Executor(backend, 2) as executor:
+                for task_id, item in enumerate(self.items):
+                    executor.submit(square, item, task_id)
+                completed = dict(executor.get_completed() for _ in self.items)
+
+                self.assertEqual(completed, dict(enumerate(self.result_items)))
+
+    def test_get_completed_raises_task_error(self):
+        with Executor('thread', 2) as executor:
+            executor.submit(lambda x: 1 / 0, 1, 0)
+
+            with self.assertRaises(ZeroDivisionError):
+                executor.get_completed()
+
+    def test_worker_setup_runs_in_every_worker(self):
+        with Executor('process', 2, worker_setup) as executor:
+            pids = set(executor.map(get_context_pid, range(50)))
+
+            self.assertTrue(0 < len(pids) <= 2)
+            self.assertFalse(os.getpid() in pids)
+
+    def test_worker_setup_runs_once_in_serial_executor(self):
+        with Executor('serial', 1, worker_setup) as executor:
+            self.assertEqual(set(executor.map(get_context_pid, range(5))), {os.getpid()})
+
+        self.assertEqual(get_worker_context(), None)
+
+    def test_context_objective_receives_worker_context(self):
+        objective = ContextObjective(objective_with_context)
+
+        with Executor('process', 2, worker_setup) as executor:
+            self.assertEqual(executor.map(objective, [{'x': 1}, {'x': 2}]), [11, 12])
+
+    def test_pool_is_reused_between_maps(self):
+        with Executor('thread', 2) as executor:
+            pool = executor._pool
+            executor.map(square, self.items)
+            executor.map(square, self.items)
+
+            self.assertIs(executor._pool, pool)
+
+    def test_shutdown_releases_pool(self):
+        executor = Executor('process', 2)
+
+        with executor:
+            self.assertTrue(executor.is_running)
+
+        self.assertFalse(executor.is_running)
+
+    def test_pool_is_terminated_on_failure(self):
+        executor = Executor('thread', 2)
+
+        with self.assertRaises(ZeroDivisionError):
+            with executor:
+                executor.map(lambda x: 1 / 0, self.items)
+
+        self.assertFalse(executor.is_running)
+
+    def test_imap_unordered_yields_every_result_with_its_index(self):
+        for backend in ['serial', 'thread', 'process']:
+            with Executor(backend, 2) as executor:
+                results = dict(executor.imap_unordered(square, self.items))
+
+                self.assertEqual(results, dict(enumerate(self.result_items)))
+
+    def test_imap_unordered_stops_at_timeout(self):
+        for backend in ['serial', 'thread']:
+            with Executor(backend, 2) as executor:
+                start_time = time.time()
+                results = list(executor.imap_unordered(slow_square, list(range(20)), timeout=0.25))
+
+                self.assertTrue(0 < len(results) < 20)
+                self.assertTrue(time.time() - start_time < 0.5)
+
+    def test_serial_submit_runs_tasks_on_get_completed(self):
+        calls = list()
+        with Executor('serial', 1) as executor:
+            for task_id in range(3):
+                executor.submit(calls.append, task_id, task_id)
+
+            self.assertEqual(calls, list())
+            self.assertEqual(executor.get_completed(), (0, None))
+            self.assertEqual(calls, [0])
+
+    def test_eval_timeout_requires_process_backend(self):
+        with self.assertRaises(Exception):
+            Executor('thread', 2, eval_timeout=1)
+
+    def test_eval_timeout_kills_and_replaces_hanging_worker(self):
+        with Executor('process', 1, eval_timeout=0.2) as executor:
+            start_time = time.time()
+            results = executor.map(hanging_square, self.items)
+            second_results = executor.map(square, self.items)
+
+            self.assertTrue(time.time() - start_time < 5)
+            self.assertIsInstance(results[2], EvaluationTimeout)
+            self.assertEqual(results[:2] + results[3:], [1, 4, 16, 25])
+            self.assertEqual(second_results, self.result_items)
+            self.assertEqual(executor.number_of_killed_workers, 1)
+
+        self.assertFalse(executor.is_running)
+
+    def test_repeated_kills_never_block_the_other_workers(self):
+        items = list(range(20))
+        with Executor('process', 3, eval_timeout=0.05) as executor:
+            for _ in range(3):
+                results = executor.map(hanging_odd_square, items)
+
+                self.assertEqual([results[i] for i in items if i % 2 == 0], [i ** 2 for i in items if i % 2 == 0])
+                self.assertTrue(all(isinstance(results[i], EvaluationTimeout) for i in items if i % 2 == 1))
+            self.assertEqual(executor.number_of_killed_workers, 30)
+            self.assertEqual(executor.map(square, self.items), self.result_items)
+
+        self.assertFalse(executor.is_running)
+
+    def test_catch_errors_returns_evaluation_error_with_traceback(self):
+        for backend in ['serial', 'thread', 'process']:
+            with Executor(backend, 2, catch_errors=True) as executor:
+                results = executor.map(failing_square, self.items)
+
+                self.assertIsInstance(results[2], EvaluationError)
+                self.assertIn('ValueError', results[2].traceback)
+                self.assertEqual(results[:2] + results[3:], [1, 4, 16, 25])
+
+    def test_single_job_catches_errors_in_process(self):
+        with Executor('process', 1, catch_errors=True) as executor:
+            results = executor.map(lambda x: failing_square(x), self.items)
+
+            self.assertFalse(executor.is_running)
+            self.assertIsInstance(results[2], EvaluationError)
+            self.assertEqual(results[:2] + results[3:], [1, 4, 16, 25])
+
+    def test_max_retries_requires_catch_errors(self):
+        with self.assertRaises(Exception):
+            Executor('serial', 1, max_retries=2)
+
+    def test_failed_tasks_are_retried(self):
+        flaky_square.calls = 0
+        with Executor('serial', 1, catch_errors=True, max_retries=1) as executor:
+            results = executor.map(flaky_square, self.items)
+
+            self.assertEqual(results, self.result_items)
+            self.assertEqual(executor.number_of_retries, 1)
+
+    def test_failed_tasks_are_not_retried_without_retry_budget(self):
+        with Executor('serial', 1, catch_errors=True, max_retries=3) as executor:
+            executor.retry_budget = 1
+            results = executor.map(failing_square, self.items)
+
+            self.assertEqual(results[2].attempts, 2)
+            self.assertEqual(executor.number_of_retries, 1)
+            self.assertEqual(executor.retry_budget, 0)
+
+    def test_crashed_worker_is_isolated(self):
+        with Executor('process', 2, catch_errors=True, max_retries=1) as executor:
+            results = executor.map(crashing_square, self.items)
+            second_results = executor.map(square, self.items)
+
+            self.assertEqual(results[2].error, 'WorkerCrash')
+            self.assertEqual(results[2].attempts, 2)
+            self.assertEqual(results[:2] + results[3:], [1, 4, 16, 25])
+            self.assertEqual(second_results, self.result_items)
+
+        self.assertFalse(executor.is_running)
+
+if __name__ == '__main__':
+    unittest.main()
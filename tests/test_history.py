@@ -0,0 +1,122 @@
+import pickle
+import hashlib
+import unittest
+import numpy as np
+
+from genopt.history import GenomeHistory
+
+class TestGenomeHistory(unittest.TestCase):
+    def setUp(self):
+        self.history = GenomeHistory()
+        self.bounded_history = GenomeHistory(max_size=2)
+        self.bloom_history = GenomeHistory(max_size=1000, history_type='bloom', false_positive_rate=0.01)
+
+    def test_unknown_history_type_fails(self):
+        with self.assertRaises(Exception):
+            GenomeHistory(history_type='unknown')
+
+    def test_invalid_max_size_fails(self):
+        with self.assertRaises(Exception):
+            GenomeHistory(max_size=0)
+
+    def test_bloom_history_without_max_size_fails(self):
+        with self.assertRaises(Exception):
+            GenomeHistory(history_type='bloom')
+
+    def test_invalid_false_positive_rate_fails(self):
+        with self.assertRaises(Exception):
+            GenomeHistory(max_size=10, history_type='bloom', false_positive_rate=1)
+
+    def test_contains_added_genomes(self):
+        for history in [self.history, self.bounded_history, self.bloom_history]:
+            history.add((1, 2.5, 0))
+            history.add(np.arange(3).tobytes())
+
+            self.assertTrue((1, 2.5, 0) in history)
+            self.assertTrue(np.arange(3).tobytes() in history)
+            self.assertFalse((2, 2.5, 0) in history)
+
+    def test_adding_same_genome_twice_counts_once(self):
+        for history in [self.history, self.bloom_history]:
+            history.add((1, 2))
+            history.add((1, 2))
+
+            self.assertEqual(len(history), 1)
+
+    def test_bounded_history_forgets_oldest_genomes(self):
+        self.bounded_history.add((1,))
+        self.bounded_history.add((2,))
+        self.bounded_history.add((3,))
+
+        self.assertEqual(len(self.bounded_history), 2)
+        self.assertFalse((1,) in self.bounded_history)
+        self.assertTrue((2,) in self.bounded_history)
+        self.assertTrue((3,) in self.bounded_history)
+
+    def test_bounded_history_memory_stays_flat(self):
+        nbytes = self.bounded_history.nbytes
+        for i in range(1000):
+            self.bounded_history.add((i,))
+
+        self.assertEqual(len(self.bounded_history), 2)
+        self.assertEqual(self.bounded_history.nbytes, nbytes)
+        self.assertEqual(nbytes, 8 * 8 + 2 * 8)
+
+    def test_bounded_history_keeps_exactly_the_latest_genomes(self):
+        history = GenomeHistory(max_size=50)
+        latest_genomes = list()
+        random_state = np.random.RandomState(42)
+        for value in random_state.randint(0, 300, 5000):
+            if (value,) not in history:
+                latest_genomes = (latest_genomes + [(value,)])[-50:]
+            history.add((value,))
+
+        self.assertEqual(len(history), 50)
+        self.assertEqual({(value,) for value in range(300) if (value,) in history}, set(latest_genomes))
+
+    def test_unbounded_history_reports_python_memory(self):
+        for i in range(100):
+            self.history.add((i,))
+
+        self.assertTrue(self.history.nbytes > 8 * 100 * 4)
+
+    def test_bloom_history_size_is_fixed(self):
+        nbytes = self.bloom_history.nbytes
+        for i in range(5000):
+            self.bloom_history.add((i, i + 1))
+
+        self.assertEqual(self.bloom_history.nbytes, nbytes)
+
+    def test_bloom_history_false_positive_rate(self):
+        for i in range(1000):
+            self.bloom_history.add((i,))
+
+        false_positives = sum((i,) in self.bloom_history for i in range(1000, 11000))
+
+        self.assertTrue(all((i,) in self.bloom_history for i in range(1000)))
+        self.assertTrue(false_positives / 10000 < 0.03)
+
+    def test_digests_do_not_depend_on_the_process(self):
+        self.history.add(b'genome')
+
+        self.assertEqual(self.history._get_digest(b'genome'), int.from_bytes(hashlib.blake2b(b'genome', digest_size=8).digest(), 'little'))
+
+    def test_pickled_history_keeps_genomes(self):
+        for history in [self.bounded_history, self.bloom_history]:
+            history.add((1, 2))
+
+            unpickled_history = pickle.loads(pickle.dumps(history))
+
+            self.assertTrue((1, 2) in unpickled_history)
+
+    def test_clear(self):
+        for history in [self.history, self.bloom_history]:
+            history.add((1, 2))
+
+            history.clear()
+
+            self.assertEqual(len(history), 0)
+            self.assertFalse((1, 2) in history)
+
+if __name__ == '__main__':
+    unittest.main()
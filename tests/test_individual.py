@@ -1,23 +1,33 @@
+import pickle
 import unittest
+import numpy as np
 
 from genetist.individual import Individual
+from genetist.search_space import SearchSpace
 
 class TestIndividual(unittest.TestCase):
     def setUp(self):
         def objective(individual):
             return 4
+        self.objective = objective
         self.params = {
             'x': [0, 1, 2, 3, 5],
             'y': [11, 12, 13],
         }
-        self.search_space_type = 'fixed_search'
-        self.individual = Individual(self.params, self.search_space_type, objective)
+        self.search_space = SearchSpace(self.params)
+        self.individual = Individual()
     
     def test_initialize_genome(self):
-        self.individual.initialize_genome()
+        self.individual.initialize_genome(SearchSpace(self.params))
 
         self.assertTrue(isinstance(self.individual.genome, list))
     
+    def test_initialize_with_array_genome(self):
+        individual = Individual(np.array([1, 2]), 4)
+
+        self.assertEqual(individual.genome.tolist(), [1, 2])
+        self.assertEqual(len(individual), 2)
+
     def test_get_genome_length(self):
         self.assertEqual(len(self.individual), 0)
 
@@ -46,7 +56,7 @@ class TestIndividual(unittest.TestCase):
         result_gene = 'x'
 
         self.individual.genome = genome
-        genome_gene_names = self.individual.get_name_genome_genes()
+        genome_gene_names = self.individual.get_name_genome_genes(self.search_space)
         names = list(genome_gene_names.keys())
 
         self.assertEqual(names[0], result_gene)
@@ -56,7 +66,7 @@ class TestIndividual(unittest.TestCase):
         result_gene = 'y'
 
         self.individual.genome = genome
-        genome_gene_names = self.individual.get_name_genome_genes()
+        genome_gene_names = self.individual.get_name_genome_genes(self.search_space)
         names = list(genome_gene_names.keys())
 
         self.assertEqual(names[1], result_gene)
@@ -66,7 +76,7 @@ class TestIndividual(unittest.TestCase):
         genome_length = 2
 
         self.individual.genome = genome
-        genome_gene_names = self.individual.get_name_genome_genes()
+        genome_gene_names = self.individual.get_name_genome_genes(self.search_space)
         names = list(genome_gene_names.keys())
 
         self.assertEqual(len(names), genome_length)
@@ -75,22 +85,60 @@ class TestIndividual(unittest.TestCase):
         genome = [1, 2]
         
         self.individual.genome = genome
-        genome_gene_names = self.individual.get_name_genome_genes()
+        genome_gene_names = self.individual.get_name_genome_genes(self.search_space)
 
         self.assertTrue(isinstance(genome_gene_names, dict))
     
     def test_get_name_genome_genes_is_dict_with_x_and_y(self):
         genome = [1, 2]
-        result_genome_gene_names = {'x': 1, 'y': 2}
+        result_genome_gene_names = {'x': 1, 'y': 13}
 
         self.individual.genome = genome
-        genome_gene_names = self.individual.get_name_genome_genes()
+        genome_gene_names = self.individual.get_name_genome_genes(self.search_space)
 
         self.assertEqual(genome_gene_names, result_genome_gene_names)
     
     def test_calculate_fitness(self):
         result_fitness = 4
         
-        self.individual.calculate_fitness()
+        self.individual.genome = [1, 2]
+        self.individual.calculate_fitness(self.objective, self.search_space)
 
         self.assertEqual(self.individual.fitness, result_fitness)
+
+    def test_individual_has_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.individual.params = self.params
+
+    def test_pickled_individual_keeps_genome_and_fitness(self):
+        individual = Individual([1, 2], 3)
+
+        unpickled_individual = pickle.loads(pickle.dumps(individual))
+
+        self.assertEqual(unpickled_individual.genome, [1, 2])
+        self.assertEqual(unpickled_individual.fitness, 3)
+
+    def test_initialize_genome_within_search_space(self):
+        params = {
+            'x': {'type': 'int', 'low': 0, 'high': 3},
+            'y': {'type': 'float', 'low': -1.0, 'high': 1.0},
+            'z': {'type': 'categorical', 'choices': ['a', 'b']}
+        }
+
+        genome = self.individual.initialize_genome(SearchSpace(params))
+
+        self.assertTrue(0 <= genome[0] <= 3)
+        self.assertTrue(-1.0 <= genome[1] <= 1.0)
+        self.assertTrue(genome[2] in [0, 1])
+
+    def test_initialize_genome_stores_categorical_codes(self):
+        genome = self.individual.initialize_genome(self.search_space)
+
+        self.assertTrue(all(type(gene) == int for gene in genome))
+        self.assertTrue(0 <= genome[0] <= 4)
+        self.assertTrue(0 <= genome[1] <= 2)
+
+    def test_get_name_genome_genes_decodes_categorical_codes(self):
+        self.individual.genome = [4, 0]
+
+        self.assertEqual(self.individual.get_name_genome_genes(self.search_space), {'x': 5, 'y': 11})
@@ -1,7 +1,11 @@
 import unittest
+import numpy as np
 
 from genetist.mutation import Mutation
+from genetist.individual import Individual
 from genetist.parameters import Parameters
+from genetist.population import Population
+from genetist.search_space import SearchSpace
 
 class TestMutation(unittest.TestCase):
     def setUp(self):
@@ -20,30 +24,28 @@ class TestMutation(unittest.TestCase):
             'y': Parameters.suggest_categorical(['hello', 'goodbye', 'hey', 'how are you', 'hi']),
             'z': Parameters.suggest_float(-10, 20)
         }
-        self.single_gene_mutation_fixed_search = Mutation('single-gene', 1.0, 'fixed_search', self.fixed_params)
-        self.single_gene_mutation_flexible_search = Mutation('single-gene', 1.0, 'flexible_search', self.flexible_params)
-        self.single_gene_mutation_flexible_search_multiple_categoricals = Mutation('single-gene', 1.0, 'flexible_search', self.flexible_params_multiple_categorical)
+        self.single_gene_mutation_fixed_search = Mutation('single-gene', 1.0, SearchSpace(self.fixed_params))
+        self.single_gene_mutation_flexible_search = Mutation('single-gene', 1.0, SearchSpace(self.flexible_params))
+        self.single_gene_mutation_flexible_search_multiple_categoricals = Mutation('single-gene', 1.0, SearchSpace(self.flexible_params_multiple_categorical))
 
     def test_mutate_fixed_binary_param(self):
         gene_index = 0
-        param = 'x'
 
         failures = list()
         for i in range(1):
-            child_genome = [0, 1, -2.9]
-            mutated_genome = self.single_gene_mutation_fixed_search._mutate_fixed_binary_param(child_genome, gene_index, param)
-            if mutated_genome != [1, 1, -2.9]:
+            child_genome = [0, 1, 1]
+            mutated_genome = self.single_gene_mutation_fixed_search._mutate_gene(child_genome, gene_index)
+            if mutated_genome != [1, 1, 1]:
                 failures.append(i)
 
         self.assertEqual(failures, list())
 
     def test_mutate_flexible_int_param(self):
         gene_index = 0
-        param = 'x'
         failures = list()
         for i in range(100):
             child_genome = [4, 'hello', -9.33]
-            mutated_genome = self.single_gene_mutation_flexible_search._mutate_flexible_int_param(child_genome, gene_index, param)
+            mutated_genome = self.single_gene_mutation_flexible_search._mutate_gene(child_genome, gene_index)
             if mutated_genome[gene_index] == 4:
                 failures.append(i)
 
@@ -51,39 +53,113 @@ class TestMutation(unittest.TestCase):
 
     def test_mutate_flexible_categorical_binary_param(self):
         gene_index = 1
-        param = 'y'
         failures = list()
         for i in range(100):
-            child_genome = [4, 'hello', -9.33]
-            mutated_genome = self.single_gene_mutation_flexible_search._mutate_flexible_categorical_param(child_genome, gene_index, param)
-            if mutated_genome[gene_index] == 'hello':
+            child_genome = [4, 0, -9.33]
+            mutated_genome = self.single_gene_mutation_flexible_search._mutate_gene(child_genome, gene_index)
+            if mutated_genome[gene_index] != 1:
                 failures.append(i)
 
         self.assertEqual(failures, list())
     
     def test_mutate_flexible_categorical_non_binary_param(self):
         gene_index = 1
-        param = 'y'
         failures = list()
         for i in range(100):
-            child_genome = [4, 'hello', -9.33]
-            mutated_genome = self.single_gene_mutation_flexible_search_multiple_categoricals._mutate_flexible_categorical_param(child_genome, gene_index, param)
-            if mutated_genome[gene_index] == 'hello':
+            child_genome = [4, 0, -9.33]
+            mutated_genome = self.single_gene_mutation_flexible_search_multiple_categoricals._mutate_gene(child_genome, gene_index)
+            if mutated_genome[gene_index] == 0 or mutated_genome[gene_index] not in range(5):
                 failures.append(i)
                 
         self.assertEqual(failures, list())
 
     def test_mutate_fixed_non_binary_param(self):
         gene_index = 1
-        param = 'y'
         failures = list()
         for i in range(100):
-            child_genome = [0, 3, -2.1]
-            mutated_genome = self.single_gene_mutation_fixed_search._mutate_fixed_non_binary_param(child_genome, gene_index, param)
-            if mutated_genome[gene_index] == 3:
+            child_genome = [0, 2, 0]
+            mutated_genome = self.single_gene_mutation_fixed_search._mutate_gene(child_genome, gene_index)
+            if mutated_genome[gene_index] == 2:
                 failures.append(i)
 
         self.assertEqual(failures, list())
 
+    def test_mutate_population_changes_one_gene_per_child(self):
+        search_space = SearchSpace(self.flexible_params_multiple_categorical)
+        childs = Population.initialize(search_space, 200)
+        int_genes, float_genes = childs.int_genes.copy(), childs.float_genes.copy()
+
+        childs = self.single_gene_mutation_flexible_search.mutate_population(childs)
+        changed_genes = (childs.int_genes != int_genes).sum(axis=1) + (childs.float_genes != float_genes).sum(axis=1)
+
+        self.assertTrue(np.all(changed_genes == 1))
+
+    def test_mutate_population_keeps_genes_within_bounds(self):
+        search_space = SearchSpace(self.flexible_params_multiple_categorical)
+        childs = Population.initialize(search_space, 200)
+
+        childs = Mutation('multiple-genes', 1.0, search_space).mutate_population(childs)
+
+        self.assertTrue(np.all((childs.int_genes[:, 0] >= 0) & (childs.int_genes[:, 0] <= 10)))
+        self.assertTrue(np.all((childs.int_genes[:, 1] >= 0) & (childs.int_genes[:, 1] <= 4)))
+        self.assertTrue(np.all((childs.float_genes[:, 0] >= -10) & (childs.float_genes[:, 0] <= 20)))
+
+    def test_mutate_population_flips_binary_genes(self):
+        search_space = SearchSpace({'x': [0, 1]})
+        childs = Population(search_space, np.zeros((50, 1), dtype=np.int64), np.zeros((50, 0)))
+
+        childs = self.single_gene_mutation_fixed_search.mutate_population(childs)
+
+        self.assertTrue(np.all(childs.int_genes == 1))
+
+    def test_mutate_population_without_probability_keeps_genomes(self):
+        search_space = SearchSpace(self.flexible_params)
+        childs = Population.initialize(search_space, 50)
+        int_genes = childs.int_genes.copy()
+
+        childs = Mutation('single-gene', 0.0, search_space).mutate_population(childs)
+
+        self.assertTrue(np.all(childs.int_genes == int_genes))
+
+    def test_mutate_int_gene_with_single_value_keeps_gene(self):
+        self.assertEqual(self.single_gene_mutation_flexible_search._mutate_int_gene(3, 3, 3), 3)
+
+    def test_mutate_keeps_int_genes_within_bounds(self):
+        for i in range(100):
+            mutated_genome = self.single_gene_mutation_flexible_search._mutate_gene([10, 0, -9.33], 0)
+
+            self.assertTrue(0 <= mutated_genome[0] <= 9)
+
+    def test_mutate_population_flips_packed_binary_genes(self):
+        search_space = SearchSpace({i: Parameters.suggest_binary() for i in range(20)})
+        childs = Population(search_space, np.empty((50, 0), dtype=np.int64), np.empty((50, 0)), bit_genes=search_space.sample_bits(50))
+        bits = search_space.unpack_bits(childs.bit_genes)
+
+        childs = Mutation('multiple-genes', 1.0, search_space).mutate_population(childs)
+
+        self.assertTrue(np.all((search_space.unpack_bits(childs.bit_genes) != bits).sum(axis=1) >= 1))
+        self.assertTrue(np.all(childs.bit_genes[:, -1] & 0x0F == 0))
+
+    def test_mutate_flips_binary_gene(self):
+        mutation = Mutation('single-gene', 1.0, SearchSpace({'x': Parameters.suggest_binary()}))
+
+        self.assertEqual(mutation._mutate_gene([0], 0), [1])
+        self.assertEqual(mutation._mutate_gene([1], 0), [0])
+
+    def test_force_mutate_population_changes_only_given_childs(self):
+        search_space = SearchSpace(self.flexible_params)
+        childs = Population.initialize(search_space, 10)
+        int_genes, float_genes = childs.int_genes.copy(), childs.float_genes.copy()
+
+        childs = Mutation('single-gene', 0.0, search_space).force_mutate_population(childs, [2, 5])
+        changed_genes = (childs.int_genes != int_genes).sum(axis=1) + (childs.float_genes != float_genes).sum(axis=1)
+
+        self.assertEqual(np.flatnonzero(changed_genes).tolist(), [2, 5])
+
+    def test_force_mutate_ignores_probability(self):
+        mutation = Mutation('single-gene', 0.0, SearchSpace({'x': Parameters.suggest_binary()}))
+
+        self.assertEqual(mutation.force_mutate(Individual([0])).genome, [1])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
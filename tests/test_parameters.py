@@ -58,5 +58,8 @@ class TestParameters(unittest.TestCase):
         with self.assertRaises(Exception):
             Parameters.suggest_categorical(['hello', 'hey', list()])
 
+    def test_suggest_binary_returns_well_structured_dict(self):
+        self.assertEqual(Parameters.suggest_binary(), {'type': 'binary'})
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+
+from genopt.pareto import get_minimization_scores, get_non_dominated_ranks, get_crowding_distances, get_pareto_order, get_pareto_front_indexes
+
+class TestPareto(unittest.TestCase):
+    def setUp(self):
+        self.scores = np.array([
+            [1.0, 4.0],
+            [2.0, 2.0],
+            [4.0, 1.0],
+            [3.0, 3.0],
+            [4.0, 4.0],
+            [2.0, 2.0]
+        ])
+
+    def test_unknown_direction_fails(self):
+        with self.assertRaises(Exception):
+            get_minimization_scores(self.scores, ['minimize', 'unknown'])
+
+    def test_direction_and_fitness_length_mismatch_fails(self):
+        with self.assertRaises(Exception):
+            get_minimization_scores(self.scores, ['minimize'])
+
+    def test_maximized_scores_are_negated(self):
+        scores = get_minimization_scores([(1, 2)], ['minimize', 'maximize'])
+
+        np.testing.assert_array_equal(scores, [[1, -2]])
+
+    def test_non_dominated_ranks(self):
+        ranks = get_non_dominated_ranks(self.scores)
+
+        np.testing.assert_array_equal(ranks, [0, 0, 0, 1, 2, 0])
+
+    def test_non_dominated_ranks_match_brute_force(self):
+        scores = np.random.RandomState(42).randint(0, 6, size=(400, 3)).astype(np.float64)
+        ranks = get_non_dominated_ranks(scores)
+
+        for i in range(len(scores)):
+            dominators = np.all(scores <= scores[i], axis=1) & np.any(scores < scores[i], axis=1)
+            if ranks[i] == 0:
+                self.assertFalse(dominators.any())
+            else:
+                self.assertEqual(ranks[dominators].max(), ranks[i] - 1)
+
+    def test_crowding_distances_of_boundary_scores_are_infinite(self):
+        scores = np.array([[0.0, 3.0], [1.0, 2.0], [2.0, 1.0], [3.0, 0.0]])
+
+        distances = get_crowding_distances(scores, np.zeros(4, dtype=np.int64))
+
+        np.testing.assert_array_equal(distances, [np.inf, 4 / 3, 4 / 3, np.inf])
+
+    def test_pareto_order_ranks_fronts_first(self):
+        order = get_pareto_order(self.scores, ['minimize', 'minimize'])
+
+        self.assertEqual(set(order[:4]), {0, 1, 2, 5})
+        self.assertEqual(list(order[4:]), [3, 4])
+
+    def test_pareto_front_indexes_with_maximize(self):
+        front_indexes = get_pareto_front_indexes(self.scores, ['maximize', 'maximize'])
+
+        np.testing.assert_array_equal(front_indexes, [4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+
+from genopt.population import Population
+from genopt.search_space import SearchSpace
+from genopt.parameters import Parameters
+
+class TestPopulation(unittest.TestCase):
+    def setUp(self):
+        self.params = {
+            'x': Parameters.suggest_int(0, 10),
+            'y': Parameters.suggest_categorical(['hello', 'goodbye']),
+            'z': Parameters.suggest_float(-10, 20)
+        }
+        self.search_space = SearchSpace(self.params)
+        self.population = Population(self.search_space, np.array([[1, 0], [2, 1], [3, 0]]), np.array([[0.5], [1.5], [2.5]]))
+        self.binary_search_space = SearchSpace({i: Parameters.suggest_binary() for i in range(20)})
+
+    def test_initialize(self):
+        population = Population.initialize(self.search_space, 20)
+
+        self.assertEqual(len(population), 20)
+        self.assertEqual(population.fitness, [None] * 20)
+
+    def test_initialize_with_array_fitness(self):
+        population = Population(self.search_space, np.array([[1, 0], [2, 1]]), np.array([[0.5], [1.5]]), np.array([10.0, 20.0]))
+
+        self.assertEqual(population.fitness.tolist(), [10.0, 20.0])
+
+    def test_get_rows_by_indexes(self):
+        self.population.fitness = [10, 20, 30]
+
+        population = self.population[np.array([2, 0])]
+
+        self.assertEqual(population.int_genes.tolist(), [[3, 0], [1, 0]])
+        self.assertEqual(population.fitness, [30, 10])
+
+    def test_get_rows_by_slice(self):
+        population = self.population[:2]
+
+        self.assertEqual(len(population), 2)
+
+    def test_extend(self):
+        self.population.extend(self.population[:1])
+
+        self.assertEqual(len(self.population), 4)
+        self.assertEqual(len(self.population.fitness), 4)
+
+    def test_genome_key_is_equal_for_equal_genomes(self):
+        self.population.extend(self.population[:1])
+
+        self.assertEqual(self.population.get_genome_key(0), self.population.get_genome_key(3))
+        self.assertNotEqual(self.population.get_genome_key(0), self.population.get_genome_key(1))
+
+    def test_get_name_genome_genes(self):
+        self.assertEqual(self.population.get_name_genome_genes(1), {'x': 2, 'y': 'goodbye', 'z': 1.5})
+
+    def test_to_individuals(self):
+        self.population.fitness = [10, 20, 30]
+
+        individuals = self.population.to_individuals()
+
+        self.assertEqual(individuals[2].genome, [3, 'hello', 2.5])
+        self.assertEqual(individuals[2].fitness, 30)
+
+    def test_binary_genes_are_packed(self):
+        population = Population.initialize(self.binary_search_space, 10)
+
+        self.assertEqual(population.int_genes.shape, (10, 0))
+        self.assertEqual(population.bit_genes.shape, (10, 3))
+        self.assertEqual(population.bit_genes.dtype, np.uint8)
+
+    def test_binary_genome_key_uses_packed_bytes(self):
+        population = Population.initialize(self.binary_search_space, 2)
+        population.bit_genes[1] = population.bit_genes[0]
+
+        self.assertEqual(population.get_genome_key(0), population.get_genome_key(1))
+        self.assertEqual(len(population.get_genome_key(0)), 3)
+
+    def test_binary_genes_follow_rows(self):
+        population = Population.initialize(self.binary_search_space, 3)
+        bit_genes = population.bit_genes.copy()
+
+        population.extend(population[np.array([2, 0])])
+
+        self.assertEqual(population.bit_genes.tolist(), bit_genes[[0, 1, 2, 2, 0]].tolist())
+
+    def test_get_name_genome_genes_unpacks_binary_genes(self):
+        population = Population(self.binary_search_space, np.empty((1, 0), dtype=np.int64), np.empty((1, 0)), bit_genes=self.binary_search_space.pack_bits([[1] + [0] * 19]))
+
+        genome_gene_names = population.get_name_genome_genes(0)
+
+        self.assertEqual(genome_gene_names[0], 1)
+        self.assertEqual(sum(genome_gene_names.values()), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import pandas as pd
 
 from genetist.results import Results
+from genetist.individual import Individual
 
 class TestResults(unittest.TestCase):
     def setUp(self):
@@ -38,6 +39,29 @@ class TestResults(unittest.TestCase):
 
         self.assertEqual(self.results.execution_time, execution_time_string)
     
+    def test_add_evaluation_error(self):
+        self.results.add_evaluation_error(2, {'x': 1, 'y': 'a'}, 'Worker-1', 'ValueError()', 'Traceback', 3)
+
+        df_errors = self.results.evaluation_errors_dataframe
+
+        self.assertEqual(list(df_errors.columns), ['generation', 'x', 'y', 'worker_id', 'error', 'traceback', 'attempts'])
+        self.assertEqual(df_errors.iloc[0].to_dict(), {'generation': 2, 'x': 1, 'y': 'a', 'worker_id': 'Worker-1', 'error': 'ValueError()', 'traceback': 'Traceback', 'attempts': 3})
+
+    def test_get_number_of_evaluations(self):
+        self.assertEqual(self.results.number_of_evaluations, 0)
+        self.assertEqual(self.results.evaluations_per_second, None)
+        self.assertEqual(self.results.cache_savings, 0)
+
+    def test_get_cache_hits(self):
+        self.assertEqual(self.results.cache_hits, 0)
+
+    def test_set_cache_misses(self):
+        cache_misses = 25
+
+        self.results.cache_misses = cache_misses
+
+        self.assertEqual(self.results.cache_misses, cache_misses)
+    
     def test_best_per_generation_dataframe(self):
         self.assertTrue(isinstance(self.results.best_per_generation_dataframe, pd.DataFrame))
     
@@ -63,6 +87,46 @@ class TestResults(unittest.TestCase):
 
         self.assertTrue(len(self.results.best_per_generation_dataframe), length_df_after_adding_a_result)
 
+    def test_add_many_generation_results(self):
+        for generation in range(1, 101):
+            self.results.add_generation_results(generation, generation * 10, {'x': generation, 'y': 'a'})
+
+        self.assertEqual(len(self.results.best_per_generation_dataframe), 100)
+        self.assertEqual(list(self.results.best_per_generation_dataframe.columns), ['generation', 'best_score', 'x', 'y'])
+        self.assertEqual(self.results.best_per_generation_dataframe['best_score'].iloc[-1], 1000)
+
+    def test_add_generation_results_after_accessing_dataframe(self):
+        self.results.add_generation_results(1, 10, {'x': 5})
+        length_df_before_adding_a_result = len(self.results.best_per_generation_dataframe)
+
+        self.results.add_generation_results(2, 5, {'x': 3})
+
+        self.assertEqual(length_df_before_adding_a_result, 1)
+        self.assertEqual(list(self.results.best_per_generation_dataframe['generation']), [1, 2])
+
+    def test_set_best_per_generation_dataframe_discards_pending_results(self):
+        self.results.add_generation_results(1, 10, {'x': 5})
+
+        self.results.best_per_generation_dataframe = pd.DataFrame()
+
+        self.assertEqual(len(self.results.best_per_generation_dataframe), 0)
+
+    def test_create_last_generation_individuals_dataframe_with_score_name(self):
+        individuals = [Individual([1, 'a'], 10), Individual([2, 'b'], 20)]
+
+        self.results.create_last_generation_individuals_dataframe(3, individuals, ['x', 'y'], 'loss')
+
+        self.assertEqual(list(self.results.last_generation_individuals_dataframe.columns), ['generation', 'loss', 'x', 'y'])
+        self.assertEqual(list(self.results.last_generation_individuals_dataframe['y']), ['a', 'b'])
+
+    def test_create_last_generation_individuals_dataframe_with_multiple_score_names(self):
+        individuals = [Individual([1, 'a'], (10, 1)), Individual([2, 'b'], (20, 2))]
+
+        self.results.create_last_generation_individuals_dataframe(3, individuals, ['x', 'y'], ['loss', 'time'])
+
+        self.assertEqual(list(self.results.last_generation_individuals_dataframe.columns), ['generation', 'x', 'y', 'loss', 'time'])
+        self.assertEqual(list(self.results.last_generation_individuals_dataframe['time']), [1, 2])
+
     def test_sort_best_per_generation_dataframe_not_supported_direction_fails(self):
         #TODO
         self.assertTrue(False, True)
@@ -0,0 +1,133 @@
+import unittest
+import numpy as np
+
+from genopt.search_space import SearchSpace, INT_GENE, FLOAT_GENE, CATEGORICAL_GENE, BINARY_GENE
+from genopt.parameters import Parameters
+
+class TestSearchSpace(unittest.TestCase):
+    def setUp(self):
+        self.flexible_params = {
+            'x': Parameters.suggest_int(0, 10),
+            'y': Parameters.suggest_categorical(['hello', 'goodbye', 'hi']),
+            'z': Parameters.suggest_float(-10, 20)
+        }
+        self.fixed_params = {
+            'x': [0, 1],
+            'y': [0, 1, 3, 10, -10],
+            'z': [-2.1, -2.9, 1.3]
+        }
+        self.binary_params = {
+            'a': Parameters.suggest_binary(),
+            'x': Parameters.suggest_int(0, 10),
+            'b': Parameters.suggest_binary(),
+            'c': Parameters.suggest_binary()
+        }
+        self.flexible_search_space = SearchSpace(self.flexible_params)
+        self.fixed_search_space = SearchSpace(self.fixed_params)
+        self.binary_search_space = SearchSpace(self.binary_params)
+
+    def test_flexible_gene_types(self):
+        self.assertEqual(list(self.flexible_search_space.types), [INT_GENE, CATEGORICAL_GENE, FLOAT_GENE])
+
+    def test_fixed_genes_are_categorical(self):
+        self.assertTrue(np.all(self.fixed_search_space.types == CATEGORICAL_GENE))
+
+    def test_categorical_bounds_are_codes(self):
+        self.assertEqual(self.flexible_search_space.lows[1], 0)
+        self.assertEqual(self.flexible_search_space.highs[1], 2)
+
+    def test_int_and_float_blocks(self):
+        self.assertEqual(list(self.flexible_search_space.int_indexes), [0, 1])
+        self.assertEqual(list(self.flexible_search_space.float_indexes), [2])
+
+    def test_sample_shapes(self):
+        int_genes, float_genes = self.flexible_search_space.sample(50)
+
+        self.assertEqual(int_genes.shape, (50, 2))
+        self.assertEqual(float_genes.shape, (50, 1))
+
+    def test_sample_is_within_bounds(self):
+        int_genes, float_genes = self.flexible_search_space.sample(1000)
+
+        self.assertTrue(np.all((int_genes[:, 0] >= 0) & (int_genes[:, 0] <= 10)))
+        self.assertTrue(np.all((int_genes[:, 1] >= 0) & (int_genes[:, 1] <= 2)))
+        self.assertTrue(np.all((float_genes[:, 0] >= -10) & (float_genes[:, 0] <= 20)))
+
+    def test_sample_fixed_search_without_float_genes(self):
+        int_genes, float_genes = self.fixed_search_space.sample(10)
+
+        self.assertEqual(int_genes.shape, (10, 3))
+        self.assertEqual(float_genes.shape, (10, 0))
+
+    def test_decode(self):
+        genome_gene_names = self.flexible_search_space.decode(np.array([4, 2]), np.array([1.5]))
+
+        self.assertEqual(genome_gene_names, {'x': 4, 'y': 'hi', 'z': 1.5})
+
+    def test_decode_columns(self):
+        genome_gene_columns = self.flexible_search_space.decode_columns(np.array([[4, 2], [1, 0]]), np.array([[1.5], [2.5]]))
+
+        self.assertEqual(genome_gene_columns['x'].tolist(), [4, 1])
+        self.assertEqual(genome_gene_columns['y'].tolist(), ['hi', 'hello'])
+        self.assertEqual(genome_gene_columns['z'].tolist(), [1.5, 2.5])
+
+    def test_encode(self):
+        int_genes, float_genes = self.flexible_search_space.encode([{'x': 4, 'y': 'hi', 'z': 1.5}, {'x': 1, 'y': 'hello', 'z': 2.5}])
+
+        self.assertEqual(int_genes.tolist(), [[4, 2], [1, 0]])
+        self.assertEqual(float_genes.tolist(), [[1.5], [2.5]])
+
+    def test_encode_unknown_choice_fails(self):
+        with self.assertRaises(Exception):
+            self.flexible_search_space.encode([{'x': 4, 'y': 'hey', 'z': 1.5}])
+
+    def test_unknown_type_fails(self):
+        with self.assertRaises(ValueError):
+            SearchSpace({'x': {'type': 'complex', 'low': 0, 'high': 1}})
+
+    def test_binary_genes_are_in_bit_block(self):
+        self.assertEqual(list(self.binary_search_space.types), [BINARY_GENE, INT_GENE, BINARY_GENE, BINARY_GENE])
+        self.assertEqual(list(self.binary_search_space.int_indexes), [1])
+        self.assertEqual(list(self.binary_search_space.bit_indexes), [0, 2, 3])
+        self.assertEqual(self.binary_search_space.number_of_bit_bytes, 1)
+
+    def test_sample_bits_clears_padding_bits(self):
+        bit_genes = self.binary_search_space.sample_bits(1000)
+
+        self.assertEqual(bit_genes.shape, (1000, 1))
+        self.assertEqual(bit_genes.dtype, np.uint8)
+        self.assertTrue(np.all(bit_genes & 0x1F == 0))
+        self.assertEqual(set(self.binary_search_space.unpack_bits(bit_genes)[:, 0]), {0, 1})
+
+    def test_decode_binary_genes(self):
+        bit_genes = self.binary_search_space.pack_bits([1, 0, 1])
+
+        genome_gene_names = self.binary_search_space.decode(np.array([7]), np.empty(0), bit_genes)
+
+        self.assertEqual(genome_gene_names, {'a': 1, 'x': 7, 'b': 0, 'c': 1})
+        self.assertEqual(list(genome_gene_names.keys()), ['a', 'x', 'b', 'c'])
+
+    def test_decode_columns_binary_genes(self):
+        bit_genes = self.binary_search_space.pack_bits([[1, 0, 1], [0, 1, 1]])
+
+        genome_gene_columns = self.binary_search_space.decode_columns(np.array([[7], [3]]), np.empty((2, 0)), bit_genes)
+
+        self.assertEqual(genome_gene_columns['a'].tolist(), [1, 0])
+        self.assertEqual(genome_gene_columns['b'].tolist(), [0, 1])
+        self.assertEqual(genome_gene_columns['x'].tolist(), [7, 3])
+
+    def test_encode_bits(self):
+        genome_gene_names = [{'a': 1, 'x': 7, 'b': 0, 'c': 1}, {'a': 0, 'x': 3, 'b': 1, 'c': 1}]
+
+        int_genes, _ = self.binary_search_space.encode(genome_gene_names)
+        bit_genes = self.binary_search_space.encode_bits(genome_gene_names)
+
+        self.assertEqual(int_genes.tolist(), [[7], [3]])
+        self.assertEqual(self.binary_search_space.unpack_bits(bit_genes).tolist(), [[1, 0, 1], [0, 1, 1]])
+
+    def test_encode_bits_non_binary_value_fails(self):
+        with self.assertRaises(Exception):
+            self.binary_search_space.encode_bits([{'a': 2, 'x': 7, 'b': 0, 'c': 1}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+
+from genopt.selection import Selection
+
+class TestSelection(unittest.TestCase):
+    def setUp(self):
+        self.selection = Selection('roulette', 5)
+        np.random.seed(42)
+
+    def test_get_instance_is_rebuilt_when_parameters_change(self):
+        Selection.getInstance('roulette', 5)
+
+        selection = Selection.getInstance('ranking', 3)
+
+        self.assertEqual(selection.selection_type, 'ranking')
+        self.assertEqual(selection.tournament_size, 3)
+        self.assertIs(Selection.getInstance('ranking', 3), selection)
+
+    def test_roulette_selection_shape(self):
+        parent_indexes = self.selection._roulette_selection(100, 50)
+
+        self.assertEqual(parent_indexes.shape, (50, 2))
+        self.assertTrue(((parent_indexes >= 0) & (parent_indexes < 100)).all())
+
+    def test_roulette_selection_prefers_best_ranked_individuals(self):
+        parent_indexes = self.selection._roulette_selection(10, 20000)
+        counts = np.bincount(parent_indexes.ravel(), minlength=10)
+
+        self.assertTrue(counts[0] > counts[9] * 5)
+
+    def test_tournament_selection_returns_two_best_of_each_tournament(self):
+        self.selection.selection_type = 'tournament'
+
+        parent_indexes = self.selection._tournament_selection(100, 50)
+
+        self.assertEqual(parent_indexes.shape, (50, 2))
+        self.assertTrue((parent_indexes[:, 0] <= parent_indexes[:, 1]).all())
+
+    def test_ranking_selection_pairs_best_individuals(self):
+        parent_indexes = self.selection._ranking_selection(100, 5)
+
+        np.testing.assert_array_equal(parent_indexes, [[0, 1], [2, 3]])
+
+    def test_selection_returns_individual_pairs(self):
+        individuals = ['a', 'b', 'c', 'd']
+
+        parents = self.selection.selection(individuals, 3)
+
+        self.assertEqual(len(parents), 3)
+        self.assertTrue(all(parent in individuals for pair in parents for parent in pair))
+
+    def test_not_supported_selection_fails(self):
+        self.selection.selection_type = 'unknown'
+
+        with self.assertRaises(Exception):
+            self.selection.get_parent_indexes(10, 5)
+
+if __name__ == '__main__':
+    unittest.main()
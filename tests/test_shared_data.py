@@ -0,0 +1,129 @@
+import os
+import gc
+import unittest
+import numpy as np
+import pandas as pd
+
+from genopt.executor import Executor
+from multiprocessing import shared_memory
+from genopt.shared_data import SharedData, attach_shared_data, detach_shared_data, get_shared_data
+
+def sum_shared_array(x):
+    return float(get_shared_data('array').sum()) + x
+
+def is_shared_array_writeable(x):
+    return get_shared_data('array').flags.writeable
+
+def sum_shared_dataframe(x):
+    return float(get_shared_data('dataframe')['a'].sum()) + x
+
+class TestSharedData(unittest.TestCase):
+    def setUp(self):
+        self.array = np.arange(1000, dtype=np.float64)
+        self.dataframe = pd.DataFrame({'a': np.arange(10), 'b': np.linspace(0, 1, 10)}, index=np.arange(10, 20))
+
+    def tearDown(self):
+        detach_shared_data()
+
+    def test_unknown_storage_fails(self):
+        shared_data = SharedData()
+
+        with self.assertRaises(Exception):
+            shared_data.add('array', self.array, 'unknown')
+
+    def test_duplicated_name_fails(self):
+        shared_data = SharedData()
+        shared_data.add('array', self.array)
+
+        with self.assertRaises(Exception):
+            shared_data.add('array', self.array)
+        shared_data.close()
+
+    def test_object_dtype_fails(self):
+        shared_data = SharedData()
+
+        with self.assertRaises(Exception):
+            shared_data.add('array', np.array(['a', None], dtype=object))
+
+    def test_get_missing_shared_data_fails(self):
+        with self.assertRaises(Exception):
+            get_shared_data('missing')
+
+    def test_attach_array(self):
+        for storage in ['shared_memory', 'memmap']:
+            shared_data = SharedData()
+            shared_data.add('array', self.array, storage)
+            attach_shared_data(shared_data.descriptors)
+
+            np.testing.assert_array_equal(get_shared_data('array'), self.array)
+            self.assertFalse(get_shared_data('array').flags.writeable)
+
+            detach_shared_data()
+            shared_data.close()
+
+    def test_attach_dataframe(self):
+        for storage in ['shared_memory', 'memmap']:
+            shared_data = SharedData()
+            shared_data.add('dataframe', self.dataframe, storage)
+            attach_shared_data(shared_data.descriptors)
+
+            pd.testing.assert_frame_equal(get_shared_data('dataframe'), self.dataframe)
+
+            detach_shared_data()
+            shared_data.close()
+
+    def test_executor_attaches_shared_data_in_every_backend(self):
+        shared_data = SharedData()
+        shared_data.add('array', self.array)
+        shared_data.add('dataframe', self.dataframe, 'memmap')
+
+        for backend in ['serial', 'thread', 'process']:
+            with Executor(backend, 2, shared_data=shared_data.descriptors) as executor:
+                self.assertEqual(executor.map(sum_shared_array, [0, 1]), [499500.0, 499501.0])
+                self.assertEqual(executor.map(sum_shared_dataframe, [0]), [45.0])
+                self.assertEqual(executor.map(is_shared_array_writeable, [0, 1]), [False, False])
+        shared_data.close()
+
+    def test_shutdown_detaches_shared_data(self):
+        shared_data = SharedData()
+        shared_data.add('array', self.array)
+
+        with Executor('serial', 1, shared_data=shared_data.descriptors):
+            pass
+
+        with self.assertRaises(Exception):
+            get_shared_data('array')
+        shared_data.close()
+
+    def test_data_shared_after_close_is_released(self):
+        shared_data = SharedData()
+        for _ in range(2):
+            shared_data.add('array', self.array)
+            shared_data.add('memmap_array', self.array, 'memmap')
+            block_name = shared_data.descriptors['array']['data'][1]
+            directory = os.path.dirname(shared_data.descriptors['memmap_array']['data'][1])
+
+            shared_data.close()
+
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=block_name)
+            self.assertFalse(os.path.exists(directory))
+
+    def test_data_shared_after_close_is_released_on_garbage_collection(self):
+        shared_data = SharedData()
+        shared_data.add('array', self.array)
+        shared_data.close()
+        shared_data.add('array', self.array)
+        shared_data.add('memmap_array', self.array, 'memmap')
+        block_name = shared_data.descriptors['array']['data'][1]
+        directory = os.path.dirname(shared_data.descriptors['memmap_array']['data'][1])
+
+        del shared_data
+        gc.collect()
+
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=block_name)
+        self.assertFalse(os.path.exists(directory))
+
+if __name__ == '__main__':
+    unittest.main()
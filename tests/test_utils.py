@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+
+from genopt.utils import calculate_weighted_sum_scores
+
+class TestUtils(unittest.TestCase):
+    def test_weighted_sum_scores(self):
+        scores = [(1, 10), (2, 30), (3, 20)]
+
+        overall_scores = calculate_weighted_sum_scores(scores, ['minimize', 'maximize'], [0.5, 0.5])
+
+        np.testing.assert_allclose(overall_scores, [0.5, 0.75, 0.25])
+
+    def test_weighted_sum_scores_with_degenerate_column(self):
+        scores = [(1, 5), (2, 5), (3, 5)]
+
+        overall_scores = calculate_weighted_sum_scores(scores, ['maximize', 'minimize'], [0.5, 0.5])
+
+        self.assertFalse(np.isnan(overall_scores).any())
+        np.testing.assert_allclose(overall_scores, [0.0, 0.25, 0.5])
+
+    def test_weighted_sum_scores_with_unknown_direction_fails(self):
+        with self.assertRaises(Exception):
+            calculate_weighted_sum_scores([(1, 2)], ['minimize', 'unknown'], [0.5, 0.5])
+
+    def test_weighted_sum_scores_with_wrong_number_of_fitness_values_fails(self):
+        with self.assertRaises(Exception):
+            calculate_weighted_sum_scores([(1, 2, 3)], ['minimize', 'maximize'], [0.5, 0.5])
+
+if __name__ == '__main__':
+    unittest.main()